@@ -18,7 +18,7 @@ class DaemonError(BaseModel):
     message: str
     details: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class DaemonResponse(BaseModel):
@@ -27,5 +27,6 @@ class DaemonResponse(BaseModel):
     result: Dict[str, Any] = Field(default_factory=dict)
     error: Optional[DaemonError] = None
 
-    model_config = ConfigDict(extra="forbid")
+    # Envelopes are built once per request and never mutated afterwards.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
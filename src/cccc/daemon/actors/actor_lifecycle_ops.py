@@ -21,6 +21,7 @@ from ...runners import headless as headless_runner
 from ...runners import pty as pty_runner
 from ...util.conv import coerce_bool
 from .actor_runtime_ops import model_from_runtime_command, resolve_actor_launch_spec
+from .actor_post_commit import run_actor_runtime_stop
 from .actor_profile_runtime import ActorProfileAccessDeniedError, resolve_linked_actor_before_start
 
 _NEW_SESSION_RUNTIMES = frozenset({"claude", "codex", "grok"})
@@ -30,6 +31,11 @@ def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
 
 
+# Argument-free validation failures are immutable in practice (responses are only serialized),
+# so build them once instead of on every rejected request.
+_MISSING_GROUP_ID = _error("missing_group_id", "missing group_id")
+
+
 def _is_unsupported_internal_actor(actor: Any) -> bool:
     return isinstance(actor, dict) and is_internal_actor(actor) and not is_supported_internal_actor(actor)
 
@@ -76,7 +82,7 @@ def handle_actor_start(
     actor_id = str(args.get("actor_id") or "").strip()
     by = str(args.get("by") or "user").strip()
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -132,8 +138,8 @@ def handle_actor_start(
         start_result = start_actor_process(
             group,
             actor_id,
-            command=list(cmd or []),
-            env=dict(env or {}),
+            command=cmd,
+            env=env,
             runner=runner_kind,
             runtime=runtime,
             by=by,
@@ -167,7 +173,7 @@ def handle_actor_stop(
     actor_id = str(args.get("actor_id") or "").strip()
     by = str(args.get("by") or "user").strip()
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -182,39 +188,39 @@ def handle_actor_stop(
         runner_kind = str(actor.get("runner") or "pty").strip()
         runner_effective = effective_runner_kind(runner_kind)
         runtime = str(actor.get("runtime") or "codex").strip() or "codex"
-        if runtime == "web_model" and runner_effective == "headless":
-            remove_headless_state(group.group_id, actor_id)
-            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-        elif runtime == "codex" and runner_effective == "headless":
-            codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-            remove_headless_state(group.group_id, actor_id)
-            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-        elif runtime == "claude" and runner_effective == "headless":
-            claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-            remove_headless_state(group.group_id, actor_id)
-            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-        elif runner_effective == "headless":
-            headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-            remove_headless_state(group.group_id, actor_id)
-            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-        else:
-            pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-            remove_headless_state(group.group_id, actor_id)
+
+        def _stop_runtime() -> None:
+            if runtime == "web_model" and runner_effective == "headless":
+                remove_headless_state(group.group_id, actor_id)
+                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+            elif runtime == "codex" and runner_effective == "headless":
+                codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                remove_headless_state(group.group_id, actor_id)
+                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+            elif runtime == "claude" and runner_effective == "headless":
+                claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                remove_headless_state(group.group_id, actor_id)
+                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+            elif runner_effective == "headless":
+                headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                remove_headless_state(group.group_id, actor_id)
+                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+            else:
+                pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                remove_headless_state(group.group_id, actor_id)
+
+        run_actor_runtime_stop(group.group_id, actor_id, _stop_runtime)
     except Exception as e:
         return _error("actor_stop_failed", str(e))
 
-    try:
-        any_enabled = any(
-            coerce_bool(item.get("enabled"), default=True)
-            for item in list_actors(group)
-            if isinstance(item, dict) and str(item.get("id") or "").strip()
-        )
-        if not any_enabled:
-            group.doc["running"] = False
+    any_enabled = any(coerce_bool(item.get("enabled"), default=True) for item in list_actors(group))
+    if not any_enabled:
+        group.doc["running"] = False
+        try:
             group.save()
-    except Exception:
-        pass
+        except OSError:
+            pass
 
     maybe_reset_automation_on_foreman_change(group, before_foreman_id=before_foreman)
     event = append_event(
@@ -259,7 +265,7 @@ def handle_actor_restart(
     actor_id = str(args.get("actor_id") or "").strip()
     by = str(args.get("by") or "user").strip()
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -304,14 +310,14 @@ def handle_actor_restart(
             launch_spec = resolve_actor_launch_spec(
                 group,
                 actor_id,
-                command=list(actor.get("command") or []) if isinstance(actor.get("command"), list) else [],
-                env=dict(actor.get("env") or {}) if isinstance(actor.get("env"), dict) else {},
+                command=actor.get("command") if isinstance(actor.get("command"), list) else [],
+                env=actor.get("env") if isinstance(actor.get("env"), dict) else {},
                 runner=str(actor.get("runner") or "pty"),
                 runtime=str(actor.get("runtime") or "codex"),
                 find_scope_url=find_scope_url,
                 effective_runner_kind=effective_runner_kind,
                 normalize_runtime_command=normalize_runtime_command,
-                supported_runtimes=list(supported_runtimes),
+                supported_runtimes=supported_runtimes,
                 caller_id=caller_id,
                 is_admin=is_admin,
                 merge_actor_env_with_private=merge_actor_env_with_private,
@@ -377,7 +383,7 @@ def handle_actor_restart(
         runner_kind = str(launch_spec["runner"])
         runner_effective = str(launch_spec["effective_runner"])
         runtime = str(launch_spec["runtime"])
-        effective_env = dict(launch_spec["merged_env"])
+        effective_env = launch_spec["merged_env"]
 
         def _launch_env() -> Dict[str, str]:
             return prepare_runtime_mcp_env(
@@ -404,7 +410,7 @@ def handle_actor_restart(
             if runtime == "web_model" and runner_effective == "headless":
                 try:
                     write_headless_state(group.group_id, actor_id)
-                except Exception:
+                except OSError:
                     pass
             elif actor_uses_codex_app_server_state(actor):
                 session = codex_app_supervisor.start_pty_app_actor(
@@ -418,7 +424,7 @@ def handle_actor_restart(
                 )
                 try:
                     write_pty_state(group.group_id, actor_id, pid=session.remote_tui_pid())
-                except Exception:
+                except OSError:
                     pass
             elif runtime == "codex" and runner_effective == "headless":
                 codex_app_supervisor.start_actor(
@@ -445,7 +451,7 @@ def handle_actor_restart(
                 )
                 try:
                     write_headless_state(group.group_id, actor_id)
-                except Exception:
+                except OSError:
                     pass
             else:
                 session = start_pty_actor_with_runtime_resume(
@@ -461,7 +467,7 @@ def handle_actor_restart(
                 )
                 try:
                     write_pty_state(group.group_id, actor_id, pid=session.pid)
-                except Exception:
+                except OSError:
                     pass
         except Exception as e:
             return _error("actor_restart_failed", str(e))
@@ -512,7 +518,7 @@ def handle_actor_new_session(
     actor_id = str(args.get("actor_id") or "").strip()
     by = str(args.get("by") or "user").strip()
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -588,8 +594,8 @@ def handle_actor_new_session(
         start_result = start_actor_process(
             group,
             actor_id,
-            command=list(cmd or []),
-            env=dict(env or {}),
+            command=cmd,
+            env=env,
             runner=runner_kind,
             runtime=runtime,
             by=by,
@@ -610,6 +616,9 @@ def handle_actor_new_session(
     return DaemonResponse(ok=True, result=result)
 
 
+_ACTOR_LIFECYCLE_OPS = frozenset({"actor_start", "actor_stop", "actor_restart", "actor_new_session"})
+
+
 def try_handle_actor_lifecycle_op(
     op: str,
     args: Dict[str, Any],
@@ -636,6 +645,8 @@ def try_handle_actor_lifecycle_op(
     update_actor_private_env: Callable[..., Dict[str, str]],
     supported_runtimes: Sequence[str],
 ) -> Optional[DaemonResponse]:
+    if op not in _ACTOR_LIFECYCLE_OPS:
+        return None
     if op == "actor_start":
         return handle_actor_start(
             args,
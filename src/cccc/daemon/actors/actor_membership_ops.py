@@ -18,6 +18,7 @@ from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
 from ..codex_app_sessions import SUPERVISOR as codex_app_supervisor
 from ..context.context_ops import _schedule_summary_snapshot_rebuild
 from ..runtime_session_ops import remove_runtime_session
+from .actor_post_commit import run_actor_runtime_stop
 from .web_model_browser_session import clear_web_model_chatgpt_browser_actor_runtime
 
 
@@ -25,6 +26,9 @@ def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
 
 
+_MISSING_GROUP_ID = _error("missing_group_id", "missing group_id")
+
+
 def handle_actor_remove(
     args: Dict[str, Any],
     *,
@@ -40,7 +44,7 @@ def handle_actor_remove(
     actor_id = str(args.get("actor_id") or "").strip()
     by = str(args.get("by") or "user").strip()
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -57,12 +61,16 @@ def handle_actor_remove(
                 clear_web_model_chatgpt_browser_actor_runtime(group_id=group.group_id, actor_id=actor_id)
             except Exception:
                 pass
-        codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-        claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-        pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-        remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-        headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-        remove_headless_state(group.group_id, actor_id)
+
+        def _stop_runtime() -> None:
+            codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+            claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+            pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+            remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+            headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+            remove_headless_state(group.group_id, actor_id)
+
+        run_actor_runtime_stop(group.group_id, actor_id, _stop_runtime)
         remove_runtime_session(group.group_id, actor_id)
         throttle_clear_actor(group.group_id, actor_id)
         delete_actor_private_env(group.group_id, actor_id)
@@ -77,17 +85,13 @@ def handle_actor_remove(
     except Exception:
         pass
 
-    try:
-        any_enabled = any(
-            coerce_bool(item.get("enabled"), default=True)
-            for item in list_actors(group)
-            if isinstance(item, dict) and str(item.get("id") or "").strip()
-        )
-        if not any_enabled:
-            group.doc["running"] = False
+    any_enabled = any(coerce_bool(item.get("enabled"), default=True) for item in list_actors(group))
+    if not any_enabled:
+        group.doc["running"] = False
+        try:
             group.save()
-    except Exception:
-        pass
+        except OSError:
+            pass
 
     event = append_event(
         group.ledger_path,
@@ -102,6 +106,9 @@ def handle_actor_remove(
     return DaemonResponse(ok=True, result={"actor_id": actor_id, "event": event})
 
 
+_ACTOR_MEMBERSHIP_OPS = frozenset({"actor_remove"})
+
+
 def try_handle_actor_membership_op(
     op: str,
     args: Dict[str, Any],
@@ -114,6 +121,8 @@ def try_handle_actor_membership_op(
     delete_actor_private_env: Callable[[str, str], None],
     delete_actor_avatar: Callable[[str], None],
 ) -> Optional[DaemonResponse]:
+    if op not in _ACTOR_MEMBERSHIP_OPS:
+        return None
     if op == "actor_remove":
         return handle_actor_remove(
             args,
@@ -31,6 +31,10 @@ def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
 
 
+_MISSING_GROUP_ID = _error("missing_group_id", "missing group_id")
+_MISSING_ACTOR_ID = _error("missing_actor_id", "missing actor_id")
+
+
 def handle_actor_list(
     args: Dict[str, Any],
     *,
@@ -40,7 +44,7 @@ def handle_actor_list(
     include_unread = coerce_bool(args.get("include_unread"), default=False)
     include_internal = coerce_bool(args.get("include_internal"), default=False)
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -190,9 +194,9 @@ def handle_actor_env_private_keys(
     if by and by != "user":
         return _error("permission_denied", "only user can access private env metadata")
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     if not actor_id:
-        return _error("missing_actor_id", "missing actor_id")
+        return _MISSING_ACTOR_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -205,7 +209,7 @@ def handle_actor_env_private_keys(
             "linked actor private env is profile-controlled (convert to custom first)",
         )
     private_env = load_actor_private_env(group_id, actor_id)
-    keys = sorted(private_env.keys())
+    keys = list(private_env)
     masked_values = {k: mask_private_env_value(v) for k, v in private_env.items()}
     return DaemonResponse(
         ok=True,
@@ -232,9 +236,9 @@ def handle_actor_env_private_update(
     if by and by != "user":
         return _error("permission_denied", "only user can update private env")
     if not group_id:
-        return _error("missing_group_id", "missing group_id")
+        return _MISSING_GROUP_ID
     if not actor_id:
-        return _error("missing_actor_id", "missing actor_id")
+        return _MISSING_ACTOR_ID
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
@@ -258,6 +262,8 @@ def handle_actor_env_private_update(
         if set_raw is not None:
             if not isinstance(set_raw, dict):
                 raise ValueError("set must be an object")
+            if len(set_raw) > private_env_max_keys:
+                return _error("too_many_keys", "too many env keys to set in one request")
             for key, value in set_raw.items():
                 set_key = validate_private_env_key(key)
                 set_value = coerce_private_env_value(value)
@@ -266,16 +272,13 @@ def handle_actor_env_private_update(
         if unset_raw is not None:
             if not isinstance(unset_raw, list):
                 raise ValueError("unset must be a list")
+            if len(unset_raw) > private_env_max_keys:
+                return _error("too_many_keys", "too many env keys to unset in one request")
             for item in unset_raw:
                 unset_keys.append(validate_private_env_key(item))
     except ValueError as e:
         return _error("invalid_request", str(e))
 
-    if len(set_vars) > private_env_max_keys:
-        return _error("too_many_keys", "too many env keys to set in one request")
-    if len(unset_keys) > private_env_max_keys:
-        return _error("too_many_keys", "too many env keys to unset in one request")
-
     try:
         updated = update_actor_private_env(
             group_id,
@@ -294,10 +297,13 @@ def handle_actor_env_private_update(
             pass
         return _error("too_many_keys", "too many private env keys configured")
 
-    keys = sorted(updated.keys())
+    keys = list(updated)
     return DaemonResponse(ok=True, result={"group_id": group_id, "actor_id": actor_id, "keys": keys})
 
 
+_ACTOR_AUX_OPS = frozenset({"actor_list", "actor_env_private_keys", "actor_env_private_update"})
+
+
 def try_handle_actor_aux_op(
     op: str,
     args: Dict[str, Any],
@@ -309,6 +315,8 @@ def try_handle_actor_aux_op(
     update_actor_private_env: Optional[Callable[..., Dict[str, str]]] = None,
     private_env_max_keys: Optional[int] = None,
 ) -> Optional[DaemonResponse]:
+    if op not in _ACTOR_AUX_OPS:
+        return None
     if op == "actor_list":
         return handle_actor_list(args, effective_runner_kind=effective_runner_kind)
 
@@ -0,0 +1,74 @@
+"""Post-commit side-effect runner for actor lifecycle operations."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Callable, TypeVar
+
+from ..messaging.post_commit_lanes import KeyedPostCommitLanes
+
+logger = logging.getLogger("cccc.actor.post_commit")
+
+_ACTOR_POST_COMMIT_LANES = KeyedPostCommitLanes(thread_name_prefix="cccc-actor-post-commit", logger=logger)
+
+_T = TypeVar("_T")
+
+
+def _inline_mode() -> bool:
+    return str(os.environ.get("CCCC_ACTOR_POST_COMMIT_MODE") or "").strip().lower() == "inline"
+
+
+def _actor_runtime_lane_key(group_id: str, actor_id: str) -> str:
+    gid = str(group_id or "global").strip() or "global"
+    return f"{gid}/actor/{str(actor_id or '').strip()}"
+
+
+def run_actor_post_commit(group_id: str, label: str, fn: Callable[[], None]) -> bool:
+    """Run ``fn`` after the actor op has responded, serialized per group.
+
+    Returns True when ``fn`` was queued, False when it already ran inline.
+    """
+    name = str(label or "actor-post-commit").strip() or "actor-post-commit"
+
+    if _inline_mode():
+        try:
+            fn()
+        except Exception:
+            logger.exception("actor post-commit task failed label=%s group=%s", name, group_id)
+        return False
+
+    _ACTOR_POST_COMMIT_LANES.submit(str(group_id or "global").strip() or "global", name, fn)
+    return True
+
+
+def run_actor_runtime_start(group_id: str, actor_id: str, fn: Callable[[], None]) -> bool:
+    """Start an actor runtime after the response, on that actor's runtime lane.
+
+    Returns True when ``fn`` was queued. In inline mode ``fn`` runs now and its
+    errors propagate so the caller can report them.
+    """
+    if _inline_mode():
+        fn()
+        return False
+    _ACTOR_POST_COMMIT_LANES.submit(_actor_runtime_lane_key(group_id, actor_id), "actor-runtime-start", fn)
+    return True
+
+
+def run_actor_runtime_stop(group_id: str, actor_id: str, fn: Callable[[], _T]) -> _T:
+    """Run a runtime stop on the caller's thread, after any start queued for the actor.
+
+    This keeps a queued start's "still enabled?" check and the start itself from
+    interleaving with a stop. Errors propagate.
+    """
+    if _inline_mode():
+        return fn()
+    return _ACTOR_POST_COMMIT_LANES.run_exclusive(_actor_runtime_lane_key(group_id, actor_id), "actor-runtime-stop", fn)
+
+
+def wait_for_actor_post_commit_lanes_for_tests(timeout: float = 2.0) -> bool:
+    return _ACTOR_POST_COMMIT_LANES.wait_for_idle_for_tests(timeout=timeout)
+
+
+def reset_actor_post_commit_lanes_for_tests() -> None:
+    _ACTOR_POST_COMMIT_LANES.reset_for_tests()
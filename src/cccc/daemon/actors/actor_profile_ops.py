@@ -2,32 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ...contracts.v1 import ActorProfileRef
 from ...contracts.v1 import DaemonError, DaemonResponse
 from ...kernel.actors import find_actor
 from ...kernel.group import load_group
 from ...kernel.registry import load_registry
-from ...util.conv import coerce_bool
+from ...paths import ensure_home
+from ...util.conv import arg_str, coerce_bool
 from .actor_profile_runtime import actor_profile_ref, apply_profile_link_to_actor, clear_actor_link_metadata
 from .actor_profile_store import (
     ProfileResolver,
     ProfileRevisionMismatchError,
+    ProfileSecretsLimitError,
     delete_actor_profile_secrets,
     get_actor_profile,
     load_actor_profile_secrets,
+    load_actor_profile_secrets_masked,
     normalize_actor_profile_ref,
     update_actor_profile_secrets,
     validate_actor_profile_id,
 )
 from .private_env_ops import (
     PRIVATE_ENV_MAX_KEYS,
-    coerce_private_env_value,
     load_actor_private_env,
-    mask_private_env_value,
+    parse_private_env_set,
+    parse_private_env_unset,
     update_actor_private_env,
-    validate_private_env_key,
 )
 
 
@@ -42,7 +47,7 @@ def _is_user_writer(by: str) -> bool:
 
 def _caller_context(args: Dict[str, Any]) -> tuple[str, bool, bool]:
     explicit = "caller_id" in args or "is_admin" in args
-    caller_id = str(args.get("caller_id") or "").strip()
+    caller_id = arg_str(args, "caller_id")
     is_admin = coerce_bool(args.get("is_admin"), default=not explicit)
     return caller_id, is_admin, explicit
 
@@ -106,29 +111,57 @@ def _resolve_secret_profile_access(
     return ref
 
 
-def _profile_usage_map() -> Dict[str, List[Dict[str, str]]]:
-    usage: Dict[str, List[Dict[str, str]]] = {}
+_USAGE_CACHE_LOCK = threading.Lock()
+_USAGE_CACHE_KEY: Optional[Tuple[Any, ...]] = None
+_USAGE_CACHE_MAP: Optional[Dict[str, List[Dict[str, str]]]] = None
+# group_id -> (group.yaml stat key, [(usage_key, usage_entry), ...])
+_USAGE_GROUP_ENTRIES: Dict[str, Tuple[Tuple[int, int, int], List[Tuple[str, Dict[str, str]]]]] = {}
+# Stale group.yaml files are parsed on a small pool only when more than two
+# changed; for one or two the pool startup costs more than it saves.
+_USAGE_PARALLEL_MIN_GROUPS = 3
+_USAGE_MAX_WORKERS = 8
+
+
+def invalidate_profile_usage_cache() -> None:
+    global _USAGE_CACHE_KEY, _USAGE_CACHE_MAP
+    with _USAGE_CACHE_LOCK:
+        _USAGE_CACHE_KEY = None
+        _USAGE_CACHE_MAP = None
+        _USAGE_GROUP_ENTRIES.clear()
+
+
+def _group_stat_key(groups_root: Path, group_id: str) -> Optional[Tuple[int, int, int]]:
+    # group.yaml is rewritten atomically on every save, so (ino, mtime, size)
+    # changes whenever an actor link could have changed.
     try:
-        reg = load_registry()
+        st = (groups_root / group_id / "group.yaml").stat()
+    except FileNotFoundError:
+        return (0, 0, 0)
     except Exception:
-        return usage
-    groups = reg.groups if isinstance(reg.groups, dict) else {}
-    for gid in sorted(groups.keys()):
-        group = load_group(str(gid))
-        if group is None:
+        return None
+    return (int(st.st_ino), int(st.st_mtime_ns), int(st.st_size))
+
+
+def _group_usage_entries(group_id: str) -> List[Tuple[str, Dict[str, str]]]:
+    group = load_group(group_id)
+    if group is None:
+        return []
+    entries: List[Tuple[str, Dict[str, str]]] = []
+    group_title = str(group.doc.get("title") or "").strip()
+    actors = group.doc.get("actors") if isinstance(group.doc.get("actors"), list) else []
+    for actor in actors:
+        if not isinstance(actor, dict):
+            continue
+        ref = actor_profile_ref(actor)
+        if ref is None:
+            continue
+        aid = str(actor.get("id") or "").strip()
+        if not aid:
             continue
-        group_title = str(group.doc.get("title") or "").strip()
-        actors = group.doc.get("actors") if isinstance(group.doc.get("actors"), list) else []
-        for actor in actors:
-            if not isinstance(actor, dict):
-                continue
-            aid = str(actor.get("id") or "").strip()
-            actor_title = str(actor.get("title") or "").strip()
-            ref = actor_profile_ref(actor)
-            if not aid or ref is None:
-                continue
-            usage_key = f"{ref.profile_scope}:{ref.profile_owner}:{ref.profile_id}"
-            usage.setdefault(usage_key, []).append(
+        actor_title = str(actor.get("title") or "").strip()
+        entries.append(
+            (
+                f"{ref.profile_scope}:{ref.profile_owner}:{ref.profile_id}",
                 {
                     "group_id": group.group_id,
                     "group_title": group_title,
@@ -136,8 +169,55 @@ def _profile_usage_map() -> Dict[str, List[Dict[str, str]]]:
                     "actor_title": actor_title,
                     "profile_scope": ref.profile_scope,
                     "profile_owner": ref.profile_owner,
-                }
+                },
             )
+        )
+    return entries
+
+
+def _profile_usage_map() -> Dict[str, List[Dict[str, str]]]:
+    """Return profile usage keyed by scope:owner:profile_id (shared; do not mutate).
+
+    Per-group entries are kept between calls and only groups whose group.yaml
+    changed are re-read.
+    """
+    global _USAGE_CACHE_KEY, _USAGE_CACHE_MAP
+    usage: Dict[str, List[Dict[str, str]]] = {}
+    try:
+        reg = load_registry()
+    except Exception:
+        return usage
+    groups = reg.groups if isinstance(reg.groups, dict) else {}
+    groups_root = ensure_home() / "groups"
+    stats = [(str(gid), _group_stat_key(groups_root, str(gid))) for gid in sorted(groups.keys())]
+    cache_key = (str(groups_root), tuple(stats))
+    with _USAGE_CACHE_LOCK:
+        if _USAGE_CACHE_KEY == cache_key and _USAGE_CACHE_MAP is not None:
+            return _USAGE_CACHE_MAP
+        same_root = _USAGE_CACHE_KEY is not None and _USAGE_CACHE_KEY[0] == cache_key[0]
+        known = dict(_USAGE_GROUP_ENTRIES) if same_root else {}
+    stale = [
+        gid
+        for gid, stat_key in stats
+        if stat_key is None or gid not in known or known[gid][0] != stat_key
+    ]
+    if len(stale) >= _USAGE_PARALLEL_MIN_GROUPS:
+        with ThreadPoolExecutor(max_workers=min(_USAGE_MAX_WORKERS, len(stale))) as pool:
+            loaded = dict(zip(stale, pool.map(_group_usage_entries, stale)))
+    else:
+        loaded = {gid: _group_usage_entries(gid) for gid in stale}
+    fresh: Dict[str, Tuple[Tuple[int, int, int], List[Tuple[str, Dict[str, str]]]]] = {}
+    for gid, stat_key in stats:
+        entries = loaded[gid] if gid in loaded else known[gid][1]
+        if stat_key is not None:
+            fresh[gid] = (stat_key, entries)
+        for usage_key, entry in entries:
+            usage.setdefault(usage_key, []).append(entry)
+    with _USAGE_CACHE_LOCK:
+        _USAGE_CACHE_KEY = cache_key
+        _USAGE_CACHE_MAP = usage
+        _USAGE_GROUP_ENTRIES.clear()
+        _USAGE_GROUP_ENTRIES.update(fresh)
     return usage
 
 
@@ -146,33 +226,37 @@ def _profile_usage_key(ref: ActorProfileRef | Dict[str, Any] | str) -> str:
     return f"{normalized.profile_scope}:{normalized.profile_owner}:{normalized.profile_id}"
 
 
+def _profile_usage_for(ref: ActorProfileRef | Dict[str, Any] | str) -> List[Dict[str, str]]:
+    return list(_profile_usage_map().get(_profile_usage_key(ref), []))
+
+
 def handle_actor_profile_list(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if by != "user" and not by:
         return _error("permission_denied", "invalid caller")
     try:
         caller_id, is_admin, explicit = _caller_context(args)
-        view = str(args.get("view") or "global").strip().lower() or "global"
+        view = arg_str(args, "view", "global").lower() or "global"
         if explicit and view == "all" and not is_admin:
             return _error("permission_denied", "admin access required for view=all")
         resolver = ProfileResolver()
         usage = _profile_usage_map()
         profiles = []
         for model in resolver.list_profiles(view, caller_id=caller_id, is_admin=is_admin):
+            # model_dump() returns a fresh dict, so usage_count can be attached in place.
             item = model.model_dump(exclude_none=True)
-            out = dict(item)
-            out["usage_count"] = len(usage.get(_profile_usage_key(item), []))
-            profiles.append(out)
+            item["usage_count"] = len(usage.get(_profile_usage_key(item), ()))
+            profiles.append(item)
         return DaemonResponse(ok=True, result={"profiles": profiles})
     except Exception as e:
         return _error("actor_profile_list_failed", str(e))
 
 
 def handle_actor_profile_get(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if by != "user" and not by:
         return _error("permission_denied", "invalid caller")
-    if not str(args.get("profile_id") or "").strip():
+    if not arg_str(args, "profile_id"):
         return _error("missing_profile_id", "missing profile_id")
     try:
         caller_id, is_admin, _ = _caller_context(args)
@@ -183,14 +267,14 @@ def handle_actor_profile_get(args: Dict[str, Any]) -> DaemonResponse:
         profile = resolver.resolve(ref, caller_id=caller_id, is_admin=is_admin)
         if profile is None:
             return _error("profile_not_found", f"profile not found: {ref.profile_id}")
-        usage = _profile_usage_map().get(_profile_usage_key(ref), [])
+        usage = _profile_usage_for(ref)
         return DaemonResponse(ok=True, result={"profile": profile.model_dump(exclude_none=True), "usage": usage})
     except Exception as e:
         return _error("actor_profile_get_failed", str(e))
 
 
 def handle_actor_profile_upsert(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if not _is_user_writer(by):
         return _error("permission_denied", "only user can modify actor profiles")
     profile = args.get("profile")
@@ -243,11 +327,11 @@ def handle_actor_profile_upsert(args: Dict[str, Any]) -> DaemonResponse:
 
 
 def handle_actor_profile_delete(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if not _is_user_writer(by):
         return _error("permission_denied", "only user can delete actor profiles")
     force_detach = coerce_bool(args.get("force_detach"), default=False)
-    if not str(args.get("profile_id") or "").strip():
+    if not arg_str(args, "profile_id"):
         return _error("missing_profile_id", "missing profile_id")
     try:
         caller_id, is_admin, _ = _caller_context(args)
@@ -261,7 +345,7 @@ def handle_actor_profile_delete(args: Dict[str, Any]) -> DaemonResponse:
                 return _error("permission_denied", "profile delete denied")
             if profile.owner_id != caller_id:
                 return _error("permission_denied", "profile delete denied")
-        usage = _profile_usage_map().get(_profile_usage_key(ref), [])
+        usage = _profile_usage_for(ref)
         if usage and not force_detach:
             return _error(
                 "profile_in_use",
@@ -270,31 +354,37 @@ def handle_actor_profile_delete(args: Dict[str, Any]) -> DaemonResponse:
             )
         detached: List[Dict[str, str]] = []
         if usage and force_detach:
+            actor_ids_by_group: Dict[str, List[str]] = {}
             for item in usage:
                 group_id = str(item.get("group_id") or "").strip()
                 actor_id = str(item.get("actor_id") or "").strip()
-                if not group_id or not actor_id:
-                    continue
+                if group_id and actor_id:
+                    actor_ids_by_group.setdefault(group_id, []).append(actor_id)
+            target_key = _profile_usage_key(ref)
+            profile_doc = profile.model_dump(exclude_none=True)
+            for group_id, actor_ids in actor_ids_by_group.items():
+                # One load per group; the link helpers mutate this doc in place.
                 group = load_group(group_id)
                 if group is None:
                     continue
-                actor = find_actor(group, actor_id)
-                if not isinstance(actor, dict):
-                    continue
-                actor_ref = actor_profile_ref(actor)
-                if actor_ref is None or _profile_usage_key(actor_ref) != _profile_usage_key(ref):
-                    continue
-                apply_profile_link_to_actor(
-                    group,
-                    actor_id,
-                    profile_id=ref.profile_id,
-                    profile_ref=ref,
-                    profile=profile.model_dump(exclude_none=True),
-                    load_actor_profile_secrets=load_actor_profile_secrets,
-                    update_actor_private_env=update_actor_private_env,
-                )
-                clear_actor_link_metadata(group, actor_id)
-                detached.append({"group_id": group_id, "actor_id": actor_id})
+                for actor_id in actor_ids:
+                    actor = find_actor(group, actor_id)
+                    if not isinstance(actor, dict):
+                        continue
+                    actor_ref = actor_profile_ref(actor)
+                    if actor_ref is None or _profile_usage_key(actor_ref) != target_key:
+                        continue
+                    apply_profile_link_to_actor(
+                        group,
+                        actor_id,
+                        profile_id=ref.profile_id,
+                        profile_ref=ref,
+                        profile=profile_doc,
+                        load_actor_profile_secrets=load_actor_profile_secrets,
+                        update_actor_private_env=update_actor_private_env,
+                    )
+                    clear_actor_link_metadata(group, actor_id)
+                    detached.append({"group_id": group_id, "actor_id": actor_id})
         deleted = resolver.delete_profile(ref, caller_id=caller_id, is_admin=is_admin)
         if not deleted:
             return _error("permission_denied", "profile delete denied")
@@ -305,6 +395,8 @@ def handle_actor_profile_delete(args: Dict[str, Any]) -> DaemonResponse:
                 "profile_owner": profile.owner_id,
             }
         )
+        if detached:
+            invalidate_profile_usage_cache()
         return DaemonResponse(
             ok=True,
             result={
@@ -319,16 +411,15 @@ def handle_actor_profile_delete(args: Dict[str, Any]) -> DaemonResponse:
 
 
 def handle_actor_profile_secret_keys(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if by != "user" and not by:
         return _error("permission_denied", "invalid caller")
     resolved = _resolve_secret_profile_access(args)
     if isinstance(resolved, DaemonResponse):
         return resolved
     try:
-        private_env = load_actor_profile_secrets(resolved)
-        keys = sorted(private_env.keys())
-        masked_values = {key: mask_private_env_value(value) for key, value in private_env.items()}
+        masked_values = load_actor_profile_secrets_masked(resolved)
+        keys = list(masked_values)
         return DaemonResponse(
             ok=True,
             result={
@@ -342,7 +433,7 @@ def handle_actor_profile_secret_keys(args: Dict[str, Any]) -> DaemonResponse:
 
 
 def handle_actor_profile_secret_update(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if not _is_user_writer(by):
         return _error("permission_denied", "only user can update profile secrets")
     resolved = _resolve_secret_profile_access(args)
@@ -360,49 +451,44 @@ def handle_actor_profile_secret_update(args: Dict[str, Any]) -> DaemonResponse:
         if set_raw is not None:
             if not isinstance(set_raw, dict):
                 raise ValueError("set must be an object")
-            for key, value in set_raw.items():
-                k = validate_private_env_key(key)
-                v = coerce_private_env_value(value)
-                set_vars[k] = v
+            if len(set_raw) > PRIVATE_ENV_MAX_KEYS:
+                return _error("too_many_keys", "too many env keys to set in one request")
+            set_vars = parse_private_env_set(set_raw)
         if unset_raw is not None:
             if not isinstance(unset_raw, list):
                 raise ValueError("unset must be a list")
-            for item in unset_raw:
-                unset_keys.append(validate_private_env_key(item))
+            if len(unset_raw) > PRIVATE_ENV_MAX_KEYS:
+                return _error("too_many_keys", "too many env keys to unset in one request")
+            unset_keys = parse_private_env_unset(unset_raw)
     except ValueError as e:
         return _error("invalid_request", str(e))
     except Exception as e:
         return _error("actor_profile_secret_update_failed", str(e))
 
-    if len(set_vars) > PRIVATE_ENV_MAX_KEYS:
-        return _error("too_many_keys", "too many env keys to set in one request")
-    if len(unset_keys) > PRIVATE_ENV_MAX_KEYS:
-        return _error("too_many_keys", "too many env keys to unset in one request")
-
     try:
         updated = update_actor_profile_secrets(
             resolved,
             set_vars=set_vars,
             unset_keys=unset_keys,
             clear=clear,
+            max_keys=PRIVATE_ENV_MAX_KEYS,
         )
-        if len(updated) > PRIVATE_ENV_MAX_KEYS:
-            update_actor_profile_secrets(resolved, set_vars={}, unset_keys=list(updated.keys()), clear=True)
-            return _error("too_many_keys", "too many profile secret keys configured")
-        keys = sorted(updated.keys())
+        keys = list(updated)
         return DaemonResponse(ok=True, result={"profile_id": resolved.profile_id, "keys": keys})
+    except ProfileSecretsLimitError as e:
+        return _error("too_many_keys", str(e))
     except Exception as e:
         return _error("actor_profile_secret_update_failed", str(e))
 
 
 def handle_actor_profile_secret_copy_from_actor(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if not _is_user_writer(by):
         return _error("permission_denied", "only user can copy profile secrets from actor")
 
-    group_id = str(args.get("group_id") or "").strip()
-    actor_id = str(args.get("actor_id") or "").strip()
-    profile_id = str(args.get("profile_id") or "").strip()
+    group_id = arg_str(args, "group_id")
+    actor_id = arg_str(args, "actor_id")
+    profile_id = arg_str(args, "profile_id")
     if not group_id:
         return _error("missing_group_id", "missing group_id")
     if not actor_id:
@@ -446,7 +532,7 @@ def handle_actor_profile_secret_copy_from_actor(args: Dict[str, Any]) -> DaemonR
             unset_keys=[],
             clear=True,
         )
-        keys = sorted(updated.keys())
+        keys = list(updated)
         return DaemonResponse(
             ok=True,
             result={"profile_id": resolved.profile_id, "group_id": group_id, "actor_id": actor_id, "keys": keys},
@@ -456,7 +542,7 @@ def handle_actor_profile_secret_copy_from_actor(args: Dict[str, Any]) -> DaemonR
 
 
 def handle_actor_profile_secret_copy_from_profile(args: Dict[str, Any]) -> DaemonResponse:
-    by = str(args.get("by") or "user").strip()
+    by = arg_str(args, "by", "user")
     if not _is_user_writer(by):
         return _error("permission_denied", "only user can copy profile secrets from another profile")
 
@@ -484,7 +570,7 @@ def handle_actor_profile_secret_copy_from_profile(args: Dict[str, Any]) -> Daemo
             unset_keys=[],
             clear=True,
         )
-        keys = sorted(updated.keys())
+        keys = list(updated)
         return DaemonResponse(
             ok=True,
             result={
@@ -497,21 +583,18 @@ def handle_actor_profile_secret_copy_from_profile(args: Dict[str, Any]) -> Daemo
         return _error("actor_profile_secret_copy_from_profile_failed", str(e))
 
 
+_ACTOR_PROFILE_HANDLERS: Dict[str, Callable[[Dict[str, Any]], DaemonResponse]] = {
+    "actor_profile_list": handle_actor_profile_list,
+    "actor_profile_get": handle_actor_profile_get,
+    "actor_profile_upsert": handle_actor_profile_upsert,
+    "actor_profile_delete": handle_actor_profile_delete,
+    "actor_profile_secret_keys": handle_actor_profile_secret_keys,
+    "actor_profile_secret_update": handle_actor_profile_secret_update,
+    "actor_profile_secret_copy_from_actor": handle_actor_profile_secret_copy_from_actor,
+    "actor_profile_secret_copy_from_profile": handle_actor_profile_secret_copy_from_profile,
+}
+
+
 def try_handle_actor_profile_op(op: str, args: Dict[str, Any]) -> Optional[DaemonResponse]:
-    if op == "actor_profile_list":
-        return handle_actor_profile_list(args)
-    if op == "actor_profile_get":
-        return handle_actor_profile_get(args)
-    if op == "actor_profile_upsert":
-        return handle_actor_profile_upsert(args)
-    if op == "actor_profile_delete":
-        return handle_actor_profile_delete(args)
-    if op == "actor_profile_secret_keys":
-        return handle_actor_profile_secret_keys(args)
-    if op == "actor_profile_secret_update":
-        return handle_actor_profile_secret_update(args)
-    if op == "actor_profile_secret_copy_from_actor":
-        return handle_actor_profile_secret_copy_from_actor(args)
-    if op == "actor_profile_secret_copy_from_profile":
-        return handle_actor_profile_secret_copy_from_profile(args)
-    return None
+    handler = _ACTOR_PROFILE_HANDLERS.get(op)
+    return handler(args) if handler is not None else None
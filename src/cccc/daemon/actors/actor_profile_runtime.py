@@ -8,7 +8,7 @@ from ...contracts.v1 import ActorProfileRef
 from .actor_profile_store import ProfileResolver, normalize_actor_profile_ref
 from .web_model_actor_policy import require_standard_chatgpt_web_model_actor
 
-PROFILE_CONTROLLED_FIELDS = ("runtime", "runner", "command", "submit", "env")
+PROFILE_CONTROLLED_FIELDS = frozenset({"runtime", "runner", "command", "submit", "env"})
 _LOG = logging.getLogger("cccc.daemon.actor_profile_runtime")
 
 
@@ -6,23 +6,40 @@ import os
 import re
 import secrets
 import shlex
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, get_args
+from typing import Any, Dict, List, Literal, Optional, Tuple, get_args
 
 from ...contracts.v1 import ActorProfile, ActorProfileRef, AgentRuntime
 from ...kernel.runtime import get_runtime_command_with_flags
 from ...paths import ensure_home
 from ...util.fs import atomic_write_json, read_json
 from ...util.time import utc_now_iso
+from .private_env_ops import mask_private_env_value, sorted_env
 
 _PROFILE_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
 _SUPPORTED_PROFILE_RUNTIMES = {str(item) for item in get_args(AgentRuntime)}
 
+# Ref lookups against profiles.json (None = known absent), valid while the file stat is unchanged.
+_PROFILE_LOOKUPS_LOCK = threading.Lock()
+_PROFILE_LOOKUPS_KEY: Optional[Tuple[str, int, int, int]] = None
+_PROFILE_LOOKUPS: Dict[Tuple[str, str, str], Optional[ActorProfile]] = {}
+_PROFILE_LOOKUPS_MAX = 1024
+
+# Secret file path -> (file stat, masked previews); holds no raw secret values.
+_MASKED_SECRETS_LOCK = threading.Lock()
+_MASKED_SECRETS: Dict[str, Tuple[Tuple[str, int, int, int], Dict[str, str]]] = {}
+_MASKED_SECRETS_MAX = 256
+
 
 class ProfileRevisionMismatchError(RuntimeError):
     pass
 
 
+class ProfileSecretsLimitError(ValueError):
+    pass
+
+
 def _profiles_root(home: Path) -> Path:
     return home / "state" / "actor_profiles"
 
@@ -146,10 +163,28 @@ def _load_profiles_doc() -> tuple[Path, Dict[str, Any]]:
     return path, doc
 
 
+def _file_stat_key(path: Path) -> Optional[Tuple[str, int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (str(path), 0, 0, 0)
+    except Exception:
+        return None
+    return (str(path), int(st.st_ino), int(st.st_mtime_ns), int(st.st_size))
+
+
+def _invalidate_profile_lookups() -> None:
+    global _PROFILE_LOOKUPS_KEY
+    with _PROFILE_LOOKUPS_LOCK:
+        _PROFILE_LOOKUPS_KEY = None
+        _PROFILE_LOOKUPS.clear()
+
+
 def _save_profiles_doc(path: Path, doc: Dict[str, Any]) -> None:
     _ensure_dir(path.parent, 0o700)
     doc["updated_at"] = utc_now_iso()
     atomic_write_json(path, doc, indent=2)
+    _invalidate_profile_lookups()
     try:
         os.chmod(path, 0o600)
     except Exception:
@@ -387,20 +422,39 @@ def _delete_profile(ref: ActorProfileRef) -> bool:
     return True
 
 
+def _lookup_profile(ref: ActorProfileRef) -> Optional[ActorProfile]:
+    """Find a stored profile, skipping the JSON load for refs already looked up at this file stat."""
+    global _PROFILE_LOOKUPS_KEY
+    lookup_key = (ref.profile_scope, ref.profile_owner, ref.profile_id)
+    stat_key = _file_stat_key(_profiles_path(ensure_home()))
+    if stat_key is not None:
+        with _PROFILE_LOOKUPS_LOCK:
+            if _PROFILE_LOOKUPS_KEY == stat_key and lookup_key in _PROFILE_LOOKUPS:
+                cached = _PROFILE_LOOKUPS[lookup_key]
+                return cached.model_copy(deep=True) if cached is not None else None
+    _, doc = _load_profiles_doc()
+    raw_profiles = doc.get("profiles") if isinstance(doc.get("profiles"), dict) else {}
+    _, model = _find_profile_entry(
+        raw_profiles,
+        ref.profile_id,
+        scope=ref.profile_scope,
+        owner_id=ref.profile_owner,
+    )
+    if stat_key is not None:
+        with _PROFILE_LOOKUPS_LOCK:
+            if _PROFILE_LOOKUPS_KEY != stat_key or len(_PROFILE_LOOKUPS) >= _PROFILE_LOOKUPS_MAX:
+                _PROFILE_LOOKUPS_KEY = stat_key
+                _PROFILE_LOOKUPS.clear()
+            _PROFILE_LOOKUPS[lookup_key] = model.model_copy(deep=True) if model is not None else None
+    return model
+
+
 class ProfileResolver:
     def resolve(self, ref: ActorProfileRef | Dict[str, Any] | str, caller_id: str, is_admin: bool) -> Optional[ActorProfile]:
         normalized = normalize_actor_profile_ref(ref)
         if normalized.profile_scope == "user" and not is_admin and normalized.profile_owner != str(caller_id or "").strip():
             return None
-        _, doc = _load_profiles_doc()
-        raw_profiles = doc.get("profiles") if isinstance(doc.get("profiles"), dict) else {}
-        _, model = _find_profile_entry(
-            raw_profiles,
-            normalized.profile_id,
-            scope=normalized.profile_scope,
-            owner_id=normalized.profile_owner,
-        )
-        return model
+        return _lookup_profile(normalized)
 
     def list_profiles(self, view: str, caller_id: str, is_admin: bool) -> List[ActorProfile]:
         normalized_view = str(view or "").strip().lower()
@@ -471,15 +525,7 @@ def get_actor_profile(profile_id: str) -> Optional[Dict[str, Any]]:
 
 
 def get_actor_profile_by_ref(ref: ActorProfileRef | Dict[str, Any] | str) -> Optional[Dict[str, Any]]:
-    normalized = normalize_actor_profile_ref(ref)
-    _, doc = _load_profiles_doc()
-    raw_profiles = doc.get("profiles") if isinstance(doc.get("profiles"), dict) else {}
-    _, model = _find_profile_entry(
-        raw_profiles,
-        normalized.profile_id,
-        scope=normalized.profile_scope,
-        owner_id=normalized.profile_owner,
-    )
+    model = _lookup_profile(normalize_actor_profile_ref(ref))
     return model.model_dump(exclude_none=True) if isinstance(model, ActorProfile) else None
 
 
@@ -532,6 +578,7 @@ def _profile_secret_path(ref: ActorProfileRef | Dict[str, Any] | str) -> Path:
 
 
 def load_actor_profile_secrets(ref: ActorProfileRef | Dict[str, Any] | str) -> Dict[str, str]:
+    """Load a profile's secrets; keys are returned in sorted order."""
     normalized = normalize_actor_profile_ref(ref)
     path = _profile_secret_path(normalized)
     raw = read_json(path)
@@ -547,7 +594,26 @@ def load_actor_profile_secrets(ref: ActorProfileRef | Dict[str, Any] | str) -> D
         if value is None:
             continue
         out[k] = str(value)
-    return out
+    return sorted_env(out)
+
+
+def load_actor_profile_secrets_masked(ref: ActorProfileRef | Dict[str, Any] | str) -> Dict[str, str]:
+    """Return masked previews of a profile's secrets, recomputed only when the file changes."""
+    normalized = normalize_actor_profile_ref(ref)
+    path = _profile_secret_path(normalized)
+    stat_key = _file_stat_key(path)
+    if stat_key is not None:
+        with _MASKED_SECRETS_LOCK:
+            cached = _MASKED_SECRETS.get(str(path))
+            if cached is not None and cached[0] == stat_key:
+                return dict(cached[1])
+    masked = {key: mask_private_env_value(value) for key, value in load_actor_profile_secrets(normalized).items()}
+    if stat_key is not None:
+        with _MASKED_SECRETS_LOCK:
+            if len(_MASKED_SECRETS) >= _MASKED_SECRETS_MAX:
+                _MASKED_SECRETS.clear()
+            _MASKED_SECRETS[str(path)] = (stat_key, masked)
+    return dict(masked)
 
 
 def update_actor_profile_secrets(
@@ -556,13 +622,22 @@ def update_actor_profile_secrets(
     set_vars: Dict[str, str],
     unset_keys: List[str],
     clear: bool,
+    max_keys: Optional[int] = None,
 ) -> Dict[str, str]:
+    """Apply a secret patch and persist it in key order.
+
+    The stored file is left untouched if the result would exceed max_keys.
+    """
     normalized = normalize_actor_profile_ref(ref)
     current = {} if clear else load_actor_profile_secrets(normalized)
     for key in unset_keys:
         current.pop(str(key), None)
     for key, value in set_vars.items():
         current[str(key)] = str(value)
+    if max_keys is not None and len(current) > max_keys:
+        raise ProfileSecretsLimitError("too many profile secret keys configured")
+    # Persist in key order so loads (and the secret key listing) need no per-call sort.
+    current = sorted_env(current)
 
     path = _profile_secret_path(normalized)
     root = path.parent
@@ -579,12 +654,14 @@ def update_actor_profile_secrets(
         os.chmod(path, 0o600)
     except Exception:
         pass
-    return dict(current)
+    return current
 
 
 def delete_actor_profile_secrets(ref: ActorProfileRef | Dict[str, Any] | str) -> None:
     normalized = normalize_actor_profile_ref(ref)
     path = _profile_secret_path(normalized)
+    with _MASKED_SECRETS_LOCK:
+        _MASKED_SECRETS.pop(str(path), None)
     try:
         path.unlink(missing_ok=True)
     except Exception:
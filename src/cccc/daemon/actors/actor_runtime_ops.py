@@ -5,7 +5,7 @@ from __future__ import annotations
 import inspect
 import os
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Sequence, TypedDict
 
 from ...kernel.actors import find_actor
 from ...kernel.context import ContextStorage
@@ -16,6 +16,7 @@ from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
 from ..codex_app_sessions import SUPERVISOR as codex_app_supervisor
 from ..mcp_install import prepare_runtime_mcp_env
 from ..runtime_session_ops import start_pty_actor_with_runtime_resume
+from .actor_post_commit import run_actor_post_commit
 from ...runners import headless as headless_runner
 from ...runners import pty as pty_runner
 from ...runners.platform_support import pty_support_error_message
@@ -79,7 +80,7 @@ def model_from_runtime_command(command: List[str]) -> str:
 
 
 def _coerce_string_env(raw: Any) -> Dict[str, str]:
-    if not isinstance(raw, dict):
+    if not isinstance(raw, Mapping):
         return {}
     out: Dict[str, str] = {}
     for key, value in raw.items():
@@ -88,7 +89,7 @@ def _coerce_string_env(raw: Any) -> Dict[str, str]:
     return out
 
 
-def _coerce_command(raw: Any, fallback: List[str]) -> List[str]:
+def _coerce_command(raw: Any, fallback: Sequence[str]) -> List[str]:
     source = raw if isinstance(raw, list) else fallback
     return [str(item) for item in source if isinstance(item, str) and str(item).strip()]
 
@@ -118,8 +119,8 @@ def resolve_actor_launch_config(
     group: Any,
     actor_id: str,
     *,
-    command: List[str],
-    env: Dict[str, str],
+    command: Sequence[str],
+    env: Mapping[str, str],
     runner: str,
     runtime: str,
     effective_runner_kind: Callable[[str], str],
@@ -140,7 +141,7 @@ def resolve_actor_launch_config(
             is_admin=bool(is_admin),
         )
 
-    resolved_command = _coerce_command(actor.get("command"), list(command or []))
+    resolved_command = _coerce_command(actor.get("command"), command or ())
     public_env = _coerce_string_env(actor.get("env")) if isinstance(actor.get("env"), dict) else _coerce_string_env(env)
     resolved_runner = str(actor.get("runner") or runner or "pty").strip() or "pty"
     resolved_runtime = str(actor.get("runtime") or runtime or "codex").strip() or "codex"
@@ -157,7 +158,7 @@ def resolve_actor_launch_config(
         else {}
     )
     if callable(merge_actor_env_with_private):
-        merged_env = dict(merge_actor_env_with_private(group.group_id, actor_id, public_env))
+        merged_env = merge_actor_env_with_private(group.group_id, actor_id, public_env)
     elif private_env:
         merged_env = dict(public_env)
         merged_env.update(private_env)
@@ -187,14 +188,14 @@ def resolve_actor_launch_spec(
     group: Any,
     actor_id: str,
     *,
-    command: List[str],
-    env: Dict[str, str],
+    command: Sequence[str],
+    env: Mapping[str, str],
     runner: str,
     runtime: str,
     find_scope_url: Callable[[Any, str], str],
     effective_runner_kind: Callable[[str], str],
     normalize_runtime_command: Callable[..., List[str]],
-    supported_runtimes: tuple[str, ...] | list[str],
+    supported_runtimes: Collection[str],
     caller_id: str = "",
     is_admin: bool = False,
     resolve_linked_actor_before_start: Optional[Callable[[Any, str], Dict[str, Any]]] = None,
@@ -224,9 +225,12 @@ def resolve_actor_launch_spec(
     url = find_scope_url(group, scope_key)
     if not url:
         raise ValueError(f"scope not attached: {scope_key}")
-    cwd = Path(url).expanduser().resolve()
-    if not cwd.exists():
-        raise ValueError(f"project root path does not exist: {cwd}")
+    root = Path(url).expanduser()
+    try:
+        # strict resolve stats the path while canonicalizing; no separate exists() call.
+        cwd = root.resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValueError(f"project root path does not exist: {root.resolve()}") from None
 
     if launch_config["runtime"] not in supported_runtimes:
         raise ValueError(f"unsupported runtime: {launch_config['runtime']}")
@@ -250,8 +254,8 @@ def start_actor_process(
     group: Any,
     actor_id: str,
     *,
-    command: List[str],
-    env: Dict[str, str],
+    command: Sequence[str],
+    env: Mapping[str, str],
     runner: str,
     runtime: str,
     by: str,
@@ -269,7 +273,7 @@ def start_actor_process(
     write_pty_state: Callable[[str, str, int], None],
     clear_preamble_sent: Callable[[Any, str], None],
     throttle_reset_actor: Callable[[str, str], None],
-    supported_runtimes: tuple[str, ...],
+    supported_runtimes: Collection[str],
     resolve_linked_actor_before_start: Optional[Callable[[Any, str], Dict[str, Any]]] = None,
     load_actor_private_env: Optional[Callable[[str, str], Dict[str, str]]] = None,
 ) -> Dict[str, Any]:
@@ -296,14 +300,20 @@ def start_actor_process(
 
     actor = launch_spec["actor"]
     effective_runner = launch_spec["effective_runner"]
-    effective_env = dict(launch_spec["merged_env"])
+    effective_env = launch_spec["merged_env"]
     effective_cmd = launch_spec["effective_command"]
     cwd = launch_spec["cwd"]
     runtime = launch_spec["runtime"]
     runner = launch_spec["runner"]
 
+    launch_env: Optional[Dict[str, str]] = None
+
     def _launch_env() -> Dict[str, str]:
-        return prepare_runtime_mcp_env(runtime, inject_actor_context_env(effective_env, group.group_id, actor_id))
+        # Built at most once: the PTY path needs it for MCP install and again for the session.
+        nonlocal launch_env
+        if launch_env is None:
+            launch_env = prepare_runtime_mcp_env(runtime, inject_actor_context_env(effective_env, group.group_id, actor_id))
+        return launch_env
 
     if effective_runner != "headless":
         if not bool(getattr(pty_runner, "PTY_SUPPORTED", False)):
@@ -434,7 +444,11 @@ def start_actor_process(
     )
 
     from ...kernel.events import publish_event
-    publish_event("actor.start", {"group_id": group.group_id, "actor_id": actor_id})
+
+    # The ledger event above is the durable record; the global UI invalidation
+    # event is best-effort and takes a cross-process lock, so it runs post-commit.
+    publish_data = {"group_id": group.group_id, "actor_id": actor_id}
+    run_actor_post_commit(group.group_id, "actor-start-publish", lambda: publish_event("actor.start", publish_data))
     return {
         "success": True,
         "actor": actor,
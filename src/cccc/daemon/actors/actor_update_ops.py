@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 from ...contracts.v1 import DaemonError, DaemonResponse
 from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
@@ -11,7 +13,7 @@ from ..codex_app_sessions import SUPERVISOR as codex_app_supervisor
 from ..mcp_install import prepare_runtime_mcp_env
 from ..runtime_session_ops import start_pty_actor_with_runtime_resume
 from ...kernel.actors import find_actor, is_internal_actor, is_supported_internal_actor, list_actors, update_actor
-from ...kernel.group import load_group
+from ...kernel.group import load_group, load_group_cached
 from ...kernel.ledger import append_event
 from ...kernel.permissions import require_actor_permission
 from ...kernel.runtime import runtime_start_preflight_error
@@ -21,6 +23,7 @@ from ...runners import pty as pty_runner
 from ...runners.platform_support import pty_support_error_message
 from ...util.conv import coerce_bool
 from .actor_runtime_ops import model_from_runtime_command, resolve_actor_launch_spec
+from .actor_post_commit import run_actor_runtime_start, run_actor_runtime_stop
 from .actor_profile_runtime import (
     PROFILE_CONTROLLED_FIELDS,
     actor_profile_id,
@@ -33,6 +36,23 @@ from .actor_profile_runtime import (
 from .actor_profile_store import ProfileResolver, get_actor_profile_by_ref, normalize_actor_profile_ref
 from .web_model_actor_policy import require_no_other_chatgpt_web_model_actor, require_standard_chatgpt_web_model_actor
 
+_ALLOWED_PATCH_KEYS = frozenset(
+    {
+        "role",
+        "title",
+        "avatar_asset_path",
+        "command",
+        "env",
+        "default_scope_key",
+        "submit",
+        "capability_autoload",
+        "capability_hidden",
+        "enabled",
+        "runner",
+        "runtime",
+        "runtime_state_source",
+    }
+)
 
 def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None) -> DaemonResponse:
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
@@ -64,75 +84,139 @@ def _normalize_capability_id_list(raw: Any) -> list[str]:
     return out[:128]
 
 
-def handle_actor_update(
-    args: Dict[str, Any],
-    *,
-    foreman_id: Callable[[Any], str],
-    maybe_reset_automation_on_foreman_change: Callable[..., None],
-    find_scope_url: Callable[[Any, str], str],
-    effective_runner_kind: Callable[[str], str],
-    ensure_mcp_installed: Callable[..., Any],
-    merge_actor_env_with_private: Callable[[str, str, Dict[str, Any]], Dict[str, Any]],
-    inject_actor_context_env: Callable[..., Dict[str, Any]],
-    normalize_runtime_command: Callable[[str, list[str]], list[str]],
-    prepare_pty_env: Callable[[Dict[str, Any]], Dict[str, Any]],
-    pty_backlog_bytes: Callable[[], int],
-    write_headless_state: Callable[[str, str], None],
-    write_pty_state: Callable[..., None],
-    clear_preamble_sent: Callable[[Any, str], None],
-    throttle_reset_actor: Callable[..., None],
-    remove_headless_state: Callable[[str, str], None],
-    remove_pty_state_if_pid: Callable[..., None],
-    supported_runtimes: Sequence[str],
-    get_actor_profile: Callable[[str], Optional[Dict[str, Any]]],
-    load_actor_profile_secrets: Callable[[Any], Dict[str, str]],
-    update_actor_private_env: Callable[..., Dict[str, str]],
-) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    actor_id = str(args.get("actor_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
-    patch = args.get("patch") if isinstance(args.get("patch"), dict) else {}
-    profile_id_arg = str(args.get("profile_id") or "").strip()
-    profile_scope_raw = str(args.get("profile_scope") or "").strip().lower()
-    profile_scope_arg = profile_scope_raw or "global"
-    profile_owner_arg = str(args.get("profile_owner") or "").strip()
-    profile_action = str(args.get("profile_action") or "").strip()
+@dataclass(frozen=True, slots=True)
+class _UpdateArgs:
+    group_id: str
+    actor_id: str
+    by: str
+    patch: Dict[str, Any]
+    profile_id: str
+    profile_scope: str
+    profile_owner: str
+    profile_action: str
+    caller_id: str
+    is_admin: bool
+
+
+def _parse_update_args(args: Dict[str, Any]) -> _UpdateArgs:
+    """Read each actor_update arg once; validation stays in the handler."""
+    patch = args.get("patch")
+    return _UpdateArgs(
+        group_id=str(args.get("group_id") or "").strip(),
+        actor_id=str(args.get("actor_id") or "").strip(),
+        by=str(args.get("by") or "user").strip(),
+        patch=patch if isinstance(patch, dict) else {},
+        profile_id=str(args.get("profile_id") or "").strip(),
+        profile_scope=str(args.get("profile_scope") or "").strip().lower() or "global",
+        profile_owner=str(args.get("profile_owner") or "").strip(),
+        profile_action=str(args.get("profile_action") or "").strip(),
+        caller_id=str(args.get("caller_id") or "").strip(),
+        is_admin=coerce_bool(args.get("is_admin"), default=False),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _supported_runtime_set(runtimes: Tuple[str, ...]) -> frozenset[str]:
+    # The daemon hands over the same ordered tuple on every call; keep it for error details.
+    return frozenset(runtimes)
+
+
+def _is_noop_patch(actor: Dict[str, Any], patch: Dict[str, Any], *, group_running: bool) -> bool:
+    """True when applying patch would change nothing and trigger no runtime side effects.
+
+    Re-enabling an enabled actor in a running group still (re)starts its runtime,
+    and disabling always runs stop cleanup, so neither counts as a no-op.
+    """
+    for key, value in patch.items():
+        if key == "enabled":
+            if group_running or not coerce_bool(value, default=False):
+                return False
+            if not coerce_bool(actor.get("enabled"), default=True):
+                return False
+        elif key not in actor or actor[key] != value:
+            return False
+    return True
+
+
+def _index_actors(group: Any) -> tuple[list[Dict[str, Any]], Dict[str, tuple[int, Dict[str, Any]]], int]:
+    """Return (actors, {actor_id: (index, actor)}, enabled_count) from one pass over the group doc."""
+    actors = list_actors(group)
+    index: Dict[str, tuple[int, Dict[str, Any]]] = {}
+    enabled_count = 0
+    for pos, item in enumerate(actors):
+        index.setdefault(str(item.get("id")), (pos, item))
+        # Parsed docs carry plain bools or nothing; only odd values pay for coerce_bool.
+        enabled = item.get("enabled")
+        if enabled is True or enabled is None or (enabled is not False and coerce_bool(enabled, default=True)):
+            enabled_count += 1
+    return actors, index, enabled_count
+
+
+@dataclass(frozen=True)
+class ActorUpdateDeps:
+    """Daemon callables the actor_update handler needs, built once per dispatcher."""
+
+    foreman_id: Callable[[Any], str]
+    maybe_reset_automation_on_foreman_change: Callable[..., None]
+    find_scope_url: Callable[[Any, str], str]
+    effective_runner_kind: Callable[[str], str]
+    ensure_mcp_installed: Callable[..., Any]
+    merge_actor_env_with_private: Callable[[str, str, Dict[str, Any]], Dict[str, Any]]
+    inject_actor_context_env: Callable[..., Dict[str, Any]]
+    normalize_runtime_command: Callable[[str, list[str]], list[str]]
+    prepare_pty_env: Callable[[Dict[str, Any]], Dict[str, Any]]
+    pty_backlog_bytes: Callable[[], int]
+    write_headless_state: Callable[[str, str], None]
+    write_pty_state: Callable[..., None]
+    clear_preamble_sent: Callable[[Any, str], None]
+    throttle_reset_actor: Callable[..., None]
+    remove_headless_state: Callable[[str, str], None]
+    remove_pty_state_if_pid: Callable[..., None]
+    supported_runtimes: Sequence[str]
+    get_actor_profile: Callable[[str], Optional[Dict[str, Any]]]
+    load_actor_profile_secrets: Callable[[Any], Dict[str, str]]
+    update_actor_private_env: Callable[..., Dict[str, str]]
+
+
+def handle_actor_update(args: Dict[str, Any], *, deps: ActorUpdateDeps) -> DaemonResponse:
+    parsed = _parse_update_args(args)
+    group_id = parsed.group_id
+    actor_id = parsed.actor_id
+    by = parsed.by
+    patch = parsed.patch
+    profile_id_arg = parsed.profile_id
+    profile_scope_arg = parsed.profile_scope
+    profile_owner_arg = parsed.profile_owner
+    profile_action = parsed.profile_action
+    caller_id = parsed.caller_id
+    is_admin = parsed.is_admin
     if not group_id:
         return _error("missing_group_id", "missing group_id")
-    group = load_group(group_id)
+    group = load_group_cached(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if not actor_id:
         return _error("missing_actor_id", "missing actor_id")
-    allowed = {
-        "role",
-        "title",
-        "avatar_asset_path",
-        "command",
-        "env",
-        "default_scope_key",
-        "submit",
-        "capability_autoload",
-        "capability_hidden",
-        "enabled",
-        "runner",
-        "runtime",
-        "runtime_state_source",
-    }
-    unknown = set(patch.keys()) - allowed
-    if unknown:
-        return _error("invalid_patch", "invalid patch keys", details={"unknown_keys": sorted(unknown)})
+    patch_keys = patch.keys()
+    if patch:
+        unknown = patch_keys - _ALLOWED_PATCH_KEYS
+        if unknown:
+            return _error("invalid_patch", "invalid patch keys", details={"unknown_keys": sorted(unknown)})
     if profile_action and profile_action not in ("convert_to_custom",):
         return _error("invalid_request", "invalid profile_action")
     if profile_action and profile_id_arg:
         return _error("invalid_request", "profile_action and profile_id are mutually exclusive")
     if not patch and not profile_id_arg and not profile_action:
         return _error("invalid_patch", "empty patch")
-    actor_existing = find_actor(group, actor_id)
-    if not isinstance(actor_existing, dict):
+    _, actor_index, enabled_count = _index_actors(group)
+    indexed = actor_index.get(actor_id)
+    if indexed is None:
         return _error("actor_not_found", f"actor not found: {actor_id}")
+    actor_existing = indexed[1]
+    # Enabled actors other than this one; the patch can only toggle this actor.
+    other_enabled_count = enabled_count - (1 if coerce_bool(actor_existing.get("enabled"), default=True) else 0)
     linked_before = is_actor_profile_linked(actor_existing)
-    controlled_patch_keys = sorted([key for key in PROFILE_CONTROLLED_FIELDS if key in patch])
+    controlled_patch_keys = sorted(PROFILE_CONTROLLED_FIELDS & patch_keys) if patch else []
     if linked_before and controlled_patch_keys:
         return _error(
             "actor_profile_linked_readonly",
@@ -152,7 +236,7 @@ def handle_actor_update(
             details={"keys": controlled_patch_keys},
         )
     enabled_patched = "enabled" in patch
-    before_foreman = foreman_id(group) if enabled_patched else ""
+    before_foreman = deps.foreman_id(group) if enabled_patched else ""
     applied_profile_id = ""
     applied_profile_ref: Any = None
     profile_converted = False
@@ -163,7 +247,20 @@ def handle_actor_update(
     actor: Dict[str, Any]
     try:
         require_actor_permission(group, by=by, action="actor.update", target_actor_id=actor_id)
-        current_actor = find_actor(group, actor_id) or {}
+        if (
+            not profile_id_arg
+            and not profile_action
+            and _is_noop_patch(
+                actor_existing,
+                patch,
+                group_running=coerce_bool(group.doc.get("running"), default=False),
+            )
+        ):
+            # Reconciliation loops resend current state; skip the group save and ledger append.
+            return DaemonResponse(ok=True, result={"actor": dict(actor_existing), "event": None, "noop": True})
+        # The index holds the live group.doc entry and the link/update helpers
+        # mutate it in place, so actor_existing stays current for the whole request.
+        current_actor = actor_existing
         if (
             enabled_patched
             and coerce_bool(patch.get("enabled"), default=False)
@@ -174,12 +271,12 @@ def handle_actor_update(
             require_standard_chatgpt_web_model_actor(current_actor)
             require_no_other_chatgpt_web_model_actor(group_id=group.group_id, actor_id=actor_id)
         if profile_action == "convert_to_custom":
-            current = find_actor(group, actor_id)
-            if not isinstance(current, dict) or not is_actor_profile_linked(current):
+            current = actor_existing
+            if not is_actor_profile_linked(current):
                 raise ValueError("actor is not linked to a profile")
             current_profile_id = actor_profile_id(current)
             current_profile_ref = actor_profile_ref(current)
-            profile = get_actor_profile_by_ref(current_profile_ref) if current_profile_ref is not None else get_actor_profile(current_profile_id)
+            profile = get_actor_profile_by_ref(current_profile_ref) if current_profile_ref is not None else deps.get_actor_profile(current_profile_id)
             if not isinstance(profile, dict):
                 raise ValueError(f"profile not found: {current_profile_id}")
             if str(profile.get("runtime") or "").strip().lower() == "web_model":
@@ -191,8 +288,8 @@ def handle_actor_update(
                 profile_id=current_profile_id,
                 profile_ref=current_profile_ref,
                 profile=profile,
-                load_actor_profile_secrets=load_actor_profile_secrets,
-                update_actor_private_env=update_actor_private_env,
+                load_actor_profile_secrets=deps.load_actor_profile_secrets,
+                update_actor_private_env=deps.update_actor_private_env,
             )
             clear_actor_link_metadata(group, actor_id)
             profile_converted = True
@@ -206,13 +303,13 @@ def handle_actor_update(
                 }
             )
             if applied_profile_ref.profile_scope == "global":
-                profile = get_actor_profile(profile_id_arg)
+                profile = deps.get_actor_profile(profile_id_arg)
             else:
                 resolver = ProfileResolver()
                 resolved = resolver.resolve(
                     applied_profile_ref,
-                    caller_id=str(args.get("caller_id") or "").strip(),
-                    is_admin=coerce_bool(args.get("is_admin"), default=False),
+                    caller_id=caller_id,
+                    is_admin=is_admin,
                 )
                 profile = resolved.model_dump(exclude_none=True) if resolved is not None else None
             if not isinstance(profile, dict):
@@ -226,19 +323,19 @@ def handle_actor_update(
                 profile_id=profile_id_arg,
                 profile_ref=applied_profile_ref,
                 profile=profile,
-                load_actor_profile_secrets=load_actor_profile_secrets,
-                update_actor_private_env=update_actor_private_env,
+                load_actor_profile_secrets=deps.load_actor_profile_secrets,
+                update_actor_private_env=deps.update_actor_private_env,
             )
             applied_profile_id = profile_id_arg
 
-        actor = find_actor(group, actor_id) or {}
         if patch:
             actor = update_actor(group, actor_id, patch)
         else:
-            actor = dict(actor)
+            actor = dict(actor_existing)
     except Exception as e:
         return _error("actor_update_failed", str(e))
 
+    start_deferred = False
     if enabled_patched:
         if coerce_bool(actor.get("enabled"), default=False):
             if coerce_bool(group.doc.get("running"), default=False):
@@ -246,14 +343,15 @@ def handle_actor_update(
                     actor = resolve_linked_actor_before_start(
                         group,
                         actor_id,
-                        get_actor_profile=get_actor_profile,
-                        load_actor_profile_secrets=load_actor_profile_secrets,
-                        update_actor_private_env=update_actor_private_env,
-                        caller_id=str(args.get("caller_id") or "").strip(),
-                        is_admin=coerce_bool(args.get("is_admin"), default=False),
+                        get_actor_profile=deps.get_actor_profile,
+                        load_actor_profile_secrets=deps.load_actor_profile_secrets,
+                        update_actor_private_env=deps.update_actor_private_env,
+                        caller_id=caller_id,
+                        is_admin=is_admin,
                     )
                 except Exception as e:
                     return _error("profile_not_found", str(e))
+                runtimes_tuple = tuple(deps.supported_runtimes)
                 try:
                     launch_spec = resolve_actor_launch_spec(
                         group,
@@ -262,13 +360,13 @@ def handle_actor_update(
                         env=dict(actor.get("env") or {}) if isinstance(actor.get("env"), dict) else {},
                         runner=str(actor.get("runner") or "pty"),
                         runtime=str(actor.get("runtime") or "codex"),
-                        find_scope_url=find_scope_url,
-                        effective_runner_kind=effective_runner_kind,
-                        normalize_runtime_command=normalize_runtime_command,
-                        supported_runtimes=list(supported_runtimes),
-                        caller_id=str(args.get("caller_id") or "").strip(),
-                        is_admin=coerce_bool(args.get("is_admin"), default=False),
-                        merge_actor_env_with_private=merge_actor_env_with_private,
+                        find_scope_url=deps.find_scope_url,
+                        effective_runner_kind=deps.effective_runner_kind,
+                        normalize_runtime_command=deps.normalize_runtime_command,
+                        supported_runtimes=_supported_runtime_set(runtimes_tuple),
+                        caller_id=caller_id,
+                        is_admin=is_admin,
+                        merge_actor_env_with_private=deps.merge_actor_env_with_private,
                     )
                 except ValueError as e:
                     msg = str(e)
@@ -311,7 +409,7 @@ def handle_actor_update(
                                 "group_id": group.group_id,
                                 "actor_id": actor_id,
                                 "runtime": runtime,
-                                "supported": list(supported_runtimes),
+                                "supported": list(runtimes_tuple),
                                 "hint": "Change the actor runtime to a supported one.",
                             },
                         )
@@ -329,7 +427,6 @@ def handle_actor_update(
                     return _error("actor_update_failed", msg)
 
                 cwd = launch_spec["cwd"]
-                runner_kind = str(launch_spec["runner"])
                 runner_effective = str(launch_spec["effective_runner"])
                 runtime = str(launch_spec["runtime"])
                 effective_env = dict(launch_spec["merged_env"])
@@ -337,7 +434,7 @@ def handle_actor_update(
                 def _launch_env() -> Dict[str, str]:
                     return prepare_runtime_mcp_env(
                         runtime,
-                        inject_actor_context_env(effective_env, group_id=group.group_id, actor_id=actor_id),
+                        deps.inject_actor_context_env(effective_env, group_id=group.group_id, actor_id=actor_id),
                     )
 
                 if runner_effective != "headless":
@@ -346,7 +443,7 @@ def handle_actor_update(
                     try:
                         mcp_env = _launch_env()
                         mcp_ready = bool(
-                            ensure_mcp_installed(
+                            deps.ensure_mcp_installed(
                                 runtime,
                                 cwd,
                                 env=mcp_env,
@@ -360,114 +457,129 @@ def handle_actor_update(
                     if runtime_error:
                         return _error("runtime_unavailable", runtime_error)
 
-                if actor_uses_codex_app_server_state(actor):
-                    session = codex_app_supervisor.start_pty_app_actor(
-                        group_id=group.group_id,
-                        actor_id=actor_id,
-                        cwd=cwd,
-                        env=_launch_env(),
-                        model=model_from_runtime_command(launch_spec["effective_command"]),
-                        remote_tui_base_command=list(launch_spec["effective_command"]),
-                        max_backlog_bytes=pty_backlog_bytes(),
-                    )
-                    try:
-                        write_pty_state(group.group_id, actor_id, pid=session.remote_tui_pid())
-                    except Exception:
-                        pass
-                elif runner_effective == "headless":
-                    if runtime == "web_model":
-                        try:
-                            write_headless_state(group.group_id, actor_id)
-                        except Exception:
-                            pass
-                    elif runtime == "codex":
-                        codex_app_supervisor.start_actor(
-                            group_id=group.group_id,
-                            actor_id=actor_id,
-                            cwd=cwd,
-                            env=_launch_env(),
-                            model=model_from_runtime_command(launch_spec["effective_command"]),
-                        )
-                    elif runtime == "claude":
-                        claude_app_supervisor.start_actor(
+                def _start_runtime() -> None:
+                    # Queued starts run after the response; skip this one if the actor
+                    # was disabled or removed, or the group stopped, in the meantime.
+                    # Stops share the actor's runtime lane, so none can land between
+                    # this check and the start below.
+                    latest = load_group(group.group_id)
+                    if latest is None or not coerce_bool(latest.doc.get("running"), default=False):
+                        return
+                    latest_actor = find_actor(latest, actor_id)
+                    if not isinstance(latest_actor, dict) or not coerce_bool(latest_actor.get("enabled"), default=True):
+                        return
+                    if actor_uses_codex_app_server_state(actor):
+                        session = codex_app_supervisor.start_pty_app_actor(
                             group_id=group.group_id,
                             actor_id=actor_id,
                             cwd=cwd,
                             env=_launch_env(),
                             model=model_from_runtime_command(launch_spec["effective_command"]),
+                            remote_tui_base_command=list(launch_spec["effective_command"]),
+                            max_backlog_bytes=deps.pty_backlog_bytes(),
                         )
+                        try:
+                            deps.write_pty_state(group.group_id, actor_id, pid=session.remote_tui_pid())
+                        except Exception:
+                            pass
+                    elif runner_effective == "headless":
+                        if runtime == "web_model":
+                            try:
+                                deps.write_headless_state(group.group_id, actor_id)
+                            except Exception:
+                                pass
+                        elif runtime == "codex":
+                            codex_app_supervisor.start_actor(
+                                group_id=group.group_id,
+                                actor_id=actor_id,
+                                cwd=cwd,
+                                env=_launch_env(),
+                                model=model_from_runtime_command(launch_spec["effective_command"]),
+                            )
+                        elif runtime == "claude":
+                            claude_app_supervisor.start_actor(
+                                group_id=group.group_id,
+                                actor_id=actor_id,
+                                cwd=cwd,
+                                env=_launch_env(),
+                                model=model_from_runtime_command(launch_spec["effective_command"]),
+                            )
+                        else:
+                            headless_runner.SUPERVISOR.start_actor(
+                                group_id=group.group_id,
+                                actor_id=actor_id,
+                                cwd=cwd,
+                                env=_launch_env(),
+                            )
+                            try:
+                                deps.write_headless_state(group.group_id, actor_id)
+                            except Exception:
+                                pass
                     else:
-                        headless_runner.SUPERVISOR.start_actor(
+                        session = start_pty_actor_with_runtime_resume(
                             group_id=group.group_id,
                             actor_id=actor_id,
                             cwd=cwd,
-                            env=_launch_env(),
+                            base_command=launch_spec["effective_command"],
+                            env=deps.prepare_pty_env(_launch_env()),
+                            runtime=runtime,
+                            model=model_from_runtime_command(launch_spec["effective_command"]),
+                            max_backlog_bytes=deps.pty_backlog_bytes(),
+                            runtime_start_preflight_error=runtime_start_preflight_error,
                         )
                         try:
-                            write_headless_state(group.group_id, actor_id)
+                            deps.write_pty_state(group.group_id, actor_id, pid=session.pid)
                         except Exception:
                             pass
-                else:
-                    session = start_pty_actor_with_runtime_resume(
-                        group_id=group.group_id,
-                        actor_id=actor_id,
-                        cwd=cwd,
-                        base_command=launch_spec["effective_command"],
-                        env=prepare_pty_env(_launch_env()),
-                        runtime=runtime,
-                        model=model_from_runtime_command(launch_spec["effective_command"]),
-                        max_backlog_bytes=pty_backlog_bytes(),
-                        runtime_start_preflight_error=runtime_start_preflight_error,
-                    )
-                    try:
-                        write_pty_state(group.group_id, actor_id, pid=session.pid)
-                    except Exception:
-                        pass
 
-                clear_preamble_sent(group, actor_id)
-                throttle_reset_actor(group.group_id, actor_id, keep_pending=True)
+                    deps.clear_preamble_sent(group, actor_id)
+                    deps.throttle_reset_actor(group.group_id, actor_id, keep_pending=True)
+
+                try:
+                    start_deferred = run_actor_runtime_start(group.group_id, actor_id, _start_runtime)
+                except Exception as e:
+                    return _error("actor_update_failed", str(e))
         else:
-            runner_kind = str(actor.get("runner") or "pty").strip() or "pty"
-            runner_effective = effective_runner_kind(runner_kind)
+            # effective_runner_kind already normalizes blank/case, so pass the raw value.
+            runner_effective = deps.effective_runner_kind(str(actor.get("runner") or ""))
             runtime = str(actor.get("runtime") or "codex").strip() or "codex"
-            if runtime == "web_model" and runner_effective == "headless":
-                remove_headless_state(group.group_id, actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-            elif actor_uses_codex_app_server_state(actor):
-                codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-                remove_headless_state(group.group_id, actor_id)
-            elif runtime == "codex" and runner_effective == "headless":
-                codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-                remove_headless_state(group.group_id, actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-            elif runtime == "claude" and runner_effective == "headless":
-                claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
-                remove_headless_state(group.group_id, actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-            elif runner_effective == "headless":
-                headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-                remove_headless_state(group.group_id, actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-            else:
-                pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
-                remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
-                remove_headless_state(group.group_id, actor_id)
-            throttle_reset_actor(group.group_id, actor_id, keep_pending=True)
+
+            def _stop_runtime() -> None:
+                if runtime == "web_model" and runner_effective == "headless":
+                    deps.remove_headless_state(group.group_id, actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                elif actor_uses_codex_app_server_state(actor):
+                    codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                    deps.remove_headless_state(group.group_id, actor_id)
+                elif runtime == "codex" and runner_effective == "headless":
+                    codex_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                    deps.remove_headless_state(group.group_id, actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                elif runtime == "claude" and runner_effective == "headless":
+                    claude_app_supervisor.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                    deps.remove_headless_state(group.group_id, actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                elif runner_effective == "headless":
+                    headless_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                    deps.remove_headless_state(group.group_id, actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                else:
+                    pty_runner.SUPERVISOR.stop_actor(group_id=group.group_id, actor_id=actor_id)
+                    deps.remove_pty_state_if_pid(group.group_id, actor_id, pid=0)
+                    deps.remove_headless_state(group.group_id, actor_id)
+
+            run_actor_runtime_stop(group.group_id, actor_id, _stop_runtime)
+            deps.throttle_reset_actor(group.group_id, actor_id, keep_pending=True)
             try:
-                any_enabled = any(
-                    coerce_bool(item.get("enabled"), default=True)
-                    for item in list_actors(group)
-                    if isinstance(item, dict) and str(item.get("id") or "").strip()
-                )
-                if not any_enabled:
+                if other_enabled_count <= 0:
                     group.doc["running"] = False
                     group.save()
             except Exception:
                 pass
 
     if enabled_patched:
-        maybe_reset_automation_on_foreman_change(group, before_foreman_id=before_foreman)
+        deps.maybe_reset_automation_on_foreman_change(group, before_foreman_id=before_foreman)
     event_data: Dict[str, Any] = {
         "actor_id": actor_id,
         "patch": patch,
@@ -488,56 +600,13 @@ def handle_actor_update(
         by=by,
         data=event_data,
     )
-    return DaemonResponse(ok=True, result={"actor": actor, "event": event})
-
-
-def try_handle_actor_update_op(
-    op: str,
-    args: Dict[str, Any],
-    *,
-    foreman_id: Callable[[Any], str],
-    maybe_reset_automation_on_foreman_change: Callable[..., None],
-    find_scope_url: Callable[[Any, str], str],
-    effective_runner_kind: Callable[[str], str],
-    ensure_mcp_installed: Callable[..., Any],
-    merge_actor_env_with_private: Callable[[str, str, Dict[str, Any]], Dict[str, Any]],
-    inject_actor_context_env: Callable[..., Dict[str, Any]],
-    normalize_runtime_command: Callable[[str, list[str]], list[str]],
-    prepare_pty_env: Callable[[Dict[str, Any]], Dict[str, Any]],
-    pty_backlog_bytes: Callable[[], int],
-    write_headless_state: Callable[[str, str], None],
-    write_pty_state: Callable[..., None],
-    clear_preamble_sent: Callable[[Any, str], None],
-    throttle_reset_actor: Callable[..., None],
-    remove_headless_state: Callable[[str, str], None],
-    remove_pty_state_if_pid: Callable[..., None],
-    supported_runtimes: Sequence[str],
-    get_actor_profile: Callable[[str], Optional[Dict[str, Any]]],
-    load_actor_profile_secrets: Callable[[str], Dict[str, str]],
-    update_actor_private_env: Callable[..., Dict[str, str]],
-) -> Optional[DaemonResponse]:
+    result: Dict[str, Any] = {"actor": actor, "event": event}
+    if start_deferred:
+        result["start"] = "pending"
+    return DaemonResponse(ok=True, result=result)
+
+
+def try_handle_actor_update_op(op: str, args: Dict[str, Any], *, deps: ActorUpdateDeps) -> Optional[DaemonResponse]:
     if op == "actor_update":
-        return handle_actor_update(
-            args,
-            foreman_id=foreman_id,
-            maybe_reset_automation_on_foreman_change=maybe_reset_automation_on_foreman_change,
-            find_scope_url=find_scope_url,
-            effective_runner_kind=effective_runner_kind,
-            ensure_mcp_installed=ensure_mcp_installed,
-            merge_actor_env_with_private=merge_actor_env_with_private,
-            inject_actor_context_env=inject_actor_context_env,
-            normalize_runtime_command=normalize_runtime_command,
-            prepare_pty_env=prepare_pty_env,
-            pty_backlog_bytes=pty_backlog_bytes,
-            write_headless_state=write_headless_state,
-            write_pty_state=write_pty_state,
-            clear_preamble_sent=clear_preamble_sent,
-            throttle_reset_actor=throttle_reset_actor,
-            remove_headless_state=remove_headless_state,
-            remove_pty_state_if_pid=remove_pty_state_if_pid,
-            supported_runtimes=supported_runtimes,
-            get_actor_profile=get_actor_profile,
-            load_actor_profile_secrets=load_actor_profile_secrets,
-            update_actor_private_env=update_actor_private_env,
-        )
+        return handle_actor_update(args, deps=deps)
     return None
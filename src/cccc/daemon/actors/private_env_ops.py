@@ -4,7 +4,7 @@ import hashlib
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from ...paths import ensure_home
 from ...util.fs import atomic_write_json, read_json
@@ -66,6 +66,28 @@ def coerce_private_env_value(value: Any) -> str:
     return v
 
 
+def parse_private_env_set(raw: Dict[Any, Any]) -> Dict[str, str]:
+    """Validate a bulk ``set`` payload with the same rules as the per-item helpers.
+
+    Already-clean string keys and values skip the slower per-item path.
+    """
+    fullmatch = _PRIVATE_ENV_KEY_RE.fullmatch
+    out: Dict[str, str] = {}
+    for key, value in raw.items():
+        k = key if type(key) is str and fullmatch(key) else validate_private_env_key(key)
+        if type(value) is str and len(value) <= _PRIVATE_ENV_MAX_VALUE_CHARS:
+            out[k] = value
+        else:
+            out[k] = coerce_private_env_value(value)
+    return out
+
+
+def parse_private_env_unset(raw: List[Any]) -> List[str]:
+    """Validate a bulk ``unset`` key list."""
+    fullmatch = _PRIVATE_ENV_KEY_RE.fullmatch
+    return [key if type(key) is str and fullmatch(key) else validate_private_env_key(key) for key in raw]
+
+
 def mask_private_env_value(value: Any) -> str:
     """Return a stable masked preview for UI metadata.
 
@@ -84,7 +106,16 @@ def _private_env_path(group_id: str, actor_id: str) -> Path:
     return gdir / _private_env_actor_filename(actor_id)
 
 
+def sorted_env(env: dict[str, str]) -> dict[str, str]:
+    """Return env with keys in sorted order (the input itself when already sorted)."""
+    keys = list(env)
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        return env
+    return {k: env[k] for k in sorted(keys)}
+
+
 def load_actor_private_env(group_id: str, actor_id: str) -> dict[str, str]:
+    """Load an actor's private env; keys are returned in sorted order."""
     try:
         path = _private_env_path(group_id, actor_id)
     except Exception:
@@ -102,7 +133,7 @@ def load_actor_private_env(group_id: str, actor_id: str) -> dict[str, str]:
         if v is None:
             continue
         out[kk] = str(v)
-    return out
+    return sorted_env(out)
 
 
 def update_actor_private_env(
@@ -113,11 +144,14 @@ def update_actor_private_env(
     unset_keys: list[str],
     clear: bool,
 ) -> dict[str, str]:
+    """Apply set/unset/clear and persist; the returned env has keys in sorted order."""
     current: dict[str, str] = {} if clear else load_actor_private_env(group_id, actor_id)
     for k in unset_keys:
         current.pop(k, None)
     for k, v in set_vars.items():
         current[k] = v
+    # Persist in key order so loads (and the UI key listing) need no per-call sort.
+    current = sorted_env(current)
 
     try:
         home = ensure_home()
@@ -146,7 +180,7 @@ def update_actor_private_env(
         os.chmod(path, 0o600)
     except Exception:
         pass
-    return dict(current)
+    return current
 
 
 def delete_actor_private_env(group_id: str, actor_id: str) -> None:
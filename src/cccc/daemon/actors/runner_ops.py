@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from ...contracts.v1 import DaemonResponse, DaemonError
 from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
@@ -166,11 +166,13 @@ def stop_all() -> None:
     headless_runner.SUPERVISOR.stop_all()
 
 
+_HEADLESS_HANDLERS: Dict[str, Callable[[Dict[str, Any]], DaemonResponse]] = {
+    "headless_status": handle_headless_status,
+    "headless_set_status": handle_headless_set_status,
+    "headless_ack_message": handle_headless_ack_message,
+}
+
+
 def try_handle_headless_op(op: str, args: Dict[str, Any]) -> Optional[DaemonResponse]:
-    if op == "headless_status":
-        return handle_headless_status(args)
-    if op == "headless_set_status":
-        return handle_headless_set_status(args)
-    if op == "headless_ack_message":
-        return handle_headless_ack_message(args)
-    return None
+    handler = _HEADLESS_HANDLERS.get(op)
+    return handler(args) if handler is not None else None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ...contracts.v1 import DaemonError, DaemonResponse
 from ...kernel.actors import find_actor
@@ -79,11 +79,13 @@ def handle_web_model_browser_close(args: Dict[str, Any]) -> DaemonResponse:
     return DaemonResponse(ok=True, result={"group_id": gid, "actor_id": aid, **result})
 
 
+_WEB_MODEL_BROWSER_HANDLERS: Dict[str, Callable[[Dict[str, Any]], DaemonResponse]] = {
+    "web_model_browser_open": handle_web_model_browser_open,
+    "web_model_browser_info": handle_web_model_browser_info,
+    "web_model_browser_close": handle_web_model_browser_close,
+}
+
+
 def try_handle_web_model_browser_op(op: str, args: Dict[str, Any]) -> Optional[DaemonResponse]:
-    if op == "web_model_browser_open":
-        return handle_web_model_browser_open(args)
-    if op == "web_model_browser_info":
-        return handle_web_model_browser_info(args)
-    if op == "web_model_browser_close":
-        return handle_web_model_browser_close(args)
-    return None
+    handler = _WEB_MODEL_BROWSER_HANDLERS.get(op)
+    return handler(args) if handler is not None else None
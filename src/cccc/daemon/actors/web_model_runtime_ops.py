@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ...contracts.v1 import DaemonError, DaemonResponse
 from ...kernel.actors import find_actor
@@ -642,15 +642,15 @@ def handle_web_model_runtime_complete_turn(args: Dict[str, Any]) -> DaemonRespon
     )
 
 
+_WEB_MODEL_RUNTIME_HANDLERS: Dict[str, Callable[[Dict[str, Any]], DaemonResponse]] = {
+    "web_model_delivery_preferences_get": handle_web_model_delivery_preferences_get,
+    "web_model_delivery_preferences_update": handle_web_model_delivery_preferences_update,
+    "web_model_runtime_wait_next_turn": handle_web_model_runtime_wait_next_turn,
+    "web_model_runtime_recover_turn": handle_web_model_runtime_recover_turn,
+    "web_model_runtime_complete_turn": handle_web_model_runtime_complete_turn,
+}
+
+
 def try_handle_web_model_runtime_op(op: str, args: Dict[str, Any]) -> Optional[DaemonResponse]:
-    if op == "web_model_delivery_preferences_get":
-        return handle_web_model_delivery_preferences_get(args)
-    if op == "web_model_delivery_preferences_update":
-        return handle_web_model_delivery_preferences_update(args)
-    if op == "web_model_runtime_wait_next_turn":
-        return handle_web_model_runtime_wait_next_turn(args)
-    if op == "web_model_runtime_recover_turn":
-        return handle_web_model_runtime_recover_turn(args)
-    if op == "web_model_runtime_complete_turn":
-        return handle_web_model_runtime_complete_turn(args)
-    return None
+    handler = _WEB_MODEL_RUNTIME_HANDLERS.get(op)
+    return handler(args) if handler is not None else None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 
 from ...contracts.v1 import (
     AutomationRule,
@@ -21,7 +23,7 @@ from ...kernel.group import (
     split_automation_snippets_for_storage,
 )
 from ...kernel.ledger import append_event
-from ...kernel.permissions import require_group_permission
+from ...kernel.permissions import GroupAction, require_group_permission
 from ...util.conv import coerce_bool
 from ...util.fs import atomic_write_json, read_json
 from ...util.time import utc_now_iso
@@ -36,6 +38,12 @@ def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
 
 
+def _clean_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    return str(value or "").strip()
+
+
 def _parse_expected_version(args: Dict[str, Any]) -> tuple[Optional[int], Optional[DaemonResponse]]:
     expected_version_raw = args.get("expected_version")
     if expected_version_raw is None:
@@ -46,45 +54,64 @@ def _parse_expected_version(args: Dict[str, Any]) -> tuple[Optional[int], Option
         return None, _error("invalid_request", "expected_version must be an integer")
 
 
-def _ensure_automation_doc(group: Any) -> Dict[str, Any]:
+def _normalize_automation_doc(group: Any) -> tuple[Dict[str, Any], bool]:
+    """Return (normalized automation doc, whether it differs from group.doc["automation"]).
+
+    Neither group.doc nor disk is touched; the flag is tracked per repair so a
+    canonical doc needs no deep compare.
+    """
     raw_automation = group.doc.get("automation")
-    seed = default_automation_ruleset_doc()
+    changed = False
     if not isinstance(raw_automation, dict):
-        automation = seed
+        automation = default_automation_ruleset_doc()
+        changed = True
     else:
         automation = dict(raw_automation)
         has_rules = isinstance(automation.get("rules"), list)
         has_snippets = isinstance(automation.get("snippets"), dict)
         has_snippet_overrides = isinstance(automation.get("snippet_overrides"), dict)
         if not has_rules and not has_snippets and not has_snippet_overrides:
-            automation = seed
+            automation = default_automation_ruleset_doc()
+            changed = True
         else:
             if not has_rules:
                 automation["rules"] = []
+                changed = True
             custom_snippets, built_in_overrides = normalize_automation_snippet_storage(automation)
+            if custom_snippets != automation.get("snippets") or built_in_overrides != automation.get(
+                "snippet_overrides"
+            ):
+                changed = True
             automation["snippets"] = custom_snippets
             automation["snippet_overrides"] = built_in_overrides
-    if "snippets" not in automation:
-        automation["snippets"] = {}
-    if "snippet_overrides" not in automation:
-        automation["snippet_overrides"] = {}
     try:
         version = int(automation.get("version") or 0)
     except Exception:
         version = 0
     if version <= 0:
         version = 1
-    automation["version"] = version
-    if group.doc.get("automation") != automation:
+    if automation.get("version") != version:
+        automation["version"] = version
+        changed = True
+    return automation, changed
+
+
+def _read_automation_doc(group: Any) -> Dict[str, Any]:
+    """Return the normalized automation doc without touching group.doc or disk."""
+    return _normalize_automation_doc(group)[0]
+
+
+def _ensure_automation_doc(group: Any) -> Dict[str, Any]:
+    """Normalize group.doc["automation"], saving only when the stored doc is not already well-formed."""
+    automation, changed = _normalize_automation_doc(group)
+    if changed:
         group.doc["automation"] = automation
         group.save()
-    else:
-        group.doc["automation"] = automation
     return automation
 
 
 def _automation_version(group: Any) -> int:
-    automation = _ensure_automation_doc(group)
+    automation = _read_automation_doc(group)
     try:
         version = int(automation.get("version") or 0)
     except Exception:
@@ -92,11 +119,26 @@ def _automation_version(group: Any) -> int:
     return max(1, version)
 
 
+def _at_triggers_by_id(ruleset: AutomationRuleSet) -> Dict[str, Optional[str]]:
+    out: Dict[str, Optional[str]] = {}
+    for rule in ruleset.rules:
+        rid = _clean_text(rule.id)
+        if not rid:
+            continue
+        trigger = rule.trigger
+        if trigger.kind == "at":
+            out[rid] = trigger.at.strip()
+        else:
+            out[rid] = None
+    return out
+
+
 def _reconcile_automation_state_after_ruleset_change(
     group: Any,
     *,
     previous: AutomationRuleSet,
     current: AutomationRuleSet,
+    now: Optional[str] = None,
 ) -> None:
     state_path = group.path / "state" / "automation.json"
     raw = read_json(state_path)
@@ -106,45 +148,23 @@ def _reconcile_automation_state_after_ruleset_change(
         rules_state = {}
     changed = False
 
-    prev_by_id: Dict[str, AutomationRule] = {}
-    for rule in previous.rules:
-        rid = str(rule.id or "").strip()
-        if rid:
-            prev_by_id[rid] = rule
+    # rule id -> trigger.at for "at" rules; None marks any other trigger kind.
+    prev_at_by_id = _at_triggers_by_id(previous)
+    next_at_by_id = _at_triggers_by_id(current)
 
-    next_by_id: Dict[str, AutomationRule] = {}
-    for rule in current.rules:
-        rid = str(rule.id or "").strip()
-        if rid:
-            next_by_id[rid] = rule
-
-    next_ids = set(next_by_id.keys())
-    stale_ids = [rid for rid in list(rules_state.keys()) if rid not in next_ids]
+    stale_ids = [rid for rid in rules_state if rid not in next_at_by_id]
     for rid in stale_ids:
         rules_state.pop(rid, None)
         changed = True
 
-    for rid, next_rule in next_by_id.items():
+    for rid, next_at in next_at_by_id.items():
         entry = rules_state.get(rid)
         if not isinstance(entry, dict):
             continue
-        trigger_kind = str(getattr(next_rule.trigger, "kind", "") or "").strip()
-        if trigger_kind != "at":
-            if entry.pop("at_fired", None) is not None:
-                changed = True
-            slot_key = str(entry.get("last_slot_key") or "")
-            if slot_key.startswith("at:"):
-                entry.pop("last_slot_key", None)
-                changed = True
-            continue
-
-        prev_rule = prev_by_id.get(rid)
-        prev_at = ""
-        if prev_rule is not None and str(getattr(prev_rule.trigger, "kind", "") or "").strip() == "at":
-            prev_at = str(getattr(prev_rule.trigger, "at", "") or "").strip()
-        next_at = str(getattr(next_rule.trigger, "at", "") or "").strip()
-        if prev_at and next_at and prev_at == next_at:
-            continue
+        if next_at is not None:
+            prev_at = prev_at_by_id.get(rid) or ""
+            if prev_at and prev_at == next_at:
+                continue
 
         if entry.pop("at_fired", None) is not None:
             changed = True
@@ -157,15 +177,33 @@ def _reconcile_automation_state_after_ruleset_change(
         return
 
     state["rules"] = rules_state
-    state["updated_at"] = utc_now_iso()
-    atomic_write_json(state_path, state)
+    state["updated_at"] = now or utc_now_iso()
+    atomic_write_json(state_path, state, indent=None)
 
 
-def _set_automation_ruleset(group: Any, *, ruleset: AutomationRuleSet) -> int:
-    previous_ruleset = load_automation_ruleset(group)
-    automation = _ensure_automation_doc(group)
+def _rules_storage_dump(ruleset: AutomationRuleSet) -> List[Dict[str, Any]]:
+    # One pydantic-core dump for the whole list instead of a model_dump call per rule.
+    return ruleset.model_dump(exclude_none=True, include={"rules"}).get("rules") or []
+
+
+def _set_automation_ruleset(
+    group: Any,
+    *,
+    ruleset: AutomationRuleSet,
+    rules_dump: Optional[List[Dict[str, Any]]] = None,
+    previous: Optional[AutomationRuleSet] = None,
+    now: Optional[str] = None,
+) -> int:
+    """Persist ruleset; rules_dump, when given, must be _rules_storage_dump(ruleset).
+
+    previous is the ruleset currently stored, if the caller already loaded it;
+    now is the request timestamp stamped on the automation state.
+    """
+    previous_ruleset = previous if previous is not None else load_automation_ruleset(group)
+    # Normalized in memory only; the single save below persists it with the new rules.
+    automation = _read_automation_doc(group)
     custom_snippets, built_in_overrides = split_automation_snippets_for_storage(ruleset.snippets or {})
-    automation["rules"] = [r.model_dump(exclude_none=True) for r in (ruleset.rules or [])]
+    automation["rules"] = rules_dump if rules_dump is not None else _rules_storage_dump(ruleset)
     automation["snippets"] = custom_snippets
     automation["snippet_overrides"] = built_in_overrides
     try:
@@ -175,28 +213,40 @@ def _set_automation_ruleset(group: Any, *, ruleset: AutomationRuleSet) -> int:
     automation["version"] = max(1, old_version) + 1
     group.doc["automation"] = automation
     group.save()
-    _reconcile_automation_state_after_ruleset_change(group, previous=previous_ruleset, current=ruleset)
+    _reconcile_automation_state_after_ruleset_change(group, previous=previous_ruleset, current=ruleset, now=now)
     return int(automation["version"])
 
 
 def _validate_automation_rule_action_trigger(rule: AutomationRule) -> None:
-    rid = str(rule.id or "").strip() or "<unknown>"
-    trigger_kind = str(getattr(rule.trigger, "kind", "") or "").strip()
-    action_kind = str(getattr(rule.action, "kind", "notify") or "notify").strip()
+    rid = _clean_text(rule.id) or "<unknown>"
+    trigger_kind = rule.trigger.kind
+    action_kind = rule.action.kind
     if action_kind in {"group_state", "actor_control"} and trigger_kind != "at":
         raise ValueError(f'rule "{rid}": action.kind={action_kind} only supports trigger.kind=at')
 
 
+# Legacy field -> canonical rename hint, in the order hints are reported.
+_LEGACY_ROOT_FIELDS: Dict[str, str] = {
+    "name": "name->id",
+    "actions": "actions->action",
+    "schedule": "schedule->trigger",
+    "every_minutes": "every_minutes->trigger.every_seconds",
+}
+_LEGACY_ACTION_FIELDS: Dict[str, str] = {
+    "type": "action.type->action.kind",
+    "message_template": "action.message_template->action.snippet_ref or action.message",
+}
+
+
+def _legacy_field_hints(raw: Dict[str, Any], fields: Dict[str, str]) -> list[str]:
+    hits = fields.keys() & raw.keys()
+    if not hits:
+        return []
+    return [hint for key, hint in fields.items() if key in hits]
+
+
 def _reject_legacy_automation_rule_shape(rule_raw: Dict[str, Any], *, loc: str) -> None:
-    legacy_root: list[str] = []
-    if "name" in rule_raw:
-        legacy_root.append("name->id")
-    if "actions" in rule_raw:
-        legacy_root.append("actions->action")
-    if "schedule" in rule_raw:
-        legacy_root.append("schedule->trigger")
-    if "every_minutes" in rule_raw:
-        legacy_root.append("every_minutes->trigger.every_seconds")
+    legacy_root = _legacy_field_hints(rule_raw, _LEGACY_ROOT_FIELDS)
 
     trigger = rule_raw.get("trigger")
     if isinstance(trigger, dict) and "every_minutes" in trigger:
@@ -204,10 +254,7 @@ def _reject_legacy_automation_rule_shape(rule_raw: Dict[str, Any], *, loc: str)
 
     action = rule_raw.get("action")
     if isinstance(action, dict):
-        if "type" in action:
-            legacy_root.append("action.type->action.kind")
-        if "message_template" in action:
-            legacy_root.append("action.message_template->action.snippet_ref or action.message")
+        legacy_root.extend(_legacy_field_hints(action, _LEGACY_ACTION_FIELDS))
 
     if legacy_root:
         hints = ", ".join(legacy_root)
@@ -217,50 +264,85 @@ def _reject_legacy_automation_rule_shape(rule_raw: Dict[str, Any], *, loc: str)
         )
 
 
+def _validate_ruleset(raw: Dict[str, Any], *, loc: str) -> AutomationRuleSet:
+    """Reject legacy rule shapes and validate each rule in a single pass over raw["rules"]."""
+    raw_rules = raw.get("rules")
+    if not isinstance(raw_rules, list):
+        return AutomationRuleSet.model_validate(raw)
+    rules: List[AutomationRule] = []
+    invalid = False
+    for i, raw_rule in enumerate(raw_rules):
+        if isinstance(raw_rule, dict):
+            _reject_legacy_automation_rule_shape(raw_rule, loc=f"{loc}.rules[{i}]")
+        if invalid:
+            continue
+        try:
+            rules.append(AutomationRule.model_validate(raw_rule))
+        except Exception:
+            invalid = True
+    if invalid:
+        # Legacy shapes are reported first; re-validate the whole ruleset for its error locations.
+        return AutomationRuleSet.model_validate(raw)
+    return AutomationRuleSet.model_validate({**raw, "rules": rules})
+
+
 def _actor_role_or_none(group: Any, actor_id: str) -> str:
-    aid = str(actor_id or "").strip()
+    aid = _clean_text(actor_id)
     if not aid:
         return ""
     if find_actor(group, aid) is None:
         return ""
     try:
-        return str(get_effective_role(group, aid) or "").strip()
+        return _clean_text(get_effective_role(group, aid))
     except Exception:
         return ""
 
 
-def _build_automation_payload(group: Any, *, by: str) -> Dict[str, Any]:
-    role = ""
-    if by and by != "user":
-        role = _actor_role_or_none(group, by)
-        if not role:
-            raise ValueError(f"unknown actor: {by}")
+def _caller_role(group: Any, by: str) -> str:
+    if not by or by == "user":
+        return "user"
+    return _actor_role_or_none(group, by)
 
-    ruleset = load_automation_ruleset(group)
+
+def _build_automation_payload(
+    group: Any,
+    *,
+    by: str,
+    role: Optional[str] = None,
+    ruleset: Optional[AutomationRuleSet] = None,
+    version: Optional[int] = None,
+    now: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the state payload; role/ruleset/version/now may be passed when already current."""
+    if role is None:
+        role = _caller_role(group, by)
+    if by and by != "user" and not role:
+        raise ValueError(f"unknown actor: {by}")
+
+    if ruleset is None:
+        ruleset = load_automation_ruleset(group)
     snippet_catalog = AutomationSnippetCatalog.model_validate(automation_snippet_catalog(group.doc.get("automation")))
-    status = build_automation_status(group)
-    version = _automation_version(group)
+    status = build_automation_status(group, ruleset=ruleset)
+    if version is None:
+        version = _automation_version(group)
 
     if role == "peer":
         visible_rules: list[Any] = []
         visible_ids: set[str] = set()
+        snippet_refs: set[str] = set()
         for rule in ruleset.rules:
-            rid = str(rule.id or "").strip()
+            rid = _clean_text(rule.id)
             if not rid:
                 continue
-            scope = str(rule.scope or "group")
-            owner = str(rule.owner_actor_id or "").strip()
-            if scope == "group" or owner == by:
-                visible_rules.append(rule)
-                visible_ids.add(rid)
-        snippet_refs: set[str] = set()
-        for rule in visible_rules:
-            action = getattr(rule, "action", None)
-            if str(getattr(action, "kind", "notify") or "notify").strip() != "notify":
+            if rule.scope != "group" and _clean_text(rule.owner_actor_id) != by:
                 continue
-            ref = str(getattr(action, "snippet_ref", "") or "").strip()
-            if ref:
-                snippet_refs.add(ref)
+            visible_rules.append(rule)
+            visible_ids.add(rid)
+            action = rule.action
+            if action.kind == "notify":
+                ref = _clean_text(action.snippet_ref)
+                if ref:
+                    snippet_refs.add(ref)
         snippets = {k: v for k, v in (ruleset.snippets or {}).items() if k in snippet_refs}
         status = {rid: st for rid, st in status.items() if rid in visible_ids}
         ruleset = AutomationRuleSet(rules=visible_rules, snippets=snippets)
@@ -277,49 +359,85 @@ def _build_automation_payload(group: Any, *, by: str) -> Dict[str, Any]:
         "status": status,
         "supported_vars": automation_supported_vars(),
         "version": int(version),
-        "server_now": utc_now_iso(),
+        "server_now": now or utc_now_iso(),
         "config_path": str(group.path / "group.yaml"),
     }
 
 
-def handle_group_automation_update(args: Dict[str, Any]) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
+@dataclass
+class _AutomationCtx:
+    group: Any
+    by: str
+    # "user" for the user; the actor's effective role otherwise ("" when unknown).
+    caller_role: str
+    expected_version: Optional[int]
+    current_ruleset: AutomationRuleSet
+    current_version: int
+    # Single timestamp for the whole request (state updated_at, server_now).
+    now: str
+
+    def require_group_permission(self, action: GroupAction) -> None:
+        # The user and the foreman always pass; only the failure paths need the kernel check's errors.
+        if self.caller_role in ("user", "foreman"):
+            return
+        require_group_permission(self.group, by=self.by, action=action)
+
+    def version_conflict(self) -> Optional[DaemonResponse]:
+        if self.expected_version is None or self.expected_version == self.current_version:
+            return None
+        return _error(
+            "version_conflict",
+            "automation version mismatch",
+            details={"expected_version": self.expected_version, "current_version": self.current_version},
+        )
+
+
+def _prepare_ctx(args: Dict[str, Any], *, versioned: bool = True) -> Union[_AutomationCtx, DaemonResponse]:
+    """Parse common args and load the group, caller role, ruleset and version once per request."""
+    group_id = _clean_text(args.get("group_id"))
     by = str(args.get("by") or "user").strip()
-    raw = args.get("ruleset") if isinstance(args.get("ruleset"), dict) else {}
-    expected_version, err = _parse_expected_version(args)
-    if err is not None:
-        return err
+    expected_version: Optional[int] = None
+    if versioned:
+        expected_version, err = _parse_expected_version(args)
+        if err is not None:
+            return err
     if not group_id:
         return _error("missing_group_id", "missing group_id")
     group = load_group(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
+    return _AutomationCtx(
+        group=group,
+        by=by,
+        caller_role=_caller_role(group, by),
+        expected_version=expected_version,
+        current_ruleset=load_automation_ruleset(group),
+        current_version=_automation_version(group),
+        now=utc_now_iso(),
+    )
+
+
+def handle_group_automation_update(args: Dict[str, Any]) -> DaemonResponse:
+    raw = args.get("ruleset") if isinstance(args.get("ruleset"), dict) else {}
+    ctx = _prepare_ctx(args)
+    if isinstance(ctx, DaemonResponse):
+        return ctx
+    group = ctx.group
+    by = ctx.by
 
     try:
-        require_group_permission(group, by=by, action="group.settings_update")
-        if isinstance(raw, dict):
-            raw_rules = raw.get("rules")
-            if isinstance(raw_rules, list):
-                for i, raw_rule in enumerate(raw_rules):
-                    if isinstance(raw_rule, dict):
-                        _reject_legacy_automation_rule_shape(raw_rule, loc=f"ruleset.rules[{i}]")
-        ruleset = AutomationRuleSet.model_validate(raw)
+        ctx.require_group_permission("group.settings_update")
+        ruleset = _validate_ruleset(raw, loc="ruleset")
         for rule in ruleset.rules:
             _validate_automation_rule_action_trigger(rule)
         if by and by != "user":
             for rule in ruleset.rules:
-                action = getattr(rule, "action", None)
-                kind = str(getattr(action, "kind", "notify") or "notify").strip()
-                if kind != "notify":
+                if rule.action.kind != "notify":
                     raise ValueError("agents can only manage notify automation rules")
-        current_version = _automation_version(group)
-        if expected_version is not None and expected_version != current_version:
-            return _error(
-                "version_conflict",
-                "automation version mismatch",
-                details={"expected_version": expected_version, "current_version": current_version},
-            )
-        next_version = _set_automation_ruleset(group, ruleset=ruleset)
+        conflict = ctx.version_conflict()
+        if conflict is not None:
+            return conflict
+        next_version = _set_automation_ruleset(group, ruleset=ruleset, previous=ctx.current_ruleset, now=ctx.now)
     except Exception as e:
         return _error("group_automation_update_failed", str(e))
 
@@ -337,37 +455,41 @@ def handle_group_automation_update(args: Dict[str, Any]) -> DaemonResponse:
     )
     return DaemonResponse(
         ok=True,
-        result={**_build_automation_payload(group, by=by), "event": ev},
+        result={**_build_automation_payload(group, by=by, role=ctx.caller_role, now=ctx.now), "event": ev},
     )
 
 
 def handle_group_automation_state(args: Dict[str, Any]) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
-    if not group_id:
-        return _error("missing_group_id", "missing group_id")
-    group = load_group(group_id)
-    if group is None:
-        return _error("group_not_found", f"group not found: {group_id}")
+    ctx = _prepare_ctx(args, versioned=False)
+    if isinstance(ctx, DaemonResponse):
+        return ctx
 
     try:
-        payload = _build_automation_payload(group, by=by)
+        payload = _build_automation_payload(
+            ctx.group,
+            by=ctx.by,
+            role=ctx.caller_role,
+            ruleset=ctx.current_ruleset,
+            version=ctx.current_version,
+            now=ctx.now,
+        )
     except Exception as e:
         return _error("permission_denied", str(e))
+    # Migrate legacy snippet storage on disk; a no-op for well-formed docs.
+    _ensure_automation_doc(ctx.group)
     return DaemonResponse(ok=True, result=payload)
 
 
 def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
     actions: list[Any] = []
     actions_raw = args.get("actions")
     if isinstance(actions_raw, list):
         actions.extend(actions_raw)
-    expected_version, err = _parse_expected_version(args)
+    # Parsed again by _prepare_ctx; checked here to keep the request-shape errors first.
+    _, err = _parse_expected_version(args)
     if err is not None:
         return err
-    if not group_id:
+    if not _clean_text(args.get("group_id")):
         return _error("missing_group_id", "missing group_id")
     if not actions:
         return _error("invalid_request", "actions must be a non-empty array")
@@ -375,68 +497,63 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
         if not isinstance(action, dict):
             return _error("invalid_request", f"action[{idx}] must be an object")
 
-    group = load_group(group_id)
-    if group is None:
-        return _error("group_not_found", f"group not found: {group_id}")
+    ctx = _prepare_ctx(args)
+    if isinstance(ctx, DaemonResponse):
+        return ctx
+    group = ctx.group
+    by = ctx.by
 
-    caller_role = "user"
+    caller_role = ctx.caller_role
     caller_id = by
-    if by and by != "user":
-        role = _actor_role_or_none(group, by)
-        if role not in ("foreman", "peer"):
-            return _error("permission_denied", f"unknown actor: {by}")
-        caller_role = role
-
-    current_ruleset = load_automation_ruleset(group)
-    current_version = _automation_version(group)
-    if expected_version is not None and expected_version != current_version:
-        return _error(
-            "version_conflict",
-            "automation version mismatch",
-            details={"expected_version": expected_version, "current_version": current_version},
-        )
+    if caller_role not in ("user", "foreman", "peer"):
+        return _error("permission_denied", f"unknown actor: {by}")
 
-    rules_order: list[str] = []
+    current_ruleset = ctx.current_ruleset
+    current_version = ctx.current_version
+    conflict = ctx.version_conflict()
+    if conflict is not None:
+        return conflict
+
+    # Insertion-ordered: rule order is the dict order (updates keep their slot, creates append).
     rules_by_id: Dict[str, Any] = {}
     for rule in current_ruleset.rules:
-        rid = str(rule.id or "").strip()
+        rid = _clean_text(rule.id)
         if not rid or rid in rules_by_id:
             continue
-        rules_order.append(rid)
         rules_by_id[rid] = rule
     snippets: Dict[str, str] = dict(current_ruleset.snippets or {})
 
+    def _passthrough(rule: Any, *, existing: Optional[Any] = None) -> Any:
+        return rule
+
     def _enforce_peer_rule(rule: Any, *, existing: Optional[Any] = None) -> Any:
-        if caller_role != "peer":
-            return rule
         if existing is not None:
-            existing_scope = str(existing.scope or "group")
-            existing_owner = str(existing.owner_actor_id or "").strip()
-            if existing_scope != "personal" or existing_owner != caller_id:
+            if existing.scope != "personal" or _clean_text(existing.owner_actor_id) != caller_id:
                 raise ValueError("peer can only manage own personal rules")
-        scope = str(rule.scope or "group")
-        owner = str(rule.owner_actor_id or "").strip()
-        if scope != "personal":
+        owner = _clean_text(rule.owner_actor_id)
+        if rule.scope != "personal":
             raise ValueError("peer rules must use scope=personal")
         if owner != caller_id:
             raise ValueError("peer rules must set owner_actor_id to self")
-        to = [str(x).strip() for x in (rule.to or []) if isinstance(x, str) and str(x).strip()]
+        to = [t for t in (x.strip() for x in (rule.to or []) if isinstance(x, str)) if t]
         if len(to) != 1 or to[0] != caller_id:
             raise ValueError("peer rules must target only self actor_id")
         return rule
 
     def _enforce_actor_action_kind(rule: Any) -> Any:
-        if caller_role == "user":
-            return rule
-        action = getattr(rule, "action", None)
-        kind = str(getattr(action, "kind", "notify") or "notify").strip()
-        if kind != "notify":
+        if rule.action.kind != "notify":
             raise ValueError("agents can only manage notify automation rules")
         return rule
 
+    # Specialize once per request: only peers are scope-restricted, only actors are kind-restricted.
+    if caller_role != "peer":
+        _enforce_peer_rule = _passthrough
+    if caller_role == "user":
+        _enforce_actor_action_kind = _passthrough
+
     def _normalize_rule(rule: Any) -> Any:
-        scope = str(rule.scope or "group")
-        owner = str(rule.owner_actor_id or "").strip()
+        scope = rule.scope
+        owner = _clean_text(rule.owner_actor_id)
         if scope == "group":
             if owner:
                 rule = rule.model_copy(update={"owner_actor_id": None})
@@ -447,13 +564,22 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
             raise ValueError(f"invalid scope: {scope}")
         return rule
 
+    def _finalize_rule(rule: Any, *, existing: Optional[Any] = None) -> Any:
+        rule = _normalize_rule(rule)
+        rule = _enforce_peer_rule(rule, existing=existing)
+        rule = _enforce_actor_action_kind(rule)
+        _validate_automation_rule_action_trigger(rule)
+        return rule
+
     applied_actions: List[Dict[str, Any]] = []
+    # Set by any action that may have changed rules/snippets; a clean batch skips the dump compare.
+    dirty = False
 
     try:
         for idx, raw_action in enumerate(actions):
             if not isinstance(raw_action, dict):
                 raise ValueError(f"action[{idx}] must be an object")
-            action_type = str(raw_action.get("type") or "").strip()
+            action_type = _clean_text(raw_action.get("type"))
             if not action_type:
                 raise ValueError(f"action[{idx}].type is required")
 
@@ -463,17 +589,14 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                     raise ValueError("create_rule requires rule")
                 _reject_legacy_automation_rule_shape(rule_raw, loc="action.create_rule.rule")
                 rule = AutomationRule.model_validate(rule_raw)
-                rid = str(rule.id or "").strip()
+                rid = _clean_text(rule.id)
                 if not rid:
                     raise ValueError("rule.id is required")
                 if rid in rules_by_id:
                     raise ValueError(f"rule already exists: {rid}")
-                rule = _normalize_rule(rule)
-                rule = _enforce_peer_rule(rule)
-                rule = _enforce_actor_action_kind(rule)
-                _validate_automation_rule_action_trigger(rule)
+                rule = _finalize_rule(rule)
                 rules_by_id[rid] = rule
-                rules_order.append(rid)
+                dirty = True
                 applied_actions.append({"type": action_type, "rule_id": rid})
                 continue
 
@@ -483,7 +606,7 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                     raise ValueError("update_rule requires rule")
                 _reject_legacy_automation_rule_shape(rule_raw, loc="action.update_rule.rule")
                 rule = AutomationRule.model_validate(rule_raw)
-                rid = str(rule.id or "").strip()
+                rid = _clean_text(rule.id)
                 if not rid:
                     raise ValueError("rule.id is required")
                 existing = rules_by_id.get(rid)
@@ -491,16 +614,15 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                     raise ValueError(f"rule not found: {rid}")
                 _enforce_peer_rule(existing)
                 _enforce_actor_action_kind(existing)
-                rule = _normalize_rule(rule)
-                rule = _enforce_peer_rule(rule, existing=existing)
-                rule = _enforce_actor_action_kind(rule)
-                _validate_automation_rule_action_trigger(rule)
-                rules_by_id[rid] = rule
+                rule = _finalize_rule(rule, existing=existing)
+                if rule != existing:
+                    rules_by_id[rid] = rule
+                    dirty = True
                 applied_actions.append({"type": action_type, "rule_id": rid})
                 continue
 
             if action_type == "set_rule_enabled":
-                rid = str(raw_action.get("rule_id") or "").strip()
+                rid = _clean_text(raw_action.get("rule_id"))
                 if not rid:
                     raise ValueError("set_rule_enabled requires rule_id")
                 existing = rules_by_id.get(rid)
@@ -509,12 +631,14 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                 _enforce_peer_rule(existing)
                 _enforce_actor_action_kind(existing)
                 enabled = coerce_bool(raw_action.get("enabled"), default=False)
-                rules_by_id[rid] = existing.model_copy(update={"enabled": bool(enabled)})
+                if bool(existing.enabled) != enabled:
+                    rules_by_id[rid] = existing.model_copy(update={"enabled": bool(enabled)})
+                    dirty = True
                 applied_actions.append({"type": action_type, "rule_id": rid, "enabled": bool(enabled)})
                 continue
 
             if action_type == "delete_rule":
-                rid = str(raw_action.get("rule_id") or "").strip()
+                rid = _clean_text(raw_action.get("rule_id"))
                 if not rid:
                     raise ValueError("delete_rule requires rule_id")
                 existing = rules_by_id.get(rid)
@@ -523,7 +647,7 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                 _enforce_peer_rule(existing)
                 _enforce_actor_action_kind(existing)
                 rules_by_id.pop(rid, None)
-                rules_order = [x for x in rules_order if x != rid]
+                dirty = True
                 applied_actions.append({"type": action_type, "rule_id": rid})
                 continue
 
@@ -533,46 +657,43 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
                 ruleset_raw = raw_action.get("ruleset")
                 if not isinstance(ruleset_raw, dict):
                     raise ValueError("replace_all_rules requires ruleset")
-                raw_rules = ruleset_raw.get("rules")
-                if isinstance(raw_rules, list):
-                    for i, raw_rule in enumerate(raw_rules):
-                        if isinstance(raw_rule, dict):
-                            _reject_legacy_automation_rule_shape(
-                                raw_rule,
-                                loc=f"action.replace_all_rules.ruleset.rules[{i}]",
-                            )
-                replacement = AutomationRuleSet.model_validate(ruleset_raw)
-                seen: set[str] = set()
-                new_order: list[str] = []
+                replacement = _validate_ruleset(ruleset_raw, loc="action.replace_all_rules.ruleset")
                 new_map: Dict[str, Any] = {}
                 for rule in replacement.rules:
-                    rid = str(rule.id or "").strip()
+                    rid = _clean_text(rule.id)
                     if not rid:
                         raise ValueError("rule.id is required")
-                    if rid in seen:
+                    if rid in new_map:
                         raise ValueError(f"duplicate rule id: {rid}")
-                    seen.add(rid)
-                    normalized = _normalize_rule(rule)
-                    normalized = _enforce_actor_action_kind(normalized)
-                    _validate_automation_rule_action_trigger(normalized)
-                    new_order.append(rid)
-                    new_map[rid] = normalized
-                rules_order = new_order
+                    # replace_all_rules is foreman/user-only, so the peer check is a passthrough here.
+                    new_map[rid] = _finalize_rule(rule)
                 rules_by_id = new_map
                 snippets = dict(replacement.snippets or {})
-                applied_actions.append({"type": action_type, "rules": len(rules_order), "snippets": len(snippets)})
+                dirty = True
+                applied_actions.append({"type": action_type, "rules": len(rules_by_id), "snippets": len(snippets)})
                 continue
 
             raise ValueError(f"unsupported action type: {action_type}")
     except Exception as e:
         return _error("group_automation_manage_failed", str(e))
 
-    next_rules = [rules_by_id[rid] for rid in rules_order if rid in rules_by_id]
+    next_rules = list(rules_by_id.values())
     next_ruleset = AutomationRuleSet(rules=next_rules, snippets=snippets)
 
-    changed = next_ruleset.model_dump() != current_ruleset.model_dump()
+    # A dirty batch can still net out (e.g. create then delete), so confirm against
+    # the stored form; the next dump is then written as-is.
+    next_rules_dump = _rules_storage_dump(next_ruleset) if dirty else []
+    changed = dirty and (
+        next_ruleset.snippets != current_ruleset.snippets or next_rules_dump != _rules_storage_dump(current_ruleset)
+    )
     if changed:
-        next_version = _set_automation_ruleset(group, ruleset=next_ruleset)
+        next_version = _set_automation_ruleset(
+            group,
+            ruleset=next_ruleset,
+            rules_dump=next_rules_dump,
+            previous=current_ruleset,
+            now=ctx.now,
+        )
         ev = append_event(
             group.ledger_path,
             kind="group.automation_update",
@@ -590,10 +711,22 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
         next_version = current_version
         ev = None
 
+    payload = (
+        _build_automation_payload(group, by=by, role=caller_role, now=ctx.now)
+        if changed
+        else _build_automation_payload(
+            group,
+            by=by,
+            role=caller_role,
+            ruleset=current_ruleset,
+            version=current_version,
+            now=ctx.now,
+        )
+    )
     return DaemonResponse(
         ok=True,
         result={
-            **_build_automation_payload(group, by=by),
+            **payload,
             "applied_actions": applied_actions,
             "changed": bool(changed),
             "event": ev,
@@ -601,35 +734,32 @@ def handle_group_automation_manage(args: Dict[str, Any]) -> DaemonResponse:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _baseline_ruleset() -> AutomationRuleSet:
+    # Built from code constants only; callers must copy before handing it out.
+    seed = default_automation_ruleset_doc()
+    return AutomationRuleSet.model_validate(
+        {
+            "rules": list(seed.get("rules", [])),
+            "snippets": default_automation_builtin_snippets(),
+        }
+    )
+
+
 def handle_group_automation_reset_baseline(args: Dict[str, Any]) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
-    expected_version, err = _parse_expected_version(args)
-    if err is not None:
-        return err
-    if not group_id:
-        return _error("missing_group_id", "missing group_id")
-    group = load_group(group_id)
-    if group is None:
-        return _error("group_not_found", f"group not found: {group_id}")
+    ctx = _prepare_ctx(args)
+    if isinstance(ctx, DaemonResponse):
+        return ctx
+    group = ctx.group
+    by = ctx.by
 
     try:
-        require_group_permission(group, by=by, action="group.settings_update")
-        current_version = _automation_version(group)
-        if expected_version is not None and expected_version != current_version:
-            return _error(
-                "version_conflict",
-                "automation version mismatch",
-                details={"expected_version": expected_version, "current_version": current_version},
-            )
-        seed = default_automation_ruleset_doc()
-        baseline = AutomationRuleSet.model_validate(
-            {
-                "rules": list(seed.get("rules", [])),
-                "snippets": default_automation_builtin_snippets(),
-            }
-        )
-        next_version = _set_automation_ruleset(group, ruleset=baseline)
+        ctx.require_group_permission("group.settings_update")
+        conflict = ctx.version_conflict()
+        if conflict is not None:
+            return conflict
+        baseline = _baseline_ruleset().model_copy(deep=True)
+        next_version = _set_automation_ruleset(group, ruleset=baseline, previous=ctx.current_ruleset, now=ctx.now)
     except Exception as e:
         return _error("group_automation_reset_baseline_failed", str(e))
 
@@ -649,7 +779,7 @@ def handle_group_automation_reset_baseline(args: Dict[str, Any]) -> DaemonRespon
     return DaemonResponse(
         ok=True,
         result={
-            **_build_automation_payload(group, by=by),
+            **_build_automation_payload(group, by=by, role=ctx.caller_role, now=ctx.now),
             "event": ev,
         },
     )
@@ -134,7 +134,8 @@ def _load_state(group: Group) -> Dict[str, Any]:
 
 def _save_state(group: Group, doc: Dict[str, Any]) -> None:
     doc["updated_at"] = utc_now_iso()
-    atomic_write_json(_state_path(group), doc)
+    # Machine-only state rewritten on every tick; keep it compact.
+    atomic_write_json(_state_path(group), doc, indent=None)
 
 
 def _read_help_ledger_events(group: Group, start_pos: int) -> Tuple[int, List[Dict[str, Any]]]:
@@ -426,9 +427,16 @@ def _rule_next_fire_at(rule: AutomationRule, rule_state: Dict[str, Any], *, now_
     return None
 
 
-def build_automation_status(group: Group, *, now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+def build_automation_status(
+    group: Group,
+    *,
+    now: Optional[datetime] = None,
+    ruleset: Optional[AutomationRuleSet] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Per-rule status; pass ruleset when the caller already holds _load_ruleset(group)."""
     now_utc = now.astimezone(timezone.utc) if isinstance(now, datetime) else datetime.now(timezone.utc)
-    ruleset = _load_ruleset(group)
+    if ruleset is None:
+        ruleset = _load_ruleset(group)
     state = _load_state(group)
     rules_state = state.get("rules") if isinstance(state.get("rules"), dict) else {}
 
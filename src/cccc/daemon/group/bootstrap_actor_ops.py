@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Collection, Dict, Optional
 
 from ...kernel.context import ContextStorage
 from ...kernel.actors import is_internal_actor, is_supported_internal_actor, list_actors
@@ -36,7 +36,7 @@ def autostart_running_groups(
     *,
     effective_runner_kind: Callable[[str], str],
     find_scope_url: Callable[[Any, str], str],
-    supported_runtimes: tuple[str, ...],
+    supported_runtimes: Collection[str],
     ensure_mcp_installed: Callable[..., bool],
     auto_mcp_runtimes: tuple[str, ...],
     pty_supported: Optional[Callable[[], bool]] = None,
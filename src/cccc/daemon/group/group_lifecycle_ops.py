@@ -135,7 +135,7 @@ def handle_group_start(
                     find_scope_url=find_scope_url,
                     effective_runner_kind=effective_runner_kind,
                     normalize_runtime_command=normalize_runtime_command,
-                    supported_runtimes=list(supported_runtimes),
+                    supported_runtimes=supported_runtimes,
                     caller_id=str(args.get("caller_id") or "").strip(),
                     is_admin=coerce_bool(args.get("is_admin"), default=False),
                     resolve_linked_actor_before_start=resolve_before_start,
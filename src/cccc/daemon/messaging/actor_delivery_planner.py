@@ -48,8 +48,13 @@ def plan_actor_chat_delivery(
     codex_headless_running: Callable[[str, str], bool],
     claude_headless_running: Callable[[str, str], bool],
     web_model_browser_delivery_enabled: Optional[Callable[[str, dict[str, Any]], bool]] = None,
+    recipients: Optional[set[str]] = None,
 ) -> ActorDeliveryDecision:
-    """Decide how one actor should receive one canonical chat event."""
+    """Decide how one actor should receive one canonical chat event.
+
+    recipients, when given, is resolve_recipient_actor_ids() for the event with
+    effective_to applied; it replaces the per-actor targeting check.
+    """
 
     actor_id = str(actor.get("id") or "").strip() if isinstance(actor, dict) else ""
     if not actor_id:
@@ -59,8 +64,11 @@ def plan_actor_chat_delivery(
     if actor_id == str(by or "").strip():
         return ActorDeliveryDecision(actor_id=actor_id, transport=TRANSPORT_SKIP, reason="sender")
 
-    effective_event = event_with_effective_to(event, effective_to)
-    if not is_message_for_actor(group, actor_id=actor_id, event=effective_event):
+    if recipients is not None:
+        targeted = actor_id in recipients
+    else:
+        targeted = is_message_for_actor(group, actor_id=actor_id, event=event_with_effective_to(event, effective_to))
+    if not targeted:
         return ActorDeliveryDecision(actor_id=actor_id, transport=TRANSPORT_SKIP, reason="not_targeted")
 
     runtime = str(actor.get("runtime") or "codex").strip() or "codex"
@@ -16,6 +16,11 @@ from ...kernel.peer_insight import PEER_PERSPECTIVE_AGENT_LABEL, append_peer_per
 from .inbound_rendering import ActorInboundEnvelope, render_actor_inbound_message
 from .local_group_route import render_local_group_route_ref
 
+_ATTACHMENTS_HEADER = (
+    '[cccc] Attachments: use cccc_file(action="read", rel_path=...) for text; '
+    'use action="blob_path" for binary/local tools.'
+)
+
 
 def compact_delivery_text(value: Any, *, limit: int) -> str:
     text = re.sub(r"\s+", " ", str(value or "").strip())
@@ -211,22 +216,26 @@ def build_actor_delivery_text(
         prefix_lines.append(f"[cccc] REMOTE REPLY DEFAULT: omit to in cccc_message_reply to reply to remote {target_text}.")
     if prefix_lines:
         delivery_text = "\n".join(prefix_lines) + "\n" + delivery_text
+    # Reference and attachment sections are joined onto the body in one pass.
+    sections: list[str] = []
     ref_lines = render_delivery_refs(refs)
     if ref_lines:
-        delivery_text = (delivery_text.rstrip("\n") + "\n\n" + "\n".join(ref_lines)).strip()
+        sections.append("\n".join(ref_lines))
     if attachments:
-        lines = [
-            '[cccc] Attachments: use cccc_file(action="read", rel_path=...) for text; '
-            'use action="blob_path" for binary/local tools.'
-        ]
+        lines = [_ATTACHMENTS_HEADER]
         for attachment in attachments[:8]:
-            title = str(attachment.get("title") or attachment.get("path") or "file").strip()
-            size_bytes = int(attachment.get("bytes") or 0)
-            rel_path = str(attachment.get("path") or "").strip()
+            path = attachment.get("path")
+            title = attachment.get("title") or path or "file"
+            title = title.strip() if isinstance(title, str) else str(title).strip()
+            size_raw = attachment.get("bytes")
+            size_bytes = size_raw if type(size_raw) is int else int(size_raw or 0)
+            rel_path = path.strip() if isinstance(path, str) else str(path or "").strip()
             lines.append(f"- {title} ({size_bytes} bytes) [{rel_path}]")
         if len(attachments) > 8:
             lines.append(f"- … ({len(attachments) - 8} more)")
-        delivery_text = (delivery_text.rstrip("\n") + "\n\n" + "\n".join(lines)).strip()
+        sections.append("\n".join(lines))
+    if sections:
+        delivery_text = "\n\n".join([delivery_text.rstrip("\n"), *sections]).strip()
     return append_peer_perspective(delivery_text, insight, label=PEER_PERSPECTIVE_AGENT_LABEL)
 
 
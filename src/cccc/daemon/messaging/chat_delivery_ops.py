@@ -10,7 +10,8 @@ import logging
 from typing import Any, Callable, Optional
 
 from ...contracts.v1 import SystemNotifyData
-from ...kernel.actors import find_actor, list_actors
+from ...kernel.actors import list_actors
+from ...kernel.inbox import resolve_recipient_actor_ids
 from ..actors.runner_ops import _effective_runner_kind as default_effective_runner_kind
 from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
 from ..codex_app_sessions import SUPERVISOR as codex_app_supervisor
@@ -28,9 +29,9 @@ from ..actors.web_model_browser_delivery import schedule_web_model_browser_deliv
 from .chat_support_ops import schedule_headless_post_wake_delivery
 from .delivery import (
     append_mcp_reply_reminder,
-    emit_system_notify,
+    emit_system_notifies,
     get_headless_targets_for_message,
-    queue_chat_message,
+    queue_chat_messages_batch,
     request_flush_pending_messages,
 )
 
@@ -44,9 +45,20 @@ def notify_headless_targets(
     reply_required: bool,
     event: dict[str, Any],
     skip_actor_ids: Optional[set[str]] = None,
+    actors: Optional[list[dict[str, Any]]] = None,
+    recipients: Optional[set[str]] = None,
 ) -> None:
     try:
-        headless_targets = get_headless_targets_for_message(group, event=event, by=by)
+        if actors is None:
+            actors = list_actors(group)
+        actors_by_id = {str(actor.get("id") or ""): actor for actor in actors if isinstance(actor, dict)}
+        headless_targets = get_headless_targets_for_message(
+            group,
+            event=event,
+            by=by,
+            actors=actors,
+            recipients=recipients,
+        )
         skip_ids = {str(item).strip() for item in (skip_actor_ids or set()) if str(item).strip()}
         if reply_required:
             notify_title = "Need reply"
@@ -54,25 +66,26 @@ def notify_headless_targets(
         else:
             notify_title = "Needs acknowledgement" if priority == "attention" else "New message"
             notify_priority = "urgent" if priority == "attention" else "high"
+        # Validate the shared payload once; per-target copies only swap target_actor_id.
+        template = SystemNotifyData(
+            kind="info",
+            priority=notify_priority,
+            title=notify_title,
+            message=f"New message from {by}. Check your inbox.",
+            requires_ack=False,
+            context={"event_id": event_id, "from": by},
+        )
+        notifies: list[SystemNotifyData] = []
         for actor_id in headless_targets:
             if actor_id in skip_ids:
                 continue
-            actor = find_actor(group, actor_id)
+            actor = actors_by_id.get(actor_id)
             if isinstance(actor, dict) and str(actor.get("runtime") or "").strip().lower() == "web_model":
                 continue
-            emit_system_notify(
-                group,
-                by="system",
-                notify=SystemNotifyData(
-                    kind="info",
-                    priority=notify_priority,
-                    title=notify_title,
-                    message=f"New message from {by}. Check your inbox.",
-                    target_actor_id=actor_id,
-                    requires_ack=False,
-                    context={"event_id": event_id, "from": by},
-                ),
-            )
+            notifies.append(template.model_copy(update={"target_actor_id": actor_id}))
+        # One ledger append for all targets; each event is still dispatched to its own actor.
+        if notifies:
+            emit_system_notifies(group, by="system", notifies=notifies)
     except Exception:
         pass
 
@@ -104,9 +117,15 @@ def deliver_chat_message(
     source_user_id: str = "",
 ) -> None:
     skip_headless_notify_actor_ids: set[str] = set()
+    pty_deliveries: list[dict[str, Any]] = []
     clean_reply_to = str(reply_to or "").strip()
     clean_attachments = [item for item in (attachments or []) if isinstance(item, dict)]
-    for actor in list_actors(group):
+    # One traversal of the actor list serves both the delivery loop and headless notify.
+    actors = list_actors(group)
+    # Built once: targeting and headless notify both read this copy; the appended event stays untouched.
+    effective_event = event_with_effective_to(event, effective_to)
+    recipients = resolve_recipient_actor_ids(group, effective_event, actors=actors)
+    for actor in actors:
         if not isinstance(actor, dict):
             continue
         decision = plan_actor_chat_delivery(
@@ -119,6 +138,7 @@ def deliver_chat_message(
             codex_headless_running=codex_actor_running,
             claude_headless_running=claude_actor_running,
             web_model_browser_delivery_enabled=web_model_browser_delivery_enabled,
+            recipients=recipients,
         )
         actor_id = decision.actor_id
         if decision.transport in {TRANSPORT_CODEX_HEADLESS, TRANSPORT_CODEX_APP_SERVER}:
@@ -165,8 +185,7 @@ def deliver_chat_message(
                 kwargs["source_platform"] = source_platform or None
                 kwargs["source_user_name"] = source_user_name or None
                 kwargs["source_user_id"] = source_user_id or None
-            queue_chat_message(group, **kwargs)
-            request_flush_pending_messages(group, actor_id=actor_id)
+            pty_deliveries.append(kwargs)
         elif decision.transport == TRANSPORT_WEB_MODEL_BROWSER:
             if schedule_web_model_browser_delivery(
                 group_id=group.group_id,
@@ -195,14 +214,21 @@ def deliver_chat_message(
         else:
             logger.debug("[chat-delivery] skip actor=%s (%s)", actor_id, decision.reason)
 
+    if pty_deliveries:
+        queue_chat_messages_batch(group, pty_deliveries)
+        for item in pty_deliveries:
+            request_flush_pending_messages(group, actor_id=item["actor_id"])
+
     notify_headless_targets(
         group=group,
         by=by,
         event_id=event_id,
         priority=priority,
         reply_required=reply_required,
-        event=event_with_effective_to(event, effective_to),
+        event=effective_event,
         skip_actor_ids=skip_headless_notify_actor_ids,
+        actors=actors,
+        recipients=recipients,
     )
 
 
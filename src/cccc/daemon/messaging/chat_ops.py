@@ -22,7 +22,7 @@ from ...kernel.group import get_group_state, load_group, set_group_state
 from ...kernel.chat_idempotency import find_existing_reply_result
 from ...kernel.inbox import find_event_with_chat_ack, is_message_for_actor
 from ...kernel.context import ContextStorage
-from ...kernel.ledger import append_event, read_last_lines
+from ...kernel.ledger import append_event, append_events, read_last_lines
 from ...kernel.blobs import store_blob_bytes
 from ...kernel.messaging import (
     default_reply_recipients,
@@ -39,6 +39,7 @@ from ...kernel.peer_insight import (
 )
 from ...kernel.message_sender_snapshot import build_sender_snapshot
 from ...kernel.scope import detect_scope
+from ...util.conv import arg_str
 from ...util.time import utc_now_iso
 from ..group_bridge.reply_relay import (
     can_relay_group_bridge_reply,
@@ -73,6 +74,7 @@ def _normalize_suggested_user_message(value: Any) -> Optional[str]:
 def _error(code: str, message: str, *, details: Optional[Dict[str, Any]] = None) -> DaemonResponse:
     return DaemonResponse(ok=False, error=DaemonError(code=code, message=message, details=(details or {})))
 
+
 def _wake_group_on_human_message(
     group: Any,
     *,
@@ -82,14 +84,16 @@ def _wake_group_on_human_message(
     clear_pending_system_notifies: Callable[[str, set[str]], None],
 ) -> Any:
     # Keep idle stable against agent chatter / throttled deliveries.
+    # Cheapest checks first: agent chatter should not pay for the actor lookup.
+    if not by or by == "system":
+        return group
     try:
         accept_state = str(state_at_accept or "").strip().lower()
         if accept_state and accept_state != "idle":
             return group
         if get_group_state(group) != "idle":
             return group
-        is_actor_sender = isinstance(find_actor(group, by), dict)
-        if not by or by == "system" or is_actor_sender:
+        if isinstance(find_actor(group, by), dict):
             return group
         group = set_group_state(group, state="active")
         try:
@@ -284,21 +288,21 @@ def handle_send(
     clear_pending_system_notifies: Callable[[str, set[str]], None],
     diagnostics_enabled: Callable[[], bool] | None = None,
 ) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
+    group_id = arg_str(args, "group_id")
     text = str(args.get("text") or "")
-    by = str(args.get("by") or "user").strip()
-    priority = str(args.get("priority") or "normal").strip() or "normal"
+    by = arg_str(args, "by", "user")
+    priority = arg_str(args, "priority", "normal") or "normal"
     reply_required = coerce_bool(args.get("reply_required"))
-    reply_to = str(args.get("reply_to") or "").strip()
-    quote_text = str(args.get("quote_text") or "").strip()
-    src_group_id = str(args.get("src_group_id") or "").strip()
-    src_event_id = str(args.get("src_event_id") or "").strip()
-    dst_group_id = str(args.get("dst_group_id") or "").strip()
-    client_id = str(args.get("client_id") or "").strip()
+    reply_to = arg_str(args, "reply_to")
+    quote_text = arg_str(args, "quote_text")
+    src_group_id = arg_str(args, "src_group_id")
+    src_event_id = arg_str(args, "src_event_id")
+    dst_group_id = arg_str(args, "dst_group_id")
+    client_id = arg_str(args, "client_id")
     suggested_user_message = _normalize_suggested_user_message(args.get("suggested_user_message"))
-    source_platform = str(args.get("source_platform") or "").strip()
-    source_user_name = str(args.get("source_user_name") or "").strip()
-    source_user_id = str(args.get("source_user_id") or "").strip()
+    source_platform = arg_str(args, "source_platform")
+    source_user_name = arg_str(args, "source_user_name")
+    source_user_id = arg_str(args, "source_user_id")
     source_multiaddrs_raw = args.get("source_multiaddrs")
     source_multiaddrs = (
         [str(item).strip() for item in source_multiaddrs_raw if str(item).strip()]
@@ -321,14 +325,14 @@ def handle_send(
     dst_to_raw = args.get("dst_to")
     dst_to: list[str] = []
     if isinstance(dst_to_raw, list):
-        dst_to = [str(x).strip() for x in dst_to_raw if isinstance(x, str) and str(x).strip()]
+        dst_to = [token for token in (x.strip() for x in dst_to_raw if isinstance(x, str)) if token]
     if (src_group_id and not src_event_id) or (src_event_id and not src_group_id):
         src_group_id = ""
         src_event_id = ""
     to_raw = args.get("to")
     to_tokens: list[str] = []
     if isinstance(to_raw, list):
-        to_tokens = [str(x).strip() for x in to_raw if isinstance(x, str) and str(x).strip()]
+        to_tokens = [token for token in (x.strip() for x in to_raw if isinstance(x, str)) if token]
     elif isinstance(to_raw, str):
         token = to_raw.strip()
         if token:
@@ -793,13 +797,13 @@ def handle_reply(
     clear_pending_system_notifies: Callable[[str, set[str]], None],
     diagnostics_enabled: Callable[[], bool] | None = None,
 ) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
+    group_id = arg_str(args, "group_id")
     text = str(args.get("text") or "")
-    by = str(args.get("by") or "user").strip()
-    reply_to = str(args.get("reply_to") or "").strip()
-    priority = str(args.get("priority") or "normal").strip() or "normal"
+    by = arg_str(args, "by", "user")
+    reply_to = arg_str(args, "reply_to")
+    priority = arg_str(args, "priority", "normal") or "normal"
     reply_required = coerce_bool(args.get("reply_required"))
-    client_id = str(args.get("client_id") or "").strip()
+    client_id = arg_str(args, "client_id")
     suggested_user_message = _normalize_suggested_user_message(args.get("suggested_user_message"))
     diag = make_chat_diagnostics(
         op="reply",
@@ -812,7 +816,7 @@ def handle_reply(
     to_raw = args.get("to")
     to_tokens: list[str] = []
     if isinstance(to_raw, list):
-        to_tokens = [str(x).strip() for x in to_raw if isinstance(x, str) and str(x).strip()]
+        to_tokens = [token for token in (x.strip() for x in to_raw if isinstance(x, str)) if token]
     to_explicitly_set = bool(to_tokens)
 
     if priority not in ("normal", "attention"):
@@ -959,34 +963,60 @@ def handle_reply(
         else ""
     )
 
-    event = append_event(
-        group.ledger_path,
-        kind="chat.message",
-        group_id=group.group_id,
-        scope_key=scope_key,
-        by=by,
-        data=ChatMessageData(
-            text=text,
-            format="plain",
-            insight=insight,
-            priority=priority,
-            reply_required=reply_required,
-            to=to,
-            reply_to=target_event_id or reply_to,
-            quote_text=quote_text,
-            refs=refs,
-            attachments=attachments,
-            source_platform=original_source_platform or None,
-            source_user_name=original_source_user_name or None,
-            source_user_id=original_source_user_id or None,
-            mention_user_ids=original_mention_user_ids or None,
-            dst_group_id=group_bridge_remote_group_id or None,
-            dst_to=group_bridge_remote_to or None,
-            **build_sender_snapshot(group, by=by),
-            client_id=client_id or None,
-            suggested_user_message=suggested_user_message,
-        ).model_dump(),
-    )
+    # The attention ack (if any) is decided up front so it lands with the reply in one ledger append.
+    wants_ack = False
+    try:
+        if str(original.get("kind") or "") == "chat.message":
+            original_by = str(original.get("by") or "").strip()
+            original_priority = str(original_data.get("priority") or "normal").strip()
+            if by and by != original_by and original_priority == "attention":
+                if is_message_for_actor(group, actor_id=by, event=original):
+                    wants_ack = bool(target_event_id and not existing_ack)
+    except Exception:
+        wants_ack = False
+
+    ledger_entries: list[dict[str, Any]] = [
+        {
+            "kind": "chat.message",
+            "group_id": group.group_id,
+            "scope_key": scope_key,
+            "by": by,
+            "data": ChatMessageData(
+                text=text,
+                format="plain",
+                insight=insight,
+                priority=priority,
+                reply_required=reply_required,
+                to=to,
+                reply_to=target_event_id or reply_to,
+                quote_text=quote_text,
+                refs=refs,
+                attachments=attachments,
+                source_platform=original_source_platform or None,
+                source_user_name=original_source_user_name or None,
+                source_user_id=original_source_user_id or None,
+                mention_user_ids=original_mention_user_ids or None,
+                dst_group_id=group_bridge_remote_group_id or None,
+                dst_to=group_bridge_remote_to or None,
+                **build_sender_snapshot(group, by=by),
+                client_id=client_id or None,
+                suggested_user_message=suggested_user_message,
+            ).model_dump(),
+        }
+    ]
+    if wants_ack:
+        ledger_entries.append(
+            {
+                "kind": "chat.ack",
+                "group_id": group.group_id,
+                "scope_key": "",
+                "by": by,
+                "data": {"actor_id": by, "event_id": target_event_id},
+            }
+        )
+    appended = append_events(group.ledger_path, ledger_entries)
+    event = appended[0]
+    ack_event: Optional[dict[str, Any]] = appended[1] if len(appended) > 1 else None
     diag.mark("append_event")
     group_bridge_reply_result = relay_group_bridge_reply(
         group_id=group.group_id,
@@ -1004,26 +1034,6 @@ def handle_reply(
     )
     diag.mark("group_bridge_reply")
 
-    ack_event: Optional[dict[str, Any]] = None
-    try:
-        if str(original.get("kind") or "") == "chat.message":
-            original_by = str(original.get("by") or "").strip()
-            original_data = original.get("data") if isinstance(original.get("data"), dict) else {}
-            original_priority = str(original_data.get("priority") or "normal").strip()
-            if by and by != original_by and original_priority == "attention":
-                if is_message_for_actor(group, actor_id=by, event=original):
-                    if target_event_id and not existing_ack:
-                        ack_event = append_event(
-                            group.ledger_path,
-                            kind="chat.ack",
-                            group_id=group.group_id,
-                            scope_key="",
-                            by=by,
-                            data={"actor_id": by, "event_id": target_event_id},
-                        )
-    except Exception:
-        ack_event = None
-
     effective_to = to if to else ["@all"]
     event_id = str(event.get("id") or "").strip()
     event_ts = str(event.get("ts") or "").strip()
@@ -1190,7 +1200,7 @@ def handle_stream_emit(args: Dict[str, Any]) -> DaemonResponse:
     to_raw = args.get("to")
     to: list[str] = []
     if isinstance(to_raw, list):
-        to = [str(x).strip() for x in to_raw if isinstance(x, str) and str(x).strip()]
+        to = [token for token in (x.strip() for x in to_raw if isinstance(x, str)) if token]
     reply_to = str(args.get("reply_to") or "").strip() or None
     client_id = str(args.get("client_id") or "").strip() or None
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
-from .post_commit import run_chat_post_commit
+from .post_commit import run_group_chat_post_commit
 
 
 def schedule_chat_side_effects(
@@ -12,4 +12,11 @@ def schedule_chat_side_effects(
     group: Any,
     automation_on_new_message: Callable[[Any], None],
 ) -> None:
-    run_chat_post_commit("chat-automation", lambda: automation_on_new_message(group))
+    # One FIFO lane per group instead of a fresh thread per message; kept apart
+    # from the delivery lane so automation never waits behind actor delivery.
+    group_id = str(getattr(group, "group_id", "") or "").strip() or "global"
+    run_group_chat_post_commit(
+        f"{group_id}:automation",
+        "chat-automation",
+        lambda: automation_on_new_message(group),
+    )
@@ -35,7 +35,7 @@ from ...kernel.actors import find_actor, list_actors
 from ...kernel.delivery_policy import auto_mark_on_delivery_from_doc
 from ...kernel.group import Group, get_group_state, load_group, set_group_state
 from ...kernel.inbox import cursor_covers_event, get_cursor, is_message_for_actor, set_cursor
-from ...kernel.ledger import append_event
+from ...kernel.ledger import append_event, append_events
 from ...kernel.runtime import (
     build_prompt_assisted_mcp_setup_prompt,
     runtime_uses_prompt_assisted_mcp_setup,
@@ -343,25 +343,61 @@ class DeliveryThrottle:
         notify_message: str = "",
     ) -> None:
         """Queue a message for delivery."""
+        self.queue_messages(
+            group_id,
+            [
+                {
+                    "actor_id": actor_id,
+                    "event_id": event_id,
+                    "by": by,
+                    "to": to,
+                    "text": text,
+                    "reply_to": reply_to,
+                    "quote_text": quote_text,
+                    "source_platform": source_platform,
+                    "source_user_name": source_user_name,
+                    "source_user_id": source_user_id,
+                    "ts": ts,
+                    "kind": kind,
+                    "notify_kind": notify_kind,
+                    "notify_title": notify_title,
+                    "notify_message": notify_message,
+                }
+            ],
+        )
+
+    def queue_messages(self, group_id: str, deliveries: List[Dict[str, Any]]) -> None:
+        """Queue several messages under a single lock acquisition.
+
+        Each delivery carries ``actor_id`` plus the keyword fields accepted by
+        ``queue_message``; per-actor ordering follows the input order.
+        """
+        if not deliveries:
+            return
+        default_ts = utc_now_iso()
         with self._lock:
-            state = self._get_state(group_id, actor_id)
-            logger.debug(f"[THROTTLE] queue_message: {group_id}/{actor_id} event={event_id} text={text[:50]!r} pending_before={len(state.pending_messages)}")
-            state.pending_messages.append(PendingMessage(
-                event_id=event_id,
-                by=by,
-                to=to,
-                text=text,
-                reply_to=reply_to,
-                quote_text=quote_text,
-                source_platform=source_platform,
-                source_user_name=source_user_name,
-                source_user_id=source_user_id,
-                ts=ts or utc_now_iso(),
-                kind=kind,
-                notify_kind=notify_kind,
-                notify_title=notify_title,
-                notify_message=notify_message,
-            ))
+            for item in deliveries:
+                actor_id = str(item.get("actor_id") or "")
+                event_id = str(item.get("event_id") or "")
+                text = str(item.get("text") or "")
+                state = self._get_state(group_id, actor_id)
+                logger.debug(f"[THROTTLE] queue_message: {group_id}/{actor_id} event={event_id} text={text[:50]!r} pending_before={len(state.pending_messages)}")
+                state.pending_messages.append(PendingMessage(
+                    event_id=event_id,
+                    by=str(item.get("by") or ""),
+                    to=item.get("to") or [],
+                    text=text,
+                    reply_to=item.get("reply_to"),
+                    quote_text=item.get("quote_text"),
+                    source_platform=item.get("source_platform"),
+                    source_user_name=item.get("source_user_name"),
+                    source_user_id=item.get("source_user_id"),
+                    ts=str(item.get("ts") or "") or default_ts,
+                    kind=str(item.get("kind") or "chat.message"),
+                    notify_kind=str(item.get("notify_kind") or ""),
+                    notify_title=str(item.get("notify_title") or ""),
+                    notify_message=str(item.get("notify_message") or ""),
+                ))
     
     def should_deliver(self, group_id: str, actor_id: str, min_interval_seconds: int) -> bool:
         """Check if we should deliver messages now."""
@@ -916,6 +952,17 @@ def queue_chat_message(
     )
 
 
+def queue_chat_messages_batch(group: Group, deliveries: List[Dict[str, Any]]) -> None:
+    """Queue chat messages for several actors in one throttle update.
+
+    Each delivery uses the keyword arguments of ``queue_chat_message``.
+    """
+    THROTTLE.queue_messages(
+        group.group_id,
+        [{**item, "kind": "chat.message"} for item in deliveries],
+    )
+
+
 def queue_system_notify(
     group: Group,
     *,
@@ -1037,23 +1084,13 @@ def dispatch_system_notify_event_to_actor(
     return bool(flush_pending_messages(group, actor_id=aid))
 
 
-def emit_system_notify(
+def _dispatch_emitted_system_notify(
     group: Group,
     *,
-    by: str,
+    event: Dict[str, Any],
     notify: SystemNotifyData,
-    async_flush: bool = False,
-) -> Dict[str, Any]:
-    """Append a system.notify event and dispatch it to running runtime targets."""
-    event = append_event(
-        group.ledger_path,
-        kind="system.notify",
-        group_id=group.group_id,
-        scope_key="",
-        by=str(by or "system").strip() or "system",
-        data=notify.model_dump(),
-    )
-
+    async_flush: bool,
+) -> None:
     target_actor_id = str(notify.target_actor_id or "").strip()
     if target_actor_id:
         target_actor_ids = [target_actor_id]
@@ -1070,14 +1107,51 @@ def emit_system_notify(
             target_actor_ids.append(aid)
 
     event_id = str(event.get("id") or "").strip()
-    event_ts = str(event.get("ts") or "").strip()
     if not event_id:
-        return event
+        return
 
     for aid in target_actor_ids:
         dispatch_system_notify_event_to_actor(group, event=event, actor_id=aid, async_flush=async_flush)
 
-    return event
+
+def emit_system_notify(
+    group: Group,
+    *,
+    by: str,
+    notify: SystemNotifyData,
+    async_flush: bool = False,
+) -> Dict[str, Any]:
+    """Append a system.notify event and dispatch it to running runtime targets."""
+    return emit_system_notifies(group, by=by, notifies=[notify], async_flush=async_flush)[0]
+
+
+def emit_system_notifies(
+    group: Group,
+    *,
+    by: str,
+    notifies: List[SystemNotifyData],
+    async_flush: bool = False,
+) -> List[Dict[str, Any]]:
+    """Append several system.notify events in one ledger write, then dispatch each."""
+    if not notifies:
+        return []
+    clean_by = str(by or "system").strip() or "system"
+    events = append_events(
+        group.ledger_path,
+        [
+            {
+                "kind": "system.notify",
+                "group_id": group.group_id,
+                "scope_key": "",
+                "by": clean_by,
+                "data": notify.model_dump(),
+            }
+            for notify in notifies
+        ],
+    )
+    for event, notify in zip(events, notifies):
+        _dispatch_emitted_system_notify(group, event=event, notify=notify, async_flush=async_flush)
+    return events
 
 
 def _finalize_delivery_success(
@@ -1473,15 +1547,19 @@ def get_headless_targets_for_message(
     *,
     event: Dict[str, Any],
     by: str,
+    actors: Optional[List[Dict[str, Any]]] = None,
+    recipients: Optional[set[str]] = None,
 ) -> List[str]:
     """Return headless actor_ids that should be notified for a message.
 
     This function only computes targets; the daemon server performs any writes.
+    actors may pass a list_actors(group) result the caller already holds, and
+    recipients a resolve_recipient_actor_ids() result for this event.
     """
     targets: List[str] = []
     
     pty_supported = bool(getattr(pty_runner, "PTY_SUPPORTED", True))
-    for actor in list_actors(group):
+    for actor in (actors if actors is not None else list_actors(group)):
         if not isinstance(actor, dict):
             continue
         aid = str(actor.get("id") or "").strip()
@@ -1494,7 +1572,10 @@ def get_headless_targets_for_message(
             continue
         
         # Check delivery/visibility rules
-        if not is_message_for_actor(group, actor_id=aid, event=event):
+        if recipients is not None:
+            if aid not in recipients:
+                continue
+        elif not is_message_for_actor(group, actor_id=aid, event=event):
             continue
         
         targets.append(aid)
@@ -7,7 +7,9 @@ from dataclasses import dataclass
 import logging
 import threading
 import time
-from typing import Callable, Deque, Dict
+from typing import Callable, Deque, Dict, TypeVar
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -36,9 +38,51 @@ class KeyedPostCommitLanes:
                 self._running.add(lane_key)
                 should_start = True
 
-        if not should_start:
-            return
+        if should_start:
+            self._start_drain(lane_key)
+
+    def run_exclusive(self, key: str, label: str, fn: Callable[[], _T]) -> _T:
+        """Run ``fn`` on the caller's thread once work already queued on ``key`` drains.
+
+        Work submitted while ``fn`` runs waits behind it. Exceptions propagate.
+        """
+        lane_key = str(key or "global").strip() or "global"
+        with self._condition:
+            idle = lane_key not in self._running
+            if idle:
+                self._running.add(lane_key)
+        if idle:
+            try:
+                return fn()
+            finally:
+                self._release(lane_key)
+
+        # Park the lane's drain thread behind a hand-off task until fn is done.
+        ready = threading.Event()
+        finished = threading.Event()
+
+        def _hand_off() -> None:
+            ready.set()
+            finished.wait()
+
+        self.submit(lane_key, label, _hand_off)
+        ready.wait()
+        try:
+            return fn()
+        finally:
+            finished.set()
+
+    def _release(self, lane_key: str) -> None:
+        with self._condition:
+            should_start = bool(self._pending.get(lane_key))
+            if not should_start:
+                self._pending.pop(lane_key, None)
+                self._running.discard(lane_key)
+                self._condition.notify_all()
+        if should_start:
+            self._start_drain(lane_key)
 
+    def _start_drain(self, lane_key: str) -> None:
         thread = threading.Thread(
             target=self._drain,
             args=(lane_key,),
@@ -7,8 +7,8 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
 from ...contracts.v1 import DaemonError, DaemonResponse
-from ...kernel.actors import find_actor, get_effective_role, list_actors
-from ...kernel.group import load_group
+from ...kernel.actors import find_actor, get_effective_role, get_effective_roles, list_actors
+from ...kernel.group import load_group_cached
 from ...kernel.settings import get_remote_access_settings, resolve_remote_access_web_binding
 from ...kernel.terminal_transcript_filter import strip_codex_working_status_lines
 from ...kernel.terminal_transcript import get_terminal_transcript_settings
@@ -27,7 +27,7 @@ from ...runners import pty as pty_runner
 from ...util.terminal_render import render_transcript
 from ..claude_app_sessions import SUPERVISOR as claude_app_supervisor
 from ..codex_app_sessions import SUPERVISOR as codex_app_supervisor
-from ...util.conv import coerce_bool
+from ...util.conv import arg_str, coerce_bool
 from ...util.process import pid_is_alive
 from ...util.time import utc_now_iso
 from ... import __version__
@@ -146,9 +146,9 @@ def handle_debug_snapshot(
 ) -> DaemonResponse:
     if not developer_mode_enabled():
         return _error("developer_mode_required", "developer mode is disabled")
-    group_id = str(args.get("group_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
-    group = load_group(group_id) if group_id else None
+    group_id = arg_str(args, "group_id")
+    by = arg_str(args, "by", "user")
+    group = load_group_cached(group_id) if group_id else None
     if group_id and group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if group is not None and by and by != "user":
@@ -177,6 +177,17 @@ def handle_debug_snapshot(
                 "title": str(group.doc.get("title") or ""),
             }
             actors = []
+            # Resolve roles and runner liveness once for the group, then look up per actor.
+            roles = get_effective_roles(group)
+            try:
+                pty_running = pty_runner.SUPERVISOR.actors_running(group.group_id)
+            except Exception:
+                pty_running = set()
+            try:
+                headless_running = headless_runner.SUPERVISOR.actors_running(group.group_id)
+            except Exception:
+                headless_running = set()
+            runner_effective_by_kind: Dict[str, str] = {}
             for actor in list_actors(group):
                 if not isinstance(actor, dict):
                     continue
@@ -184,13 +195,16 @@ def handle_debug_snapshot(
                 if not aid:
                     continue
                 runner_kind = str(actor.get("runner") or "pty")
-                runner_effective = effective_runner_kind(runner_kind)
+                runner_effective = runner_effective_by_kind.get(runner_kind)
+                if runner_effective is None:
+                    runner_effective = effective_runner_kind(runner_kind)
+                    runner_effective_by_kind[runner_kind] = runner_effective
                 runtime = str(actor.get("runtime") or "")
                 runtime_lower = runtime.strip().lower()
                 running = False
                 try:
                     if runner_effective == "pty":
-                        running = pty_runner.SUPERVISOR.actor_running(group.group_id, aid)
+                        running = aid in pty_running
                     elif runner_effective == "headless":
                         if runtime_lower == "codex":
                             state = codex_app_supervisor.get_state(group_id=group.group_id, actor_id=aid)
@@ -199,13 +213,13 @@ def handle_debug_snapshot(
                             state = claude_app_supervisor.get_state(group_id=group.group_id, actor_id=aid)
                             running = bool(state is not None and claude_app_supervisor.actor_running(group.group_id, aid))
                         else:
-                            running = headless_runner.SUPERVISOR.actor_running(group.group_id, aid)
+                            running = aid in headless_running
                 except Exception:
                     running = False
                 actors.append(
                     {
                         "id": aid,
-                        "role": get_effective_role(group, aid),
+                        "role": roles.get(aid, "peer"),
                         "runtime": runtime,
                         "runner": runner_kind,
                         "runner_effective": (runner_effective if runner_effective != runner_kind else runner_kind),
@@ -230,9 +244,9 @@ def handle_terminal_tail(
     can_read_terminal_transcript: Callable[[Any, str, str], bool],
     pty_backlog_bytes: Callable[[], int],
 ) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    actor_id = str(args.get("actor_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
+    group_id = arg_str(args, "group_id")
+    actor_id = arg_str(args, "actor_id")
+    by = arg_str(args, "by", "user")
     max_chars = int(args.get("max_chars") or 8000)
     strip_ansi = coerce_bool(args.get("strip_ansi"), default=True)
     compact = coerce_bool(args.get("compact"), default=True)
@@ -240,7 +254,7 @@ def handle_terminal_tail(
         return _error("missing_group_id", "missing group_id")
     if not actor_id:
         return _error("missing_actor_id", "missing actor_id")
-    group = load_group(group_id)
+    group = load_group_cached(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if not can_read_terminal_transcript(group, by, actor_id):
@@ -268,38 +282,53 @@ def handle_terminal_tail(
     if max_chars > 200_000:
         max_chars = 200_000
     try:
-        raw = b""
-        end_cursor = 0
-        try:
-            page = pty_runner.SUPERVISOR.history_page(
-                group_id=group_id,
-                actor_id=actor_id,
-                before=None,
-                limit_bytes=pty_backlog_bytes(),
-            )
-            raw = bytes(page.get("data") or b"")
-            end_cursor = int(page.get("end_cursor") or 0)
-            if not raw:
-                raw = pty_runner.SUPERVISOR.tail_output(
+        backlog_bytes = pty_backlog_bytes()
+        # Rendering replays cursor movement, so it needs the whole backlog. A raw
+        # tail keeps at most max_chars characters (<= 4 UTF-8 bytes each), so read
+        # only that window plus slack, and widen once if filtering left it short.
+        windows = [backlog_bytes]
+        if not strip_ansi and max_chars * 4 + 8192 < backlog_bytes:
+            windows.insert(0, max_chars * 4 + 8192)
+        for window in windows:
+            raw = b""
+            end_cursor = 0
+            try:
+                page = pty_runner.SUPERVISOR.history_page(
                     group_id=group_id,
                     actor_id=actor_id,
-                    max_bytes=pty_backlog_bytes(),
+                    before=None,
+                    limit_bytes=window,
                 )
-        except Exception:
-            raw = b""
-        raw_text = raw.decode("utf-8", errors="replace")
-        text = raw_text
-        hint = ""
-        if strip_ansi:
-            try:
-                from ...util.terminal_render import render_transcript
-
-                text = render_transcript(text, compact=compact)
+                raw = bytes(page.get("data") or b"")
+                end_cursor = int(page.get("end_cursor") or 0)
+                if not raw:
+                    raw = pty_runner.SUPERVISOR.tail_output(
+                        group_id=group_id,
+                        actor_id=actor_id,
+                        max_bytes=window,
+                    )
             except Exception:
-                pass
-            if not text.strip() and raw_text.strip():
-                hint = "Rendered transcript is empty; try disabling Strip ANSI for full-screen TUIs."
-        text = strip_codex_working_status_lines(text, runtime=str(actor.get("runtime") or ""))
+                raw = b""
+            truncated = window < backlog_bytes and len(raw) >= window
+            if truncated:
+                # Start at a UTF-8 boundary instead of decoding a split sequence.
+                head = 0
+                while head < len(raw) and head < 3 and (raw[head] & 0xC0) == 0x80:
+                    head += 1
+                raw = raw[head:]
+            raw_text = raw.decode("utf-8", errors="replace")
+            text = raw_text
+            hint = ""
+            if strip_ansi:
+                try:
+                    text = render_transcript(text, compact=compact)
+                except Exception:
+                    pass
+                if not text.strip() and raw_text.strip():
+                    hint = "Rendered transcript is empty; try disabling Strip ANSI for full-screen TUIs."
+            text = strip_codex_working_status_lines(text, runtime=str(actor.get("runtime") or ""))
+            if len(text) >= max_chars or not truncated:
+                break
         if len(text) > max_chars:
             text = text[-max_chars:]
         return DaemonResponse(
@@ -323,9 +352,9 @@ def handle_terminal_history(
     can_read_terminal_transcript: Callable[[Any, str, str], bool],
     pty_backlog_bytes: Callable[[], int],
 ) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    actor_id = str(args.get("actor_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
+    group_id = arg_str(args, "group_id")
+    actor_id = arg_str(args, "actor_id")
+    by = arg_str(args, "by", "user")
     before_raw = args.get("before")
     before: Optional[int] = None
     if before_raw is not None and str(before_raw).strip() != "":
@@ -341,7 +370,7 @@ def handle_terminal_history(
         return _error("missing_group_id", "missing group_id")
     if not actor_id:
         return _error("missing_actor_id", "missing actor_id")
-    group = load_group(group_id)
+    group = load_group_cached(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if not can_read_terminal_transcript(group, by, actor_id):
@@ -408,14 +437,14 @@ def handle_terminal_clear(
     *,
     can_read_terminal_transcript: Callable[[Any, str, str], bool],
 ) -> DaemonResponse:
-    group_id = str(args.get("group_id") or "").strip()
-    actor_id = str(args.get("actor_id") or "").strip()
-    by = str(args.get("by") or "user").strip()
+    group_id = arg_str(args, "group_id")
+    actor_id = arg_str(args, "actor_id")
+    by = arg_str(args, "by", "user")
     if not group_id:
         return _error("missing_group_id", "missing group_id")
     if not actor_id:
         return _error("missing_actor_id", "missing actor_id")
-    group = load_group(group_id)
+    group = load_group_cached(group_id)
     if group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if not can_read_terminal_transcript(group, by, actor_id):
@@ -460,16 +489,16 @@ def _debug_component_path(*, component: str, group_id: str) -> tuple[Optional[Pa
 def handle_debug_tail_logs(args: Dict[str, Any], *, developer_mode_enabled: Callable[[], bool]) -> DaemonResponse:
     if not developer_mode_enabled():
         return _error("developer_mode_required", "developer mode is disabled")
-    component = str(args.get("component") or "").strip().lower()
-    by = str(args.get("by") or "user").strip()
-    group_id = str(args.get("group_id") or "").strip()
+    component = arg_str(args, "component").lower()
+    by = arg_str(args, "by", "user")
+    group_id = arg_str(args, "group_id")
     lines = int(args.get("lines") or 200)
     if lines <= 0:
         lines = 200
     if lines > 2000:
         lines = 2000
 
-    group = load_group(group_id) if group_id else None
+    group = load_group_cached(group_id) if group_id else None
     if group_id and group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if group is not None and by and by != "user":
@@ -491,10 +520,10 @@ def handle_debug_tail_logs(args: Dict[str, Any], *, developer_mode_enabled: Call
 def handle_debug_clear_logs(args: Dict[str, Any], *, developer_mode_enabled: Callable[[], bool]) -> DaemonResponse:
     if not developer_mode_enabled():
         return _error("developer_mode_required", "developer mode is disabled")
-    component = str(args.get("component") or "").strip().lower()
-    by = str(args.get("by") or "user").strip()
-    group_id = str(args.get("group_id") or "").strip()
-    group = load_group(group_id) if group_id else None
+    component = arg_str(args, "component").lower()
+    by = arg_str(args, "by", "user")
+    group_id = arg_str(args, "group_id")
+    group = load_group_cached(group_id) if group_id else None
     if group_id and group is None:
         return _error("group_not_found", f"group not found: {group_id}")
     if group is not None and by and by != "user":
@@ -512,8 +541,8 @@ def handle_debug_clear_logs(args: Dict[str, Any], *, developer_mode_enabled: Cal
         except Exception:
             pass
         try:
-            with open(path, "w", encoding="utf-8"):
-                pass
+            # Truncate with a raw open; no text-mode I/O stack is needed to empty a file.
+            os.close(os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
         except Exception as e:
             return _error("debug_clear_logs_failed", str(e), details={"path": str(path)})
         return DaemonResponse(ok=True, result={"component": component, "group_id": group_id, "path": str(path), "cleared": True})
@@ -521,6 +550,18 @@ def handle_debug_clear_logs(args: Dict[str, Any], *, developer_mode_enabled: Cal
         return _error("debug_clear_logs_failed", str(e))
 
 
+DIAGNOSTICS_OPS = frozenset(
+    {
+        "debug_snapshot",
+        "terminal_tail",
+        "terminal_history",
+        "terminal_clear",
+        "debug_tail_logs",
+        "debug_clear_logs",
+    }
+)
+
+
 def try_handle_diagnostics_op(
     op: str,
     args: Dict[str, Any],
@@ -532,6 +573,8 @@ def try_handle_diagnostics_op(
     can_read_terminal_transcript: Callable[[Any, str, str], bool],
     pty_backlog_bytes: Callable[[], int],
 ) -> Optional[DaemonResponse]:
+    if op not in DIAGNOSTICS_OPS:
+        return None
     if op == "debug_snapshot":
         return handle_debug_snapshot(
             args,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Any, Callable, Type
@@ -13,12 +14,12 @@ from .actors.actor_profile_ops import try_handle_actor_profile_op
 from .actors.actor_add_ops import try_handle_actor_add_op
 from .actors.actor_lifecycle_ops import try_handle_actor_lifecycle_op
 from .actors.actor_membership_ops import try_handle_actor_membership_op
-from .actors.actor_update_ops import try_handle_actor_update_op
+from .actors.actor_update_ops import ActorUpdateDeps, try_handle_actor_update_op
 from .messaging.inbox_ack_ops import try_handle_inbox_ack_op
 from .messaging.inbox_read_ops import try_handle_inbox_read_op
 from .ops.maintenance_ops import try_handle_maintenance_op
 from .messaging.delegation_relay_ops import try_handle_delegation_relay_op
-from .ops.diagnostics_ops import try_handle_diagnostics_op
+from .ops.diagnostics_ops import DIAGNOSTICS_OPS, try_handle_diagnostics_op
 from .ops.daemon_core_ops import try_handle_daemon_core_op
 from .ops.remote_access_ops import try_handle_remote_access_op
 from .ops.hermes_runtime_ops import try_handle_hermes_runtime_op
@@ -104,13 +105,51 @@ class RequestDispatchDeps:
     error_factory: Callable[[str, str], DaemonResponse]
 
 
+# RequestDispatchDeps is built once by the daemon; derive the per-family deps
+# from it once as well instead of repacking kwargs on every request.
+_ACTOR_UPDATE_DEPS: tuple[RequestDispatchDeps, ActorUpdateDeps] | None = None
+
+
+def _actor_update_deps(deps: RequestDispatchDeps) -> ActorUpdateDeps:
+    global _ACTOR_UPDATE_DEPS
+    cached = _ACTOR_UPDATE_DEPS
+    if cached is not None and cached[0] is deps:
+        return cached[1]
+    built = ActorUpdateDeps(
+        foreman_id=deps.foreman_id,
+        maybe_reset_automation_on_foreman_change=deps.maybe_reset_automation_on_foreman_change,
+        find_scope_url=deps.find_scope_url,
+        effective_runner_kind=deps.effective_runner_kind,
+        ensure_mcp_installed=deps.ensure_mcp_installed,
+        merge_actor_env_with_private=deps.merge_actor_env_with_private,
+        inject_actor_context_env=deps.inject_actor_context_env,
+        normalize_runtime_command=deps.normalize_runtime_command,
+        prepare_pty_env=deps.prepare_pty_env,
+        pty_backlog_bytes=deps.pty_backlog_bytes,
+        write_headless_state=deps.write_headless_state,
+        write_pty_state=deps.write_pty_state,
+        clear_preamble_sent=deps.clear_preamble_sent,
+        throttle_reset_actor=deps.throttle_reset_actor,
+        remove_headless_state=deps.remove_headless_state,
+        remove_pty_state_if_pid=deps.remove_pty_state_if_pid,
+        supported_runtimes=deps.supported_runtimes,
+        get_actor_profile=deps.get_actor_profile,
+        load_actor_profile_secrets=deps.load_actor_profile_secrets,
+        update_actor_private_env=deps.update_actor_private_env,
+    )
+    _ACTOR_UPDATE_DEPS = (deps, built)
+    return built
+
+
 def dispatch_request(
     req: DaemonRequest,
     *,
     deps: RequestDispatchDeps,
     recurse: Any,
 ) -> tuple[DaemonResponse, bool]:
-    op = str(req.op or "").strip()
+    # Interned once here: op is then matched against literal op names by every
+    # try_handle_* family, and equal interned strings compare by identity.
+    op = sys.intern(str(req.op or "").strip())
     args = req.args or {}
 
     daemon_core_resp = try_handle_daemon_core_op(
@@ -136,18 +175,20 @@ def dispatch_request(
     if remote_send_resp is not None:
         return remote_send_resp, False
 
-    diagnostics_resp = try_handle_diagnostics_op(
-        op,
-        args,
-        developer_mode_enabled=deps.developer_mode_enabled,
-        get_observability=deps.get_observability,
-        effective_runner_kind=deps.effective_runner_kind,
-        throttle_debug_summary=deps.throttle_debug_summary,
-        can_read_terminal_transcript=deps.can_read_terminal_transcript,
-        pty_backlog_bytes=deps.pty_backlog_bytes,
-    )
-    if diagnostics_resp is not None:
-        return diagnostics_resp, False
+    # Skip building the callback kwargs for the (common) non-diagnostics ops.
+    if op in DIAGNOSTICS_OPS:
+        diagnostics_resp = try_handle_diagnostics_op(
+            op,
+            args,
+            developer_mode_enabled=deps.developer_mode_enabled,
+            get_observability=deps.get_observability,
+            effective_runner_kind=deps.effective_runner_kind,
+            throttle_debug_summary=deps.throttle_debug_summary,
+            can_read_terminal_transcript=deps.can_read_terminal_transcript,
+            pty_backlog_bytes=deps.pty_backlog_bytes,
+        )
+        if diagnostics_resp is not None:
+            return diagnostics_resp, False
 
     hermes_runtime_resp = try_handle_hermes_runtime_op(op, args)
     if hermes_runtime_resp is not None:
@@ -322,30 +363,7 @@ def dispatch_request(
     if actor_membership_resp is not None:
         return actor_membership_resp, False
 
-    actor_update_resp = try_handle_actor_update_op(
-        op,
-        args,
-        foreman_id=deps.foreman_id,
-        maybe_reset_automation_on_foreman_change=deps.maybe_reset_automation_on_foreman_change,
-        find_scope_url=deps.find_scope_url,
-        effective_runner_kind=deps.effective_runner_kind,
-        ensure_mcp_installed=deps.ensure_mcp_installed,
-        merge_actor_env_with_private=deps.merge_actor_env_with_private,
-        inject_actor_context_env=deps.inject_actor_context_env,
-        normalize_runtime_command=deps.normalize_runtime_command,
-        prepare_pty_env=deps.prepare_pty_env,
-        pty_backlog_bytes=deps.pty_backlog_bytes,
-        write_headless_state=deps.write_headless_state,
-        write_pty_state=deps.write_pty_state,
-        clear_preamble_sent=deps.clear_preamble_sent,
-        throttle_reset_actor=deps.throttle_reset_actor,
-        remove_headless_state=deps.remove_headless_state,
-        remove_pty_state_if_pid=deps.remove_pty_state_if_pid,
-        supported_runtimes=deps.supported_runtimes,
-        get_actor_profile=deps.get_actor_profile,
-        load_actor_profile_secrets=deps.load_actor_profile_secrets,
-        update_actor_private_env=deps.update_actor_private_env,
-    )
+    actor_update_resp = try_handle_actor_update_op(op, args, deps=_actor_update_deps(deps))
     if actor_update_resp is not None:
         return actor_update_resp, False
 
@@ -35,15 +35,17 @@ def write_pty_state(group_id: str, actor_id: str, *, pid: int) -> None:
 
 def remove_pty_state_if_pid(group_id: str, actor_id: str, *, pid: int) -> bool:
     p = pty_state_path(group_id, actor_id)
-    if not p.exists():
-        return False
-    doc = read_json(p)
-    try:
-        cur = int(doc.get("pid") or 0) if isinstance(doc, dict) else 0
-    except Exception:
-        cur = 0
-    if cur and int(pid) and cur != int(pid):
-        return False
+    if int(pid):
+        # Only a pid-guarded removal needs the recorded pid; pid=0 removes unconditionally.
+        if not p.exists():
+            return False
+        doc = read_json(p)
+        try:
+            cur = int(doc.get("pid") or 0) if isinstance(doc, dict) else 0
+        except Exception:
+            cur = 0
+        if cur and cur != int(pid):
+            return False
     try:
         p.unlink()
         return True
@@ -133,8 +135,7 @@ def web_model_group_running(group_id: str) -> bool:
 def remove_headless_state(group_id: str, actor_id: str) -> None:
     p = headless_state_path(group_id, actor_id)
     try:
-        if p.exists():
-            p.unlink()
+        p.unlink(missing_ok=True)
     except Exception:
         pass
 
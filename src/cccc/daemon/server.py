@@ -9,7 +9,7 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
 
 logger = logging.getLogger("cccc.daemon.server")
 
@@ -282,14 +282,14 @@ def _can_read_terminal_transcript(group: Any, *, by: str, target_actor_id: str)
         return True
     if who == target:
         return True
-    if find_actor(group, who) is None:
-        return False
+    # Read the visibility setting before scanning actors; a "foreman" role can
+    # only resolve for an existing actor, so that branch needs no extra lookup.
     tt = get_terminal_transcript_settings(group.doc)
     vis = str(tt.get("visibility") or "foreman")
     if vis == "all":
-        return True
-    if vis == "foreman" and get_effective_role(group, who) == "foreman":
-        return True
+        return find_actor(group, who) is not None
+    if vis == "foreman":
+        return get_effective_role(group, who) == "foreman"
     return False
 
 SUPPORTED_RUNTIMES = (
@@ -312,6 +312,8 @@ SUPPORTED_RUNTIMES = (
     "web_model",
     "custom",
 )
+# Membership-only view for the actor start paths; SUPPORTED_RUNTIMES keeps display order.
+SUPPORTED_RUNTIME_SET = frozenset(SUPPORTED_RUNTIMES)
 
 AUTO_MCP_RUNTIMES = (
     "claude",
@@ -642,7 +644,7 @@ def _maybe_autostart_running_groups() -> None:
         ensure_home(),
         effective_runner_kind=_effective_runner_kind,
         find_scope_url=_find_scope_url,
-        supported_runtimes=SUPPORTED_RUNTIMES,
+        supported_runtimes=SUPPORTED_RUNTIME_SET,
         ensure_mcp_installed=_ensure_mcp_installed,
         auto_mcp_runtimes=AUTO_MCP_RUNTIMES,
         merge_actor_env_with_private=_merge_actor_env_with_private,
@@ -724,8 +726,8 @@ def _start_actor_process(
     group: Any,
     actor_id: str,
     *,
-    command: list[str],
-    env: Dict[str, str],
+    command: Sequence[str],
+    env: Mapping[str, str],
     runner: str,
     runtime: str,
     by: str,
@@ -754,7 +756,7 @@ def _start_actor_process(
         write_pty_state=lambda gid, aid, pid: _write_pty_state(gid, aid, pid=pid),
         clear_preamble_sent=clear_preamble_sent,
         throttle_reset_actor=lambda gid, aid: THROTTLE.reset_actor(gid, aid, keep_pending=True),
-        supported_runtimes=SUPPORTED_RUNTIMES,
+        supported_runtimes=SUPPORTED_RUNTIME_SET,
         load_actor_private_env=_load_actor_private_env,
         resolve_linked_actor_before_start=lambda grp, aid, caller_id="", is_admin=False: _resolve_linked_actor_before_start(
             grp,
@@ -175,6 +175,22 @@ def get_effective_role(group: Group, actor_id: str) -> ActorRole:
     return "peer"
 
 
+def get_effective_roles(group: Group) -> Dict[str, ActorRole]:
+    """Return get_effective_role() for every actor in one pass over the actor list."""
+    roles: Dict[str, ActorRole] = {}
+    foreman_seen = False
+    for actor in list_actors(group):
+        aid = str(actor.get("id") or "").strip()
+        if not aid or aid in roles:
+            continue
+        if not foreman_seen and not is_internal_actor(actor):
+            foreman_seen = True
+            roles[aid] = "foreman"
+        else:
+            roles[aid] = "peer"
+    return roles
+
+
 def find_foreman(group: Group) -> Optional[Dict[str, Any]]:
     """Find the stable foreman actor (first visible actor)."""
     for actor in list_visible_actors(group):
@@ -510,20 +526,38 @@ def resolve_recipient_tokens(group: Group, tokens: List[str]) -> List[str]:
     if not raw:
         return []
 
-    actors = list_visible_actors(group)
-    id_set = {str(a.get("id")) for a in actors if isinstance(a, dict) and isinstance(a.get("id"), str)}
-    title_map: Dict[str, List[str]] = {}
-    for a in actors:
-        if not isinstance(a, dict):
-            continue
-        aid = a.get("id")
-        title = a.get("title")
-        if not isinstance(aid, str) or not aid.strip():
-            continue
-        if not isinstance(title, str) or not title.strip():
-            continue
-        key = title.strip().casefold()
-        title_map.setdefault(key, []).append(aid.strip())
+    # Selector-only sends (the common case) never need the actor tables, and
+    # the title index is only needed for tokens that are not actor ids.
+    actors: Optional[List[Dict[str, Any]]] = None
+    id_set: Optional[set[str]] = None
+    title_map: Optional[Dict[str, List[str]]] = None
+
+    def _id_set() -> set[str]:
+        nonlocal actors, id_set
+        if id_set is None:
+            if actors is None:
+                actors = list_visible_actors(group)
+            id_set = {str(a.get("id")) for a in actors if isinstance(a, dict) and isinstance(a.get("id"), str)}
+        return id_set
+
+    def _title_map() -> Dict[str, List[str]]:
+        nonlocal actors, title_map
+        if title_map is None:
+            if actors is None:
+                actors = list_visible_actors(group)
+            title_map = {}
+            for a in actors:
+                if not isinstance(a, dict):
+                    continue
+                aid = a.get("id")
+                title = a.get("title")
+                if not isinstance(aid, str) or not aid.strip():
+                    continue
+                if not isinstance(title, str) or not title.strip():
+                    continue
+                key = title.strip().casefold()
+                title_map.setdefault(key, []).append(aid.strip())
+        return title_map
 
     def _canonical_one(token: str) -> str:
         t = token.strip()
@@ -542,11 +576,11 @@ def resolve_recipient_tokens(group: Group, tokens: List[str]) -> List[str]:
         if t in ("user", "@user"):
             return "user"
 
-        if t in id_set:
+        if t in _id_set():
             return t
 
         key = t.casefold()
-        ids = title_map.get(key) or []
+        ids = _title_map().get(key) or []
         if len(ids) == 1:
             return ids[0]
         if len(ids) > 1:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 import copy
 from datetime import datetime
 import errno
 import hashlib
 import logging
 import shutil
+import threading
 import time
 import uuid
 from dataclasses import dataclass
@@ -77,11 +79,12 @@ def _normalize_automation_snippet_map(raw: Any) -> Dict[str, str]:
 
 
 def default_automation_builtin_snippets() -> Dict[str, str]:
-    return copy.deepcopy(_DEFAULT_AUTOMATION_BUILTIN_SNIPPETS)
+    # Values are str, so a shallow copy is already independent of the module default.
+    return dict(_DEFAULT_AUTOMATION_BUILTIN_SNIPPETS)
 
 
 def split_automation_snippets_for_storage(snippets: Any) -> tuple[Dict[str, str], Dict[str, str]]:
-    built_in = default_automation_builtin_snippets()
+    built_in = _DEFAULT_AUTOMATION_BUILTIN_SNIPPETS
     normalized = _normalize_automation_snippet_map(snippets)
     custom: Dict[str, str] = {}
     built_in_overrides: Dict[str, str] = {}
@@ -95,7 +98,7 @@ def split_automation_snippets_for_storage(snippets: Any) -> tuple[Dict[str, str]
 
 
 def normalize_automation_snippet_storage(automation: Any) -> tuple[Dict[str, str], Dict[str, str]]:
-    built_in = default_automation_builtin_snippets()
+    built_in = _DEFAULT_AUTOMATION_BUILTIN_SNIPPETS
     raw_custom = _normalize_automation_snippet_map(automation.get("snippets") if isinstance(automation, dict) else {})
     raw_overrides = _normalize_automation_snippet_map(
         automation.get("snippet_overrides") if isinstance(automation, dict) else {}
@@ -130,7 +133,7 @@ def stored_automation_snippets(automation: Any) -> Dict[str, str]:
 
 
 def effective_automation_snippets(automation: Any) -> Dict[str, str]:
-    built_in = default_automation_builtin_snippets()
+    built_in = _DEFAULT_AUTOMATION_BUILTIN_SNIPPETS
     custom, built_in_overrides = normalize_automation_snippet_storage(automation)
     out = dict(built_in)
     out.update(built_in_overrides)
@@ -176,7 +179,8 @@ def _default_automation_ruleset() -> Dict[str, Any]:
 
 def default_automation_ruleset_doc() -> Dict[str, Any]:
     """Return a fresh default automation ruleset document."""
-    return copy.deepcopy(_default_automation_ruleset())
+    # _default_automation_ruleset() builds a new literal on every call; no deepcopy needed.
+    return _default_automation_ruleset()
 
 
 def default_new_group_automation_doc() -> Dict[str, Any]:
@@ -244,6 +248,56 @@ def load_group(group_id: str) -> Optional[Group]:
         return None
 
 
+_GROUP_DOC_CACHE_LOCK = threading.Lock()
+_GROUP_DOC_CACHE: OrderedDict[str, tuple[tuple[int, int, int], Dict[str, Any]]] = OrderedDict()
+_GROUP_DOC_CACHE_MAX = 256
+
+
+def _forget_cached_group_doc(path: Path) -> None:
+    with _GROUP_DOC_CACHE_LOCK:
+        _GROUP_DOC_CACHE.pop(str(path), None)
+
+
+def load_group_cached(group_id: str) -> Optional[Group]:
+    """Like load_group(), but reuse the parsed doc while group.yaml is unchanged.
+
+    Meant for read-mostly handlers (diagnostics, tails) that are polled often.
+    The cache is keyed on the file's (inode, mtime_ns, size); Group.save()
+    replaces the file atomically, so any write yields a new key. Callers always
+    receive their own copy of the doc. At most _GROUP_DOC_CACHE_MAX docs are
+    kept, least recently used first out; missing groups are dropped.
+    """
+    gp = ensure_home() / "groups" / group_id
+    p = gp / "group.yaml"
+    try:
+        st = p.stat()
+        cache_key = (int(st.st_ino), int(st.st_mtime_ns), int(st.st_size))
+    except FileNotFoundError:
+        _forget_cached_group_doc(p)
+        return load_group(group_id)
+    except Exception:
+        return load_group(group_id)
+    with _GROUP_DOC_CACHE_LOCK:
+        hit = _GROUP_DOC_CACHE.get(str(p))
+        cached_doc = copy.deepcopy(hit[1]) if hit is not None and hit[0] == cache_key else None
+        if cached_doc is not None:
+            _GROUP_DOC_CACHE.move_to_end(str(p))
+    if cached_doc is not None:
+        try:
+            ensure_ledger_layout(gp)
+        except Exception:
+            return None
+        return Group(group_id=group_id, path=gp, doc=cached_doc)
+    group = load_group(group_id)
+    if group is not None:
+        with _GROUP_DOC_CACHE_LOCK:
+            _GROUP_DOC_CACHE[str(p)] = (cache_key, copy.deepcopy(group.doc))
+            _GROUP_DOC_CACHE.move_to_end(str(p))
+            while len(_GROUP_DOC_CACHE) > _GROUP_DOC_CACHE_MAX:
+                _GROUP_DOC_CACHE.popitem(last=False)
+    return group
+
+
 def create_group(
     reg: Registry,
     *,
@@ -547,6 +601,7 @@ def delete_group(reg: Registry, *, group_id: str, publish: bool = True) -> None:
     gp = home / "groups" / gid
     if gp.exists():
         _delete_group_dir(gp)
+    _forget_cached_group_doc(gp / "group.yaml")
 
     reg.groups.pop(gid, None)
     for k, v in list(reg.defaults.items()):
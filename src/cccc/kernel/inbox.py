@@ -957,6 +957,68 @@ def is_message_for_actor(
     return False
 
 
+def resolve_recipient_actor_ids(
+    group: Group,
+    event: Dict[str, Any],
+    *,
+    actors: Optional[List[Dict[str, Any]]] = None,
+) -> set[str]:
+    """Return the ids of all actors for which is_message_for_actor() would be True.
+
+    The event's targets and the foreman are resolved once, so callers checking
+    every actor get O(1) membership tests instead of one full evaluation each.
+    actors may pass a list_actors(group) result the caller already holds.
+    """
+    if actors is None:
+        actors = list_actors(group)
+    kind = str(event.get("kind") or "")
+    out: set[str] = set()
+
+    if kind == "system.notify":
+        data = event.get("data")
+        if not isinstance(data, dict):
+            return out
+        target = str(data.get("target_actor_id") or "").strip()
+        for actor in actors:
+            aid = str(actor.get("id") or "").strip() if isinstance(actor, dict) else ""
+            if not aid:
+                continue
+            if is_internal_actor(actor):
+                if target and target == aid:
+                    out.add(aid)
+            elif not target or target == aid:
+                out.add(aid)
+        return out
+
+    targets = set(_message_targets(event))
+    broadcast = not targets or "@all" in targets
+    to_peers = "@peers" in targets
+    to_foreman = "@foreman" in targets
+    # Same rule as get_effective_role(): the first visible actor is the foreman.
+    foreman_id = ""
+    for actor in actors:
+        if isinstance(actor, dict) and not is_internal_actor(actor):
+            foreman_id = str(actor.get("id") or "").strip()
+            if foreman_id:
+                break
+    for actor in actors:
+        aid = str(actor.get("id") or "").strip() if isinstance(actor, dict) else ""
+        if not aid:
+            continue
+        if is_internal_actor(actor):
+            if aid in targets:
+                out.add(aid)
+            continue
+        if broadcast or aid in targets:
+            out.add(aid)
+        elif aid == foreman_id:
+            if to_foreman:
+                out.add(aid)
+        elif to_peers:
+            out.add(aid)
+    return out
+
+
 def unread_messages(group: Group, *, actor_id: str, limit: int = 50, kind_filter: MessageKindFilter = "all") -> List[Dict[str, Any]]:
     """Get unread events for an actor.
 
@@ -6,7 +6,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from ..contracts.v1 import Event
 from ..contracts.v1.event import normalize_event_data
@@ -70,7 +70,7 @@ def _lock_path(ledger_path: Path) -> Path:
     return ledger_path.parent / "state" / "ledger" / "ledger.lock"
 
 
-def append_event(
+def _build_event_line(
     ledger_path: Path,
     *,
     kind: str,
@@ -78,8 +78,7 @@ def append_event(
     scope_key: str,
     by: str,
     data: Optional[Dict[str, Any]] = None,
-    notify: bool = True,
-) -> Dict[str, Any]:
+) -> tuple[Dict[str, Any], str]:
     payload = normalize_event_data(kind, data or {})
     event = Event(kind=kind, group_id=group_id, scope_key=scope_key, by=by, data=payload)
 
@@ -97,33 +96,70 @@ def append_event(
                 attachments.append(att)
                 event.data["attachments"] = attachments
 
-    ledger_path.parent.mkdir(parents=True, exist_ok=True)
     out = event.model_dump()
     line = json.dumps(out, ensure_ascii=False)
     if len(line.encode("utf-8", errors="replace")) > MAX_EVENT_BYTES:
         raise ValueError(f"ledger event too large (>{MAX_EVENT_BYTES} bytes): {kind}")
+    return out, line + "\n"
+
+
+def append_events(
+    ledger_path: Path,
+    entries: Iterable[Dict[str, Any]],
+    *,
+    notify: bool = True,
+) -> List[Dict[str, Any]]:
+    """Append several events under one ledger lock and a single write.
+
+    Each entry holds append_event's keyword arguments (kind, group_id, scope_key,
+    by, data). Every event is validated before anything is written, so either
+    all entries are appended, in order, or none are.
+    """
+    built = [_build_event_line(ledger_path, **entry) for entry in entries]
+    if not built:
+        return []
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
     lock = _lock_path(ledger_path)
     lk = acquire_lockfile(lock, blocking=True)
     try:
         with ledger_path.open("a", encoding="utf-8") as f:
             start_offset = int(f.tell() or 0)
-            f.write(line + "\n")
-            next_offset = start_offset + len((line + "\n").encode("utf-8", errors="replace"))
+            f.write("".join(line for _, line in built))
     finally:
         release_lockfile(lk)
-    try:
-        append_event_to_index(ledger_path, out, next_offset_bytes=next_offset)
-    except Exception:
-        pass
-    try:
-        from .ledger_status_cache import update_message_status_cache_on_append
+    out_events: List[Dict[str, Any]] = []
+    next_offset = start_offset
+    for out, line in built:
+        next_offset += len(line.encode("utf-8", errors="replace"))
+        try:
+            append_event_to_index(ledger_path, out, next_offset_bytes=next_offset)
+        except Exception:
+            pass
+        try:
+            from .ledger_status_cache import update_message_status_cache_on_append
 
-        update_message_status_cache_on_append(out)
-    except Exception:
-        pass
+            update_message_status_cache_on_append(out)
+        except Exception:
+            pass
+        out_events.append(out)
     if notify:
-        _notify_append(out)
-    return out
+        for out in out_events:
+            _notify_append(out)
+    return out_events
+
+
+def append_event(
+    ledger_path: Path,
+    *,
+    kind: str,
+    group_id: str,
+    scope_key: str,
+    by: str,
+    data: Optional[Dict[str, Any]] = None,
+    notify: bool = True,
+) -> Dict[str, Any]:
+    entry = {"kind": kind, "group_id": group_id, "scope_key": scope_key, "by": by, "data": data}
+    return append_events(ledger_path, [entry], notify=notify)[0]
 
 
 def read_last_lines(path: Path, n: int) -> list[str]:
@@ -143,11 +179,24 @@ def read_last_lines(path: Path, n: int) -> list[str]:
         return []
 
 
+def _complete_tail_lines(data: bytes, *, partial_head: bool) -> list[bytes]:
+    if partial_head:
+        first_newline = data.find(b"\n")
+        data = data[first_newline + 1 :] if first_newline >= 0 else b""
+    parts = data.split(b"\n")
+    if parts and parts[-1] == b"":
+        parts = parts[:-1]
+    return [part for part in parts if part]
+
+
 def _read_last_lines_from_regular_file(path: Path, n: int, *, block_size: int = _TAIL_READ_BLOCK_SIZE) -> list[str]:
     if n <= 0:
         return []
 
+    # Chunks are read back to front; newlines are counted per chunk so the
+    # buffered tail is only joined and split once it can hold n lines.
     chunks: list[bytes] = []
+    newlines = 0
     position = path.stat().st_size
     size = max(1, int(block_size))
     with path.open("rb") as handle:
@@ -155,29 +204,17 @@ def _read_last_lines_from_regular_file(path: Path, n: int, *, block_size: int =
             read_size = min(size, position)
             position -= read_size
             handle.seek(position)
-            chunks.insert(0, handle.read(read_size))
-
-            data = b"".join(chunks)
-            candidate = data
-            if position > 0:
-                first_newline = candidate.find(b"\n")
-                candidate = candidate[first_newline + 1 :] if first_newline >= 0 else b""
-            parts = candidate.split(b"\n")
-            if parts and parts[-1] == b"":
-                parts = parts[:-1]
-            if sum(1 for part in parts if part) >= n:
-                break
+            chunk = handle.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            if newlines + 1 >= n:
+                parts = _complete_tail_lines(b"".join(reversed(chunks)), partial_head=position > 0)
+                if len(parts) >= n:
+                    break
             size = min(size * 2, _TAIL_READ_MAX_BLOCK_SIZE)
 
-    data = b"".join(chunks)
-    if position > 0:
-        first_newline = data.find(b"\n")
-        data = data[first_newline + 1 :] if first_newline >= 0 else b""
-    parts = data.split(b"\n")
-    if parts and parts[-1] == b"":
-        parts = parts[:-1]
-    lines = [part.decode("utf-8", errors="replace") for part in parts if part]
-    return lines[-n:]
+    parts = _complete_tail_lines(b"".join(reversed(chunks)), partial_head=position > 0)
+    return [part.decode("utf-8", errors="replace") for part in parts[-n:]]
 
 
 def follow(path: Path, *, sleep_seconds: float = 0.2) -> Iterable[str]:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Tuple
 
 from .actors import list_visible_actors
 from .group import Group
-from .inbox import is_message_for_actor
+from .inbox import resolve_recipient_actor_ids
 from ..util.conv import coerce_bool
 
 
@@ -22,30 +22,36 @@ def get_default_send_to(group_doc: Dict[str, Any]) -> DefaultSendTo:
     return "foreman"
 
 
-def _enabled_actor_ids(group: Group) -> List[str]:
-    out: List[str] = []
-    for a in list_visible_actors(group):
+def _split_actor_ids_by_enabled(actors: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+    enabled: List[str] = []
+    disabled: List[str] = []
+    for a in actors:
         if not isinstance(a, dict):
             continue
-        if not coerce_bool(a.get("enabled"), default=True):
-            continue
         aid = str(a.get("id") or "").strip()
-        if aid:
-            out.append(aid)
-    return out
-
-
-def _disabled_actor_ids(group: Group) -> List[str]:
-    out: List[str] = []
-    for a in list_visible_actors(group):
-        if not isinstance(a, dict):
+        if not aid:
             continue
         if coerce_bool(a.get("enabled"), default=True):
-            continue
-        aid = str(a.get("id") or "").strip()
-        if aid:
-            out.append(aid)
-    return out
+            enabled.append(aid)
+        else:
+            disabled.append(aid)
+    return enabled, disabled
+
+
+def _matched_actor_ids(group: Group, to: List[str]) -> Tuple[List[str], List[str]]:
+    """Return (enabled, disabled) visible actor ids addressed by the to-list.
+
+    The to-list is resolved once against the actor list instead of once per actor.
+    """
+    enabled_ids, disabled_ids = _split_actor_ids_by_enabled(list_visible_actors(group))
+    if not enabled_ids and not disabled_ids:
+        return [], []
+    ev = {"kind": "chat.message", "data": {"to": list(to)}}
+    matched = resolve_recipient_actor_ids(group, ev)
+    return (
+        [aid for aid in enabled_ids if aid in matched],
+        [aid for aid in disabled_ids if aid in matched],
+    )
 
 
 def targets_any_agent(to: List[str]) -> bool:
@@ -69,12 +75,7 @@ def targets_any_agent(to: List[str]) -> bool:
 
 def enabled_recipient_actor_ids(group: Group, to: List[str]) -> List[str]:
     """Return enabled actor ids that would receive a chat.message with the given to-list."""
-    enabled_ids = _enabled_actor_ids(group)
-    if not enabled_ids:
-        return []
-
-    ev = {"kind": "chat.message", "data": {"to": list(to)}}
-    return [aid for aid in enabled_ids if is_message_for_actor(group, actor_id=aid, event=ev)]
+    return _matched_actor_ids(group, to)[0]
 
 
 def disabled_recipient_actor_ids(group: Group, to: List[str]) -> List[str]:
@@ -82,19 +83,15 @@ def disabled_recipient_actor_ids(group: Group, to: List[str]) -> List[str]:
 
     Used by auto-wake: when no enabled actors match, check if disabled ones do.
     """
-    disabled_ids = _disabled_actor_ids(group)
-    if not disabled_ids:
-        return []
-
-    ev = {"kind": "chat.message", "data": {"to": list(to)}}
-    return [aid for aid in disabled_ids if is_message_for_actor(group, actor_id=aid, event=ev)]
+    return _matched_actor_ids(group, to)[1]
 
 
 def recipient_actor_ids(group: Group, to: List[str]) -> List[str]:
     """Return all visible actor ids addressed by a message, regardless of enabled state."""
+    enabled, disabled = _matched_actor_ids(group, to)
     out: List[str] = []
     seen: set[str] = set()
-    for actor_id in enabled_recipient_actor_ids(group, to) + disabled_recipient_actor_ids(group, to):
+    for actor_id in enabled + disabled:
         if actor_id and actor_id not in seen:
             seen.add(actor_id)
             out.append(actor_id)
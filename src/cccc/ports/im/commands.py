@@ -27,6 +27,13 @@ _CAPABILITY_NAMES = {
 }
 
 
+# @word mentions not glued to a preceding token (so emails are skipped).
+_MENTION_RE = re.compile(r"(?<!\S)@([a-zA-Z][a-zA-Z0-9_-]*)")
+_COMMAND_RE = re.compile(r"^(?:@\S+\s+)?/(\w+)(?:@\S+)?(?:\s+(.*))?$", re.IGNORECASE | re.DOTALL)
+# Special selectors used by CCCC delivery; kept with their @ prefix.
+_SELECTOR_MENTIONS = frozenset({"all", "peers", "foreman", "user"})
+
+
 def _capability_state(features: Dict[str, str], key: str) -> str:
     raw = str(features.get(key) or "").strip().lower()
     return _CAPABILITY_NAMES.get(raw, "no")
@@ -96,7 +103,7 @@ def parse_message(text: str) -> ParsedCommand:
 
     # Check for commands (must start with /)
     # Support @BotName /command format (Telegram group privacy mode)
-    cmd_match = re.match(r"^(?:@\S+\s+)?/(\w+)(?:@\S+)?(?:\s+(.*))?$", text, re.IGNORECASE | re.DOTALL)
+    cmd_match = _COMMAND_RE.match(text)
 
     if cmd_match:
         cmd_name = cmd_match.group(1).lower()
@@ -122,10 +129,11 @@ def _extract_mentions(text: str) -> List[str]:
 
     Returns list of mentioned targets (without @).
     """
+    if "@" not in text:
+        return []
     # Match @word patterns, but not @BotName at the start (Telegram bot mention)
     # Also exclude email-like patterns
-    pattern = r"(?<!\S)@([a-zA-Z][a-zA-Z0-9_-]*)"
-    matches = re.findall(pattern, text)
+    matches = _MENTION_RE.findall(text)
 
     # Filter out common bot mention patterns (usually CamelCase or ends with Bot)
     mentions = []
@@ -135,7 +143,7 @@ def _extract_mentions(text: str) -> List[str]:
             continue
         ml = m.lower()
         # Preserve special selectors used by CCCC delivery.
-        if ml in ("all", "peers", "foreman", "user"):
+        if ml in _SELECTOR_MENTIONS:
             mentions.append(f"@{ml}")
         else:
             mentions.append(ml)
@@ -130,8 +130,9 @@ class HeadlessSupervisor:
 
     def actor_running(self, group_id: str, actor_id: str) -> bool:
         key = (str(group_id or "").strip(), str(actor_id or "").strip())
-        with self._lock:
-            s = self._sessions.get(key)
+        # Read-only probe: a single dict lookup is atomic, and writers still
+        # serialize on self._lock, so polling callers never wait on it.
+        s = self._sessions.get(key)
         return bool(s and s.is_running())
 
     def group_running(self, group_id: str) -> bool:
@@ -144,6 +145,16 @@ class HeadlessSupervisor:
                     return True
         return False
 
+    def actors_running(self, group_id: str) -> set[str]:
+        """Return the ids of running actors in a group with one lock acquisition."""
+        gid = str(group_id or "").strip()
+        if not gid:
+            return set()
+        with self._lock:
+            sessions = [(aid, s) for (g, aid), s in self._sessions.items() if g == gid]
+        # is_running() may poll the child or take the session lock; keep it off the supervisor lock.
+        return {aid for aid, s in sessions if s.is_running()}
+
     def start_actor(
         self,
         *,
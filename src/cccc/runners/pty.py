@@ -230,19 +230,43 @@ class PtySession:
             end = int(getattr(self, "_backlog_end_offset", start + len(data)) or 0)
         return data, start, end
 
+    def _backlog_window(self, page_end: Optional[int], limit: int) -> Tuple[bytes, int, int, int, int]:
+        """Copy only the backlog chunks overlapping ``[page_end - limit, page_end)``.
+
+        Returns ``(data, page_start, page_end, start, end)``; ``page_end`` is clamped
+        to the live backlog and ``data`` is empty when it falls before ``start``.
+        """
+        with self._lock:
+            start = int(getattr(self, "_backlog_start_offset", 0) or 0)
+            end = int(getattr(self, "_backlog_end_offset", start + self._backlog_bytes) or 0)
+            if page_end is None or page_end > end:
+                page_end = end
+            if page_end < start:
+                return b"", start, page_end, start, end
+            page_start = max(start, page_end - limit)
+            out: list[bytes] = []
+            chunk_end = end
+            for chunk in reversed(self._backlog):
+                chunk_start = chunk_end - len(chunk)
+                if chunk_start < page_end and chunk_end > page_start:
+                    out.append(chunk[max(0, page_start - chunk_start) : len(chunk) - max(0, chunk_end - page_end)])
+                if chunk_start <= page_start:
+                    break
+                chunk_end = chunk_start
+        return b"".join(reversed(out)), page_start, page_end, start, end
+
     def history_page(self, *, before: Optional[int] = None, limit_bytes: int = 64_000) -> Dict[str, object]:
         limit = int(limit_bytes or 0)
         if limit <= 0:
             limit = int(self._max_backlog_bytes or 0) or 64_000
         limit = min(max(1, limit), int(self._max_backlog_bytes or 0) or limit)
-        data, start, end = self._backlog_snapshot()
-        if before is None:
-            page_end = end
-        else:
+        page_end: Optional[int] = None
+        if before is not None:
             try:
                 page_end = int(before)
             except Exception:
-                page_end = end
+                page_end = None
+        data, page_start, page_end, start, _end = self._backlog_window(page_end, limit)
         if page_end < start:
             return {
                 "data": b"",
@@ -251,13 +275,8 @@ class PtySession:
                 "has_more": False,
                 "cursor_expired": True,
             }
-        if page_end > end:
-            page_end = end
-        page_start = max(start, page_end - limit)
-        rel_start = max(0, page_start - start)
-        rel_end = max(0, page_end - start)
         return {
-            "data": data[rel_start:rel_end],
+            "data": data,
             "start_cursor": page_start,
             "end_cursor": page_end,
             "has_more": page_start > start,
@@ -903,10 +922,21 @@ class PtySupervisor:
                     return True
         return False
 
+    def actors_running(self, group_id: str) -> set[str]:
+        """Return the ids of running actors in a group with one lock acquisition."""
+        gid = str(group_id or "").strip()
+        if not gid:
+            return set()
+        with self._lock:
+            sessions = [(aid, s) for (g, aid), s in self._sessions.items() if g == gid]
+        # is_running() may poll the child or take the session lock; keep it off the supervisor lock.
+        return {aid for aid, s in sessions if s.is_running()}
+
     def actor_running(self, group_id: str, actor_id: str) -> bool:
         key = (str(group_id or "").strip(), str(actor_id or "").strip())
-        with self._lock:
-            s = self._sessions.get(key)
+        # Read-only probe: a single dict lookup is atomic, and writers still
+        # serialize on self._lock, so polling callers never wait on it.
+        s = self._sessions.get(key)
         return bool(s and s.is_running())
 
     def tail_output(self, *, group_id: str, actor_id: str, max_bytes: int = 2_000_000) -> bytes:
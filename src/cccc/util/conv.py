@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Mapping
 
 _TRUE = {"1", "true", "yes", "y", "on"}
 _FALSE = {"0", "false", "no", "n", "off"}
@@ -14,10 +14,11 @@ def coerce_bool(value: Any, *, default: bool = False) -> bool:
     strings like "false"/"0". We treat unknown strings as the provided default
     to avoid the common pitfall where bool("false") == True.
     """
+    # Identity checks first: parsed docs almost always carry plain bools here.
+    if value is True or value is False:
+        return value
     if value is None:
         return bool(default)
-    if isinstance(value, bool):
-        return value
     if isinstance(value, int):
         return value != 0
     if isinstance(value, float):
@@ -37,3 +38,8 @@ def coerce_bool(value: Any, *, default: bool = False) -> bool:
         except Exception:
             return bool(default)
     return bool(value)
+
+
+def arg_str(args: Mapping[str, Any], key: str, default: str = "") -> str:
+    """Read an IPC arg as a stripped string, treating falsy values as default."""
+    return str(args.get(key) or default).strip()
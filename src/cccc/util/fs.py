@@ -4,7 +4,7 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
@@ -22,8 +22,10 @@ def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None
             pass
 
 
-def atomic_write_json(path: Path, obj: Dict[str, Any], *, indent: int = 2) -> None:
-    atomic_write_text(path, json.dumps(obj, ensure_ascii=False, indent=indent) + "\n")
+def atomic_write_json(path: Path, obj: Dict[str, Any], *, indent: Optional[int] = 2) -> None:
+    """Write JSON atomically; indent=None writes compact JSON (no whitespace between tokens)."""
+    separators = (",", ":") if indent is None else None
+    atomic_write_text(path, json.dumps(obj, ensure_ascii=False, indent=indent, separators=separators) + "\n")
 
 def atomic_write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
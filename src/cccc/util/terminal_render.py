@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import re
 import unicodedata
 from typing import Optional
 
 
 _HR_CHARS = set("─━-=═")
 
+# Plain SGR (colors/styles) is the only escape most CLI banners emit; the
+# renderer ignores it, so it can be stripped up front.
+_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Anything that moves the cursor or edits the screen needs the full renderer.
+_SCREEN_CONTROL_CHARS = ("\x1b", "\r", "\b", "\x00")
+
 # Sentinel occupying the trailing cell of a double-width glyph. It holds the
 # column so width-aware cursor positioning stays aligned, but contributes
 # nothing when the row is joined back into text.
@@ -206,6 +213,14 @@ def render_transcript(text: str, *, compact: bool = True) -> str:
     # Normalize common CRLF line endings.
     s = s.replace("\r\n", "\n")
 
+    # Fast path: with no cursor/erase controls the screen is just the lines.
+    if "\x1b" in s:
+        plain = _SGR_RE.sub("", s)
+    else:
+        plain = s
+    if not any(c in plain for c in _SCREEN_CONTROL_CHARS):
+        return _finish_transcript([line.rstrip() for line in plain.split("\n")], compact=compact)
+
     # Screen buffer.
     buf: list[list[str]] = [[]]
     row = 0
@@ -393,7 +408,10 @@ def render_transcript(text: str, *, compact: bool = True) -> str:
         col += width
         i += 1
 
-    out_lines = ["".join(line).rstrip() for line in buf]
+    return _finish_transcript(["".join(line).rstrip() for line in buf], compact=compact)
+
+
+def _finish_transcript(out_lines: list[str], *, compact: bool) -> str:
     # Trim trailing empty lines.
     while out_lines and not out_lines[-1].strip():
         out_lines.pop()
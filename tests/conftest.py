@@ -38,6 +38,11 @@ def _inline_chat_post_commit_tasks():
             os.environ["CCCC_CHAT_POST_COMMIT_MODE"] = old_mode
 
 
+@pytest.fixture(autouse=True)
+def _inline_actor_post_commit_tasks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CCCC_ACTOR_POST_COMMIT_MODE", "inline")
+
+
 @pytest.fixture(autouse=True)
 def _disable_real_codex_app_sessions_in_unit_tests(monkeypatch):
     monkeypatch.setattr(
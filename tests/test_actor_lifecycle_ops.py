@@ -1075,6 +1075,124 @@ class TestActorLifecycleOps(unittest.TestCase):
         finally:
             cleanup()
 
+    def test_actor_update_deferred_start_skips_when_disabled_before_it_runs(self) -> None:
+        _, cleanup = self._with_home()
+        old_mode = os.environ.pop("CCCC_ACTOR_POST_COMMIT_MODE", None)
+        try:
+            import threading
+            import time
+
+            from cccc.daemon.actors import actor_post_commit
+            from cccc.kernel.actors import find_actor
+            from cccc.kernel.group import load_group
+
+            create, _ = self._call("group_create", {"title": "actor-update-deferred", "topic": "", "by": "user"})
+            self.assertTrue(create.ok, getattr(create, "error", None))
+            group_id = str((create.result or {}).get("group_id") or "").strip()
+            attach, _ = self._call("attach", {"group_id": group_id, "path": ".", "by": "user"})
+            self.assertTrue(attach.ok, getattr(attach, "error", None))
+            add, _ = self._call(
+                "actor_add",
+                {
+                    "group_id": group_id,
+                    "actor_id": "peer1",
+                    "title": "Peer 1",
+                    "runtime": "codex",
+                    "runner": "headless",
+                    "by": "user",
+                },
+            )
+            self.assertTrue(add.ok, getattr(add, "error", None))
+            group = load_group(group_id)
+            assert group is not None
+            group.doc["running"] = True
+            group.save()
+
+            # Hold the actor's runtime lane so the enable's start stays queued.
+            release = threading.Event()
+            actor_post_commit.run_actor_runtime_start(group_id, "peer1", lambda: release.wait(timeout=2.0) and None)
+            calls: list[str] = []
+            with patch(
+                "cccc.daemon.actors.actor_update_ops.codex_app_supervisor.start_actor",
+                side_effect=lambda **_kwargs: calls.append("start"),
+            ), patch(
+                "cccc.daemon.actors.actor_update_ops.codex_app_supervisor.stop_actor",
+                side_effect=lambda **_kwargs: calls.append("stop"),
+            ):
+                enable, _ = self._call(
+                    "actor_update",
+                    {"group_id": group_id, "actor_id": "peer1", "by": "user", "patch": {"enabled": True}},
+                )
+                self.assertTrue(enable.ok, getattr(enable, "error", None))
+                self.assertEqual((enable.result or {}).get("start"), "pending")
+
+                disable_result: dict = {}
+                disabler = threading.Thread(
+                    target=lambda: disable_result.update(
+                        resp=self._call(
+                            "actor_update",
+                            {"group_id": group_id, "actor_id": "peer1", "by": "user", "patch": {"enabled": False}},
+                        )[0]
+                    )
+                )
+                disabler.start()
+                # The disable saves enabled=false, then its stop waits behind the queued start.
+                deadline = time.monotonic() + 5.0
+                while time.monotonic() < deadline:
+                    latest = load_group(group_id)
+                    actor = find_actor(latest, "peer1") if latest is not None else None
+                    if isinstance(actor, dict) and actor.get("enabled") is False:
+                        break
+                    time.sleep(0.01)
+                release.set()
+                disabler.join(timeout=5.0)
+                self.assertTrue(actor_post_commit.wait_for_actor_post_commit_lanes_for_tests(timeout=5.0))
+
+            self.assertTrue(disable_result["resp"].ok, getattr(disable_result["resp"], "error", None))
+            self.assertEqual(calls, ["stop"])
+        finally:
+            if old_mode is not None:
+                os.environ["CCCC_ACTOR_POST_COMMIT_MODE"] = old_mode
+            cleanup()
+
+    def test_actor_update_noop_patch_skips_save_and_ledger(self) -> None:
+        _, cleanup = self._with_home()
+        try:
+            create, _ = self._call("group_create", {"title": "actor-update-noop", "topic": "", "by": "user"})
+            self.assertTrue(create.ok, getattr(create, "error", None))
+            group_id = str((create.result or {}).get("group_id") or "").strip()
+
+            add, _ = self._call(
+                "actor_add",
+                {
+                    "group_id": group_id,
+                    "actor_id": "peer1",
+                    "title": "Peer 1",
+                    "runtime": "codex",
+                    "runner": "headless",
+                    "by": "user",
+                },
+            )
+            self.assertTrue(add.ok, getattr(add, "error", None))
+
+            noop, _ = self._call(
+                "actor_update",
+                {"group_id": group_id, "actor_id": "peer1", "by": "user", "patch": {"enabled": True, "title": "Peer 1"}},
+            )
+            self.assertTrue(noop.ok, getattr(noop, "error", None))
+            self.assertTrue((noop.result or {}).get("noop"))
+            self.assertIsNone((noop.result or {}).get("event"))
+
+            changed, _ = self._call(
+                "actor_update",
+                {"group_id": group_id, "actor_id": "peer1", "by": "user", "patch": {"title": "Peer One"}},
+            )
+            self.assertTrue(changed.ok, getattr(changed, "error", None))
+            self.assertFalse((changed.result or {}).get("noop"))
+            self.assertIsInstance((changed.result or {}).get("event"), dict)
+        finally:
+            cleanup()
+
     def test_actor_lifecycle_global_events_use_contract_kinds(self) -> None:
         home, cleanup = self._with_home()
         try:
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from cccc.daemon.actors import actor_post_commit
+
+
+def setup_function() -> None:
+    actor_post_commit.reset_actor_post_commit_lanes_for_tests()
+
+
+def teardown_function() -> None:
+    actor_post_commit.reset_actor_post_commit_lanes_for_tests()
+
+
+def test_actor_post_commit_runs_after_caller_returns(monkeypatch) -> None:
+    monkeypatch.delenv("CCCC_ACTOR_POST_COMMIT_MODE", raising=False)
+    release = threading.Event()
+    ran: list[str] = []
+
+    def task() -> None:
+        assert release.wait(timeout=2.0)
+        ran.append("reset")
+
+    actor_post_commit.run_actor_post_commit("g1", "actor-foreman-reset", task)
+    time.sleep(0.05)
+    assert ran == []
+
+    release.set()
+    assert actor_post_commit.wait_for_actor_post_commit_lanes_for_tests(timeout=2.0)
+    assert ran == ["reset"]
+
+
+def test_actor_post_commit_inline_mode_runs_immediately_and_swallows_errors(monkeypatch) -> None:
+    monkeypatch.setenv("CCCC_ACTOR_POST_COMMIT_MODE", "inline")
+    ran: list[str] = []
+
+    def boom() -> None:
+        ran.append("boom")
+        raise RuntimeError("boom")
+
+    actor_post_commit.run_actor_post_commit("g1", "boom", boom)
+    actor_post_commit.run_actor_post_commit("g1", "ok", lambda: ran.append("ok"))
+
+    assert ran == ["boom", "ok"]
+
+
+def test_actor_runtime_stop_waits_for_queued_start(monkeypatch) -> None:
+    monkeypatch.delenv("CCCC_ACTOR_POST_COMMIT_MODE", raising=False)
+    release = threading.Event()
+    order: list[str] = []
+
+    def start() -> None:
+        assert release.wait(timeout=2.0)
+        order.append("start")
+
+    assert actor_post_commit.run_actor_runtime_start("g1", "peer1", start) is True
+    stopper = threading.Thread(
+        target=lambda: actor_post_commit.run_actor_runtime_stop("g1", "peer1", lambda: order.append("stop"))
+    )
+    stopper.start()
+    time.sleep(0.05)
+    assert order == []
+
+    release.set()
+    stopper.join(timeout=2.0)
+    assert order == ["start", "stop"]
+    assert actor_post_commit.wait_for_actor_post_commit_lanes_for_tests(timeout=2.0)
+
+
+def test_actor_runtime_stop_on_idle_lane_runs_on_caller_and_returns_result(monkeypatch) -> None:
+    monkeypatch.delenv("CCCC_ACTOR_POST_COMMIT_MODE", raising=False)
+    caller = threading.current_thread()
+
+    assert actor_post_commit.run_actor_runtime_stop("g1", "peer1", lambda: threading.current_thread() is caller)
+    assert actor_post_commit.wait_for_actor_post_commit_lanes_for_tests(timeout=2.0)
+
+
+def test_actor_runtime_start_inline_mode_propagates_errors(monkeypatch) -> None:
+    monkeypatch.setenv("CCCC_ACTOR_POST_COMMIT_MODE", "inline")
+
+    def boom() -> None:
+        raise RuntimeError("start failed")
+
+    try:
+        actor_post_commit.run_actor_runtime_start("g1", "peer1", boom)
+    except RuntimeError as e:
+        assert str(e) == "start failed"
+    else:
+        raise AssertionError("inline start error was swallowed")
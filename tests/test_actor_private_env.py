@@ -352,6 +352,112 @@ class TestActorPrivateEnv(unittest.TestCase):
             else:
                 os.environ["CCCC_HOME"] = old_home
 
+    def test_private_env_update_rejects_oversized_payload_before_parsing(self) -> None:
+        from cccc.contracts.v1 import DaemonRequest
+        from cccc.daemon.actors.private_env_ops import PRIVATE_ENV_MAX_KEYS
+        from cccc.daemon.server import handle_request
+        from cccc.kernel.actors import add_actor
+        from cccc.kernel.group import load_group
+
+        old_home = os.environ.get("CCCC_HOME")
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                os.environ["CCCC_HOME"] = td
+
+                create, _ = handle_request(
+                    DaemonRequest.model_validate({"op": "group_create", "args": {"title": "t", "topic": "", "by": "user"}})
+                )
+                self.assertTrue(create.ok, getattr(create, "error", None))
+                group_id = str((create.result or {}).get("group_id") or "").strip()
+                group = load_group(group_id)
+                assert group is not None
+                add_actor(
+                    group,
+                    actor_id="peer1",
+                    title="peer1",
+                    command=[],
+                    env={},
+                    enabled=False,
+                    runner="headless",
+                    runtime="codex",
+                )
+
+                # Invalid key names would fail validation; the cap must short-circuit first.
+                oversized = {f"bad key {i}": "v" for i in range(PRIVATE_ENV_MAX_KEYS + 1)}
+                resp, _ = handle_request(
+                    DaemonRequest.model_validate(
+                        {
+                            "op": "actor_env_private_update",
+                            "args": {"group_id": group_id, "actor_id": "peer1", "by": "user", "set": oversized},
+                        }
+                    )
+                )
+                self.assertFalse(resp.ok)
+                self.assertEqual(getattr(resp.error, "code", ""), "too_many_keys")
+
+                resp, _ = handle_request(
+                    DaemonRequest.model_validate(
+                        {
+                            "op": "actor_env_private_update",
+                            "args": {"group_id": group_id, "actor_id": "peer1", "by": "user", "unset": list(oversized)},
+                        }
+                    )
+                )
+                self.assertFalse(resp.ok)
+                self.assertEqual(getattr(resp.error, "code", ""), "too_many_keys")
+        finally:
+            if old_home is None:
+                os.environ.pop("CCCC_HOME", None)
+            else:
+                os.environ["CCCC_HOME"] = old_home
+
+    def test_private_env_store_keeps_keys_sorted(self) -> None:
+        from cccc.daemon.actors.private_env_ops import load_actor_private_env, update_actor_private_env
+
+        old_home = os.environ.get("CCCC_HOME")
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                os.environ["CCCC_HOME"] = td
+
+                updated = update_actor_private_env(
+                    "g_sorted",
+                    "peer1",
+                    set_vars={"ZETA": "1", "ALPHA": "2", "MID": "3"},
+                    unset_keys=[],
+                    clear=False,
+                )
+                self.assertEqual(list(updated), ["ALPHA", "MID", "ZETA"])
+
+                updated = update_actor_private_env(
+                    "g_sorted",
+                    "peer1",
+                    set_vars={"BETA": "4"},
+                    unset_keys=["MID"],
+                    clear=False,
+                )
+                self.assertEqual(list(updated), ["ALPHA", "BETA", "ZETA"])
+                self.assertEqual(list(load_actor_private_env("g_sorted", "peer1")), ["ALPHA", "BETA", "ZETA"])
+        finally:
+            if old_home is None:
+                os.environ.pop("CCCC_HOME", None)
+            else:
+                os.environ["CCCC_HOME"] = old_home
+
+    def test_bulk_private_env_parsers_match_per_item_rules(self) -> None:
+        from cccc.daemon.actors.private_env_ops import parse_private_env_set, parse_private_env_unset
+
+        self.assertEqual(
+            parse_private_env_set({"A_KEY": "v", " PADDED ": 12, "NUM": 0}),
+            {"A_KEY": "v", "PADDED": "12", "NUM": "0"},
+        )
+        self.assertEqual(parse_private_env_unset(["A_KEY", " PADDED\n"]), ["A_KEY", "PADDED"])
+        with self.assertRaisesRegex(ValueError, "invalid env key"):
+            parse_private_env_set({"BAD-KEY": "v"})
+        with self.assertRaisesRegex(ValueError, "missing env value"):
+            parse_private_env_set({"OK": None})
+        with self.assertRaisesRegex(ValueError, "missing env key"):
+            parse_private_env_unset([""])
+
 
 if __name__ == "__main__":
     unittest.main()
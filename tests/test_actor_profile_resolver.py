@@ -169,3 +169,96 @@ class TestActorProfileResolver(unittest.TestCase):
             )
         finally:
             cleanup()
+
+    def test_missing_profile_lookups_skip_reload_until_store_changes(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_store
+        from cccc.daemon.actors.actor_profile_store import get_actor_profile, upsert_actor_profile
+
+        _, cleanup = self._with_home()
+        try:
+            upsert_actor_profile({"id": "present", "name": "Present", "runtime": "codex", "runner": "headless"})
+            self.assertIsNone(get_actor_profile("absent"))
+            with patch.object(actor_profile_store, "_load_profiles_doc", side_effect=AssertionError("reloaded")):
+                self.assertIsNone(get_actor_profile("absent"))
+
+            upsert_actor_profile({"id": "absent", "name": "Now Present", "runtime": "codex", "runner": "headless"})
+            fetched = get_actor_profile("absent")
+            self.assertIsInstance(fetched, dict)
+            assert isinstance(fetched, dict)
+            self.assertEqual(str(fetched.get("name") or ""), "Now Present")
+        finally:
+            cleanup()
+
+    def test_profile_lookups_reuse_cache_until_store_changes(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_store
+        from cccc.daemon.actors.actor_profile_store import (
+            get_actor_profile,
+            load_actor_profile_secrets,
+            update_actor_profile_secrets,
+            upsert_actor_profile,
+        )
+
+        _, cleanup = self._with_home()
+        try:
+            upsert_actor_profile({"id": "hot", "name": "Hot", "runtime": "codex", "runner": "headless"})
+            update_actor_profile_secrets("hot", set_vars={"TOKEN": "one"}, unset_keys=[], clear=False)
+            self.assertEqual(str((get_actor_profile("hot") or {}).get("name") or ""), "Hot")
+            self.assertEqual(load_actor_profile_secrets("hot"), {"TOKEN": "one"})
+            with patch.object(actor_profile_store, "_load_profiles_doc", side_effect=AssertionError("reloaded")):
+                self.assertEqual(str((get_actor_profile("hot") or {}).get("name") or ""), "Hot")
+
+            upsert_actor_profile({"id": "hot", "name": "Renamed", "runtime": "codex", "runner": "headless"})
+            update_actor_profile_secrets("hot", set_vars={"TOKEN": "two"}, unset_keys=[], clear=False)
+            self.assertEqual(str((get_actor_profile("hot") or {}).get("name") or ""), "Renamed")
+            self.assertEqual(load_actor_profile_secrets("hot"), {"TOKEN": "two"})
+        finally:
+            cleanup()
+
+    def test_profile_secrets_are_stored_in_key_order(self) -> None:
+        from cccc.daemon.actors.actor_profile_store import load_actor_profile_secrets, update_actor_profile_secrets
+
+        _, cleanup = self._with_home()
+        try:
+            updated = update_actor_profile_secrets(
+                "sorted",
+                set_vars={"ZETA": "1", "ALPHA": "2", "MID": "3"},
+                unset_keys=[],
+                clear=False,
+            )
+            self.assertEqual(list(updated), ["ALPHA", "MID", "ZETA"])
+
+            updated = update_actor_profile_secrets("sorted", set_vars={"BETA": "4"}, unset_keys=["MID"], clear=False)
+            self.assertEqual(list(updated), ["ALPHA", "BETA", "ZETA"])
+            self.assertEqual(list(load_actor_profile_secrets("sorted")), ["ALPHA", "BETA", "ZETA"])
+        finally:
+            cleanup()
+
+    def test_masked_profile_secrets_follow_store_updates(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_store
+        from cccc.daemon.actors.actor_profile_store import (
+            delete_actor_profile_secrets,
+            load_actor_profile_secrets_masked,
+            update_actor_profile_secrets,
+        )
+
+        _, cleanup = self._with_home()
+        try:
+            update_actor_profile_secrets("masked", set_vars={"TOKEN": "supersecret"}, unset_keys=[], clear=False)
+            self.assertEqual(load_actor_profile_secrets_masked("masked"), {"TOKEN": "su******et"})
+            with patch.object(actor_profile_store, "load_actor_profile_secrets", side_effect=AssertionError("reloaded")):
+                self.assertEqual(load_actor_profile_secrets_masked("masked"), {"TOKEN": "su******et"})
+
+            update_actor_profile_secrets("masked", set_vars={"A": "x"}, unset_keys=["TOKEN"], clear=False)
+            self.assertEqual(load_actor_profile_secrets_masked("masked"), {"A": "******"})
+
+            path = actor_profile_store._profile_secret_path("masked")
+            delete_actor_profile_secrets("masked")
+            self.assertNotIn(str(path), actor_profile_store._MASKED_SECRETS)
+        finally:
+            cleanup()
@@ -237,6 +237,31 @@ class TestActorProfilesOps(unittest.TestCase):
         finally:
             cleanup()
 
+    def test_profile_secret_update_over_limit_keeps_existing_secrets(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_ops
+
+        _, cleanup = self._with_home()
+        try:
+            pid = str(self._create_profile().get("id") or "")
+            first, _ = self._call("actor_profile_secret_update", {"by": "user", "profile_id": pid, "set": {"A": "1"}})
+            self.assertTrue(first.ok, getattr(first, "error", None))
+
+            with patch.object(actor_profile_ops, "PRIVATE_ENV_MAX_KEYS", 2):
+                over, _ = self._call(
+                    "actor_profile_secret_update",
+                    {"by": "user", "profile_id": pid, "set": {"B": "2", "C": "3"}},
+                )
+            self.assertFalse(over.ok)
+            self.assertEqual(getattr(over.error, "code", ""), "too_many_keys")
+
+            keys, _ = self._call("actor_profile_secret_keys", {"by": "user", "profile_id": pid})
+            self.assertTrue(keys.ok, getattr(keys, "error", None))
+            self.assertEqual((keys.result or {}).get("keys"), ["A"])
+        finally:
+            cleanup()
+
     def test_linked_actor_is_runtime_readonly_and_convert_to_custom(self) -> None:
         _, cleanup = self._with_home()
         try:
@@ -492,6 +517,120 @@ class TestActorProfilesOps(unittest.TestCase):
         finally:
             cleanup()
 
+    def test_profile_usage_map_is_cached_until_group_changes(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_ops
+
+        _, cleanup = self._with_home()
+        try:
+            group_id = self._create_group("ap-usage-cache")
+            profile = self._create_profile("Usage Cache")
+            pid = str(profile.get("id") or "")
+            add, _ = self._call(
+                "actor_add",
+                {
+                    "group_id": group_id,
+                    "actor_id": "peer1",
+                    "runtime": "codex",
+                    "runner": "headless",
+                    "profile_id": pid,
+                    "by": "user",
+                },
+            )
+            self.assertTrue(add.ok, getattr(add, "error", None))
+
+            usage_key = f"global::{pid}"
+            first = actor_profile_ops._profile_usage_map()
+            self.assertEqual([item["actor_id"] for item in first.get(usage_key, [])], ["peer1"])
+            with patch.object(actor_profile_ops, "load_group", side_effect=AssertionError("cache miss")):
+                second = actor_profile_ops._profile_usage_map()
+            self.assertIs(second, first)
+
+            remove, _ = self._call("actor_remove", {"group_id": group_id, "actor_id": "peer1", "by": "user"})
+            self.assertTrue(remove.ok, getattr(remove, "error", None))
+            self.assertEqual(actor_profile_ops._profile_usage_map().get(usage_key, []), [])
+        finally:
+            actor_profile_ops.invalidate_profile_usage_cache()
+            cleanup()
+
+    def test_profile_usage_map_only_reloads_changed_groups(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_ops
+
+        _, cleanup = self._with_home()
+        try:
+            profile = self._create_profile("Usage Incremental")
+            pid = str(profile.get("id") or "")
+            group_ids = [self._create_group("ap-usage-a"), self._create_group("ap-usage-b")]
+            for gid in group_ids:
+                add, _ = self._call(
+                    "actor_add",
+                    {
+                        "group_id": gid,
+                        "actor_id": "peer1",
+                        "runtime": "codex",
+                        "runner": "headless",
+                        "profile_id": pid,
+                        "by": "user",
+                    },
+                )
+                self.assertTrue(add.ok, getattr(add, "error", None))
+
+            usage_key = f"global::{pid}"
+            self.assertEqual(len(actor_profile_ops._profile_usage_map().get(usage_key, [])), 2)
+
+            remove, _ = self._call("actor_remove", {"group_id": group_ids[0], "actor_id": "peer1", "by": "user"})
+            self.assertTrue(remove.ok, getattr(remove, "error", None))
+
+            loaded: list[str] = []
+            real_load_group = actor_profile_ops.load_group
+
+            def _tracking_load_group(group_id: str):
+                loaded.append(group_id)
+                return real_load_group(group_id)
+
+            with patch.object(actor_profile_ops, "load_group", side_effect=_tracking_load_group):
+                usage = actor_profile_ops._profile_usage_map().get(usage_key, [])
+            self.assertEqual(loaded, [group_ids[0]])
+            self.assertEqual([item["group_id"] for item in usage], [group_ids[1]])
+        finally:
+            actor_profile_ops.invalidate_profile_usage_cache()
+            cleanup()
+
+    def test_profile_usage_map_loads_two_stale_groups_serially(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.daemon.actors import actor_profile_ops
+
+        _, cleanup = self._with_home()
+        try:
+            profile = self._create_profile("Usage Serial")
+            pid = str(profile.get("id") or "")
+            group_ids = [self._create_group("ap-serial-a"), self._create_group("ap-serial-b")]
+            for gid in group_ids:
+                add, _ = self._call(
+                    "actor_add",
+                    {
+                        "group_id": gid,
+                        "actor_id": "peer1",
+                        "runtime": "codex",
+                        "runner": "headless",
+                        "profile_id": pid,
+                        "by": "user",
+                    },
+                )
+                self.assertTrue(add.ok, getattr(add, "error", None))
+
+            actor_profile_ops.invalidate_profile_usage_cache()
+            with patch.object(actor_profile_ops, "ThreadPoolExecutor", side_effect=AssertionError("pool used")):
+                usage = actor_profile_ops._profile_usage_map().get(f"global::{pid}", [])
+            self.assertEqual(sorted(item["group_id"] for item in usage), sorted(group_ids))
+        finally:
+            actor_profile_ops.invalidate_profile_usage_cache()
+            cleanup()
+
     def test_actor_add_rejects_invalid_profile_id(self) -> None:
         _, cleanup = self._with_home()
         try:
@@ -1555,7 +1555,7 @@ class TestChatOps(unittest.TestCase):
             )
             self.assertTrue(add.ok, getattr(add, "error", None))
 
-            with patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as send_queue, patch(
+            with patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as send_queue, patch(
                 "cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages"
             ) as send_flush:
                 send_resp, _ = self._call(
@@ -1571,7 +1571,7 @@ class TestChatOps(unittest.TestCase):
             self.assertTrue(send_resp.ok, getattr(send_resp, "error", None))
             send_queue.assert_called_once()
             send_flush.assert_called_once_with(unittest.mock.ANY, actor_id="peer1")
-            send_delivery_text = str(send_queue.call_args.kwargs.get("text") or "")
+            send_delivery_text = str(send_queue.call_args.args[1][0].get("text") or "")
             self.assertIn("[cccc] References:", send_delivery_text)
             self.assertIn("P2 (slot-2) · PDF p.12 — Revenue deck", send_delivery_text)
             self.assertIn('excerpt: "Gross margin note is outdated."', send_delivery_text)
@@ -1584,7 +1584,7 @@ class TestChatOps(unittest.TestCase):
             reply_to = str(send_event.get("id") or "").strip()
             self.assertTrue(reply_to)
 
-            with patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as reply_queue, patch(
+            with patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as reply_queue, patch(
                 "cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages"
             ) as reply_flush, patch("cccc.daemon.messaging.chat_ops.flush_pending_messages") as reply_sync_flush:
                 reply_resp, _ = self._call(
@@ -1602,7 +1602,7 @@ class TestChatOps(unittest.TestCase):
             reply_queue.assert_called_once()
             reply_flush.assert_called_once_with(unittest.mock.ANY, actor_id="peer1")
             reply_sync_flush.assert_not_called()
-            reply_delivery_text = str(reply_queue.call_args.kwargs.get("text") or "")
+            reply_delivery_text = str(reply_queue.call_args.args[1][0].get("text") or "")
             self.assertIn("[cccc] References:", reply_delivery_text)
             self.assertIn("P2 (slot-2) · PDF p.12 — Revenue deck", reply_delivery_text)
             self.assertIn("snapshot: state/blobs/sha256_demo.jpg (1440x900)", reply_delivery_text)
@@ -1750,7 +1750,7 @@ class TestChatOps(unittest.TestCase):
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit,
                 patch("cccc.daemon.messaging.chat_delivery_ops.schedule_headless_post_wake_delivery", return_value=True) as schedule_post_wake,
                 patch("cccc.daemon.messaging.chat_delivery_ops.get_headless_targets_for_message", return_value=["fm1"]),
-                patch("cccc.daemon.messaging.chat_delivery_ops.emit_system_notify") as emit_notify,
+                patch("cccc.daemon.messaging.chat_delivery_ops.emit_system_notifies") as emit_notify,
             ):
                 resp = handle_send(
                     {
@@ -1872,7 +1872,7 @@ class TestChatOps(unittest.TestCase):
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit,
                 patch("cccc.daemon.messaging.chat_delivery_ops.schedule_headless_post_wake_delivery", return_value=True) as schedule_post_wake,
                 patch("cccc.daemon.messaging.chat_delivery_ops.get_headless_targets_for_message", return_value=["peer1"]),
-                patch("cccc.daemon.messaging.chat_delivery_ops.emit_system_notify") as emit_notify,
+                patch("cccc.daemon.messaging.chat_delivery_ops.emit_system_notifies") as emit_notify,
             ):
                 resp = handle_reply(
                     {
@@ -566,7 +566,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
@@ -628,7 +628,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message", return_value=True) as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
@@ -716,7 +716,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message", return_value=True) as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
@@ -832,7 +832,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message", return_value=True) as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
@@ -895,7 +895,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
                 patch("cccc.daemon.messaging.chat_delivery_ops.get_headless_targets_for_message", return_value=[]),
@@ -951,7 +951,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
                 patch("cccc.daemon.messaging.chat_delivery_ops.get_headless_targets_for_message", return_value=[]),
@@ -1057,7 +1057,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message") as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
                 patch("cccc.daemon.messaging.chat_delivery_ops.get_headless_targets_for_message", return_value=[]),
@@ -1149,7 +1149,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message", return_value=True) as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
@@ -1262,7 +1262,7 @@ class TestCodexAppFlow(unittest.TestCase):
             with (
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.actor_running", return_value=True),
                 patch("cccc.daemon.messaging.chat_ops.codex_app_supervisor.submit_user_message", return_value=True) as submit_user_message,
-                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_message") as queue_chat_message,
+                patch("cccc.daemon.messaging.chat_delivery_ops.queue_chat_messages_batch") as queue_chat_message,
                 patch("cccc.daemon.messaging.chat_delivery_ops.request_flush_pending_messages") as request_flush_pending_messages,
                 patch("cccc.daemon.messaging.chat_ops.flush_pending_messages"),
             ):
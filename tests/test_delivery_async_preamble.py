@@ -372,6 +372,27 @@ class TestAsyncFirstDelivery(unittest.TestCase):
                 self.assertNotIn(("g-test", "peer1"), delivery._ASYNC_FLUSH_IN_FLIGHT)
             self.assertTrue(delivery.THROTTLE.has_pending("g-test", "peer1"))
 
+    def test_queue_chat_messages_batch_queues_each_actor_in_order(self) -> None:
+        from cccc.daemon.messaging import delivery
+
+        group = self._group()
+        throttle = delivery.DeliveryThrottle()
+        with patch.object(delivery, "THROTTLE", throttle):
+            delivery.queue_chat_messages_batch(
+                group,
+                [
+                    {"actor_id": "peer1", "event_id": "e1", "by": "user", "to": ["@all"], "text": "one"},
+                    {"actor_id": "peer2", "event_id": "e1", "by": "user", "to": ["@all"], "text": "one"},
+                    {"actor_id": "peer1", "event_id": "e2", "by": "user", "to": ["@all"], "text": "two"},
+                ],
+            )
+
+        peer1 = throttle.take_pending("g-test", "peer1")
+        peer2 = throttle.take_pending("g-test", "peer2")
+        self.assertEqual([msg.event_id for msg in peer1], ["e1", "e2"])
+        self.assertEqual([msg.event_id for msg in peer2], ["e1"])
+        self.assertTrue(all(msg.kind == "chat.message" and msg.ts for msg in peer1 + peer2))
+
 
 if __name__ == "__main__":
     unittest.main()
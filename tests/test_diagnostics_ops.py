@@ -275,6 +275,46 @@ class TestDiagnosticsOps(unittest.TestCase):
         finally:
             cleanup()
 
+    def test_terminal_tail_raw_mode_reads_only_the_requested_window(self) -> None:
+        from unittest.mock import patch
+
+        from cccc.kernel.actors import add_actor
+        from cccc.kernel.group import create_group
+        from cccc.kernel.registry import load_registry
+
+        _, cleanup = self._with_home()
+        try:
+            group = create_group(load_registry(), title="terminal-tail-window")
+            add_actor(group, actor_id="peer1", title="Peer 1", runtime="codex", runner="pty")
+
+            with patch(
+                "cccc.daemon.ops.diagnostics_ops.pty_runner.SUPERVISOR.history_page",
+                return_value={
+                    "data": b"x" * 300,
+                    "start_cursor": 0,
+                    "end_cursor": 300,
+                    "has_more": False,
+                    "cursor_expired": False,
+                },
+            ) as history_page:
+                resp = self._call(
+                    "terminal_tail",
+                    {
+                        "group_id": group.group_id,
+                        "actor_id": "peer1",
+                        "max_chars": 100,
+                        "strip_ansi": False,
+                        "compact": False,
+                    },
+                )[0]
+
+            self.assertTrue(resp.ok, getattr(resp, "error", None))
+            self.assertEqual((resp.result or {}).get("text"), "x" * 100)
+            history_page.assert_called_once()
+            self.assertEqual(history_page.call_args.kwargs.get("limit_bytes"), 100 * 4 + 8192)
+        finally:
+            cleanup()
+
     def test_terminal_tail_returns_last_output_for_stopped_pty_actor(self) -> None:
         from unittest.mock import patch
 
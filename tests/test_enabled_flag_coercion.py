@@ -41,7 +41,7 @@ class TestEnabledFlagCoercion(unittest.TestCase):
         self.assertTrue(resp.ok, getattr(resp, "error", None))
 
     def test_roles_and_recipients_treat_string_false_as_disabled(self) -> None:
-        from cccc.kernel.actors import find_actor, find_foreman, get_effective_role
+        from cccc.kernel.actors import find_actor, find_foreman, get_effective_role, get_effective_roles
         from cccc.kernel.group import load_group
         from cccc.kernel.messaging import disabled_recipient_actor_ids, enabled_recipient_actor_ids
         from cccc.kernel.system_prompt import render_system_prompt
@@ -76,6 +76,7 @@ class TestEnabledFlagCoercion(unittest.TestCase):
                 self.assertEqual(str((foreman or {}).get("id") or ""), "peer1")
                 self.assertEqual(get_effective_role(reloaded, "peer1"), "foreman")
                 self.assertEqual(get_effective_role(reloaded, "peer2"), "peer")
+                self.assertEqual(get_effective_roles(reloaded), {"peer1": "foreman", "peer2": "peer"})
 
                 enabled_ids = enabled_recipient_actor_ids(reloaded, ["@all"])
                 disabled_ids = disabled_recipient_actor_ids(reloaded, ["@all"])
@@ -232,6 +232,46 @@ class TestGroupAutomationBaseline(unittest.TestCase):
             else:
                 os.environ["CCCC_HOME"] = old_home
 
+    def test_automation_state_read_does_not_rewrite_well_formed_doc(self) -> None:
+        from cccc.contracts.v1 import DaemonRequest
+        from cccc.daemon.server import handle_request
+        from cccc.kernel.group import load_group
+
+        old_home = os.environ.get("CCCC_HOME")
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                os.environ["CCCC_HOME"] = td
+
+                create_resp, _ = handle_request(
+                    DaemonRequest.model_validate(
+                        {"op": "group_create", "args": {"title": "baseline", "topic": "", "by": "user"}}
+                    )
+                )
+                self.assertTrue(create_resp.ok, getattr(create_resp, "error", None))
+                group_id = str((create_resp.result or {}).get("group_id") or "").strip()
+                self.assertTrue(group_id)
+
+                state_args = {"op": "group_automation_state", "args": {"group_id": group_id, "by": "user"}}
+                first_resp, _ = handle_request(DaemonRequest.model_validate(state_args))
+                self.assertTrue(first_resp.ok, getattr(first_resp, "error", None))
+
+                group = load_group(group_id)
+                self.assertIsNotNone(group)
+                config_path = group.path / "group.yaml"
+                before = config_path.read_bytes()
+                before_mtime = config_path.stat().st_mtime_ns
+
+                second_resp, _ = handle_request(DaemonRequest.model_validate(state_args))
+                self.assertTrue(second_resp.ok, getattr(second_resp, "error", None))
+                self.assertEqual((second_resp.result or {}).get("version"), (first_resp.result or {}).get("version"))
+                self.assertEqual(config_path.read_bytes(), before)
+                self.assertEqual(config_path.stat().st_mtime_ns, before_mtime)
+        finally:
+            if old_home is None:
+                os.environ.pop("CCCC_HOME", None)
+            else:
+                os.environ["CCCC_HOME"] = old_home
+
 
 if __name__ == "__main__":
     unittest.main()
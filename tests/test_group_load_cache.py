@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+class TestLoadGroupCached(unittest.TestCase):
+    def _with_home(self):
+        old_home = os.environ.get("CCCC_HOME")
+        td_ctx = tempfile.TemporaryDirectory()
+        td = td_ctx.__enter__()
+        os.environ["CCCC_HOME"] = td
+
+        def cleanup() -> None:
+            td_ctx.__exit__(None, None, None)
+            if old_home is None:
+                os.environ.pop("CCCC_HOME", None)
+            else:
+                os.environ["CCCC_HOME"] = old_home
+
+        return td, cleanup
+
+    def test_reuses_parsed_doc_until_group_is_saved(self) -> None:
+        from cccc.kernel import group as group_mod
+        from cccc.kernel.registry import load_registry
+
+        _, cleanup = self._with_home()
+        try:
+            created = group_mod.create_group(load_registry(), title="cached")
+            first = group_mod.load_group_cached(created.group_id)
+            assert first is not None
+            first.doc["title"] = "mutated in memory"
+
+            with patch.object(group_mod, "load_group", wraps=group_mod.load_group) as load_spy:
+                second = group_mod.load_group_cached(created.group_id)
+                load_spy.assert_not_called()
+            assert second is not None
+            self.assertEqual(second.doc.get("title"), "cached")
+
+            second.doc["title"] = "renamed"
+            second.save()
+            third = group_mod.load_group_cached(created.group_id)
+            assert third is not None
+            self.assertEqual(third.doc.get("title"), "renamed")
+        finally:
+            cleanup()
+
+    def test_missing_group_returns_none(self) -> None:
+        from cccc.kernel.group import load_group_cached
+
+        _, cleanup = self._with_home()
+        try:
+            self.assertIsNone(load_group_cached("g_missing"))
+        finally:
+            cleanup()
+
+    def test_deleted_group_is_evicted(self) -> None:
+        from cccc.kernel import group as group_mod
+        from cccc.kernel.registry import load_registry
+
+        _, cleanup = self._with_home()
+        try:
+            reg = load_registry()
+            created = group_mod.create_group(reg, title="evict", publish=False)
+            self.assertIsNotNone(group_mod.load_group_cached(created.group_id))
+            key = str(created.path / "group.yaml")
+            self.assertIn(key, group_mod._GROUP_DOC_CACHE)
+
+            group_mod.delete_group(reg, group_id=created.group_id, publish=False)
+            self.assertNotIn(key, group_mod._GROUP_DOC_CACHE)
+            self.assertIsNone(group_mod.load_group_cached(created.group_id))
+        finally:
+            cleanup()
+
+    def test_cache_keeps_most_recently_used_docs(self) -> None:
+        from cccc.kernel import group as group_mod
+        from cccc.kernel.registry import load_registry
+
+        _, cleanup = self._with_home()
+        try:
+            reg = load_registry()
+            groups = [group_mod.create_group(reg, title=f"lru-{i}", publish=False) for i in range(3)]
+            with patch.object(group_mod, "_GROUP_DOC_CACHE_MAX", 2):
+                group_mod._GROUP_DOC_CACHE.clear()
+                group_mod.load_group_cached(groups[0].group_id)
+                group_mod.load_group_cached(groups[1].group_id)
+                group_mod.load_group_cached(groups[0].group_id)
+                group_mod.load_group_cached(groups[2].group_id)
+                cached = set(group_mod._GROUP_DOC_CACHE)
+            self.assertEqual(
+                cached,
+                {str(groups[0].path / "group.yaml"), str(groups[2].path / "group.yaml")},
+            )
+        finally:
+            cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
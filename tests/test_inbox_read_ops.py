@@ -205,6 +205,54 @@ class TestInboxReadOps(unittest.TestCase):
         finally:
             cleanup()
 
+    def test_resolve_recipient_actor_ids_matches_per_actor_check(self) -> None:
+        from cccc.kernel.actors import add_actor, list_actors
+        from cccc.kernel.group import create_group, load_group
+        from cccc.kernel.inbox import is_message_for_actor, resolve_recipient_actor_ids
+        from cccc.kernel.registry import load_registry
+
+        _, cleanup = self._with_home()
+        try:
+            registry = load_registry()
+            group_id = create_group(registry, title="recipient-set", topic="").group_id
+            group = load_group(group_id)
+            self.assertIsNotNone(group)
+            assert group is not None
+
+            add_actor(group, actor_id="lead", title="Lead", runtime="codex", runner="headless")  # type: ignore[arg-type]
+            add_actor(group, actor_id="peer1", title="Peer 1", runtime="codex", runner="headless")  # type: ignore[arg-type]
+            add_actor(group, actor_id="peer2", title="Peer 2", runtime="codex", runner="headless")  # type: ignore[arg-type]
+            actors = group.doc.get("actors") if isinstance(group.doc.get("actors"), list) else []
+            actors.insert(
+                0,
+                {
+                    "id": "internal-helper",
+                    "title": "Internal Helper",
+                    "internal_kind": "legacy",
+                    "runtime": "codex",
+                    "runner": "headless",
+                    "enabled": True,
+                },
+            )
+            group.save()
+
+            events = [
+                {"kind": "chat.message", "data": {"text": "broadcast"}},
+                {"kind": "chat.message", "data": {"to": ["@all"]}},
+                {"kind": "chat.message", "data": {"to": ["@peers"]}},
+                {"kind": "chat.message", "data": {"to": ["@foreman"]}},
+                {"kind": "chat.message", "data": {"to": ["peer2", "internal-helper"]}},
+                {"kind": "system.notify", "data": {"target_actor_id": ""}},
+                {"kind": "system.notify", "data": {"target_actor_id": "internal-helper"}},
+                {"kind": "system.notify", "data": {"target_actor_id": "peer1"}},
+            ]
+            actor_ids = [str(actor.get("id") or "") for actor in list_actors(group)]
+            for event in events:
+                expected = {aid for aid in actor_ids if is_message_for_actor(group, actor_id=aid, event=event)}
+                self.assertEqual(resolve_recipient_actor_ids(group, event), expected, event)
+        finally:
+            cleanup()
+
     def test_read_cursor_follows_ledger_order_when_timestamps_collide_or_regress(self) -> None:
         from cccc.contracts.v1.event import Event as ContractEvent
         from cccc.kernel.actors import add_actor, list_actors
@@ -0,0 +1,79 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestLedgerAppendEvents(unittest.TestCase):
+    def test_append_events_writes_batch_in_order(self) -> None:
+        from cccc.kernel.ledger import append_event, append_events
+
+        with tempfile.TemporaryDirectory() as td:
+            ledger_path = Path(td) / "ledger.jsonl"
+            first = append_event(
+                ledger_path,
+                kind="chat.ack",
+                group_id="g_batch",
+                scope_key="",
+                by="peer1",
+                data={"actor_id": "peer1", "event_id": "evt_0"},
+            )
+            batch = append_events(
+                ledger_path,
+                [
+                    {
+                        "kind": "chat.ack",
+                        "group_id": "g_batch",
+                        "scope_key": "",
+                        "by": f"peer{idx}",
+                        "data": {"actor_id": f"peer{idx}", "event_id": f"evt_{idx}"},
+                    }
+                    for idx in range(2, 5)
+                ],
+            )
+
+            lines = [json.loads(line) for line in ledger_path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual([ev["id"] for ev in lines], [first["id"]] + [ev["id"] for ev in batch])
+        self.assertEqual([ev["by"] for ev in lines[1:]], ["peer2", "peer3", "peer4"])
+
+    def test_append_events_writes_nothing_when_any_entry_is_invalid(self) -> None:
+        from cccc.kernel.ledger import MAX_EVENT_BYTES, append_events
+
+        with tempfile.TemporaryDirectory() as td:
+            ledger_path = Path(td) / "ledger.jsonl"
+            with self.assertRaises(ValueError):
+                append_events(
+                    ledger_path,
+                    [
+                        {
+                            "kind": "chat.ack",
+                            "group_id": "g_batch",
+                            "scope_key": "",
+                            "by": "peer1",
+                            "data": {"actor_id": "peer1", "event_id": "evt_1"},
+                        },
+                        {
+                            "kind": "test.oversized",
+                            "group_id": "g_batch",
+                            "scope_key": "",
+                            "by": "peer1",
+                            "data": {"blob": "x" * (MAX_EVENT_BYTES + 1)},
+                        },
+                    ],
+                )
+
+            self.assertFalse(ledger_path.exists() and ledger_path.read_text(encoding="utf-8"))
+
+    def test_append_events_with_no_entries_is_a_noop(self) -> None:
+        from cccc.kernel.ledger import append_events
+
+        with tempfile.TemporaryDirectory() as td:
+            ledger_path = Path(td) / "ledger.jsonl"
+            self.assertEqual(append_events(ledger_path, []), [])
+            self.assertFalse(ledger_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,19 @@ class TestPtyHistoryPage(unittest.TestCase):
         self.assertEqual(page["end_cursor"], 6)
         self.assertEqual(page["has_more"], True)
 
+    def test_history_page_slices_across_chunk_boundaries(self) -> None:
+        session = self._session()
+        session._append_backlog(b"ab")
+        session._append_backlog(b"cde")
+        session._append_backlog(b"fghij")
+
+        page = session.history_page(before=7, limit_bytes=5)
+
+        self.assertEqual(page["data"], b"cdefg")
+        self.assertEqual(page["start_cursor"], 2)
+        self.assertEqual(page["end_cursor"], 7)
+        self.assertEqual(page["has_more"], True)
+
     def test_history_page_reports_expired_cursor_after_backlog_drop(self) -> None:
         session = self._session()
         session._append_backlog(b"abcde")
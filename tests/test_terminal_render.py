@@ -58,3 +58,20 @@ class TestScreenControl:
         text = render_transcript(stream, compact=False)
         assert "shell prompt" in text
         assert "vim buffer" not in text
+
+
+class TestPlainTextFastPath:
+    """Output without cursor/erase controls skips the screen buffer but must
+    render exactly as the full path would."""
+
+    def test_sgr_only_output_is_stripped_and_trimmed(self):
+        stream = "\x1b[1;32mready\x1b[0m   \r\n\x1b[mdone\n\n"
+        assert render_transcript(stream, compact=False) == "ready\ndone"
+
+    def test_plain_output_still_compacts_repeated_lines(self):
+        assert render_transcript("same\nsame\nsame\nnext", compact=True) == render_transcript(
+            "same\x1b[K\nsame\nsame\nnext", compact=True
+        )
+
+    def test_carriage_return_still_uses_screen_buffer(self):
+        assert render_transcript("abc\rX", compact=False) == "Xbc"